@@ -3,11 +3,20 @@
 import os
 import logging
 
+import click
 from dotenv import load_dotenv
 from flask import Flask
 from flask_cors import CORS
 
+from migrations import run_migrations, schema_lock
 from models import db
+from services.ai_cache import suggestion_cache
+from services.ai_gateway import gateway as ai_gateway
+from services.cache_service import cache
+from services.event_bus import events
+from services.job_queue import jobs
+from services.json_provider import select_provider
+from services.metrics import metrics
 
 # Load environment variables
 load_dotenv()
@@ -34,9 +43,50 @@ def create_app():
         "pool_recycle": 300,
     }
 
+    # Response cache — "memory" (per process), "redis" (shared) or "none"
+    app.config["CACHE_BACKEND"] = os.getenv("CACHE_BACKEND", "memory")
+    app.config["CACHE_URL"] = os.getenv("CACHE_URL", "")
+    app.config["CACHE_TTL_SECONDS"] = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+
+    # Meeting event bus — "memory" (single process) or "redis" (multi-worker)
+    app.config["EVENT_BUS"] = os.getenv("EVENT_BUS", "memory")
+    app.config["EVENT_BUS_URL"] = os.getenv("EVENT_BUS_URL", os.getenv("CACHE_URL", ""))
+
+    # AI provider — "heuristic" (built-in stubs), "fake" or "package.module:Class"
+    app.config["AI_PROVIDER"] = os.getenv("AI_PROVIDER", "heuristic")
+    app.config["AI_TIMEOUT_SECONDS"] = float(os.getenv("AI_TIMEOUT_SECONDS", "5"))
+    app.config["AI_MAX_CONCURRENCY"] = int(os.getenv("AI_MAX_CONCURRENCY", "4"))
+    app.config["AI_BATCH_WINDOW_MS"] = float(os.getenv("AI_BATCH_WINDOW_MS", "10"))
+    app.config["AI_MAX_BATCH"] = int(os.getenv("AI_MAX_BATCH", "16"))
+    app.config["AI_MAX_PENDING"] = int(os.getenv("AI_MAX_PENDING", "256"))
+
+    # AI suggestion memoization — "memory", "database" (shared table) or "none"
+    app.config["AI_CACHE_BACKEND"] = os.getenv("AI_CACHE_BACKEND", "memory")
+    app.config["AI_CACHE_TTL_SECONDS"] = int(os.getenv("AI_CACHE_TTL_SECONDS", "86400"))
+
+    # Background jobs — "thread" (in-process), "worker" (worker.py) or "manual";
+    # default: thread on SQLite, worker on PostgreSQL
+    app.config["JOB_RUNNER"] = os.getenv("JOB_RUNNER", "")
+    app.config["JOB_THREADS"] = int(os.getenv("JOB_THREADS", "2"))
+
+    # Bulk import: records per transaction / multi-row INSERT
+    app.config["IMPORT_CHUNK_SIZE"] = int(os.getenv("IMPORT_CHUNK_SIZE", "500"))
+
+    # Request metrics: requests slower than this are logged with their SQL
+    app.config["SLOW_REQUEST_MS"] = float(os.getenv("SLOW_REQUEST_MS", "500"))
+
+    # JSON encoder — "orjson" (default when installed) or "stdlib"
+    app.json = select_provider(os.getenv("JSON_ENCODER"))(app)
+
     # Initialize extensions
     CORS(app, supports_credentials=True)
     db.init_app(app)
+    cache.init_app(app)
+    events.init_app(app)
+    ai_gateway.init_app(app)
+    suggestion_cache.init_app(app)
+    jobs.init_app(app)
+    metrics.init_app(app)
 
     # Register blueprints
     from routes.meeting_routes import meetings_bp
@@ -45,6 +95,12 @@ def create_app():
     from routes.review_routes import reviews_bp
     from routes.dashboard_routes import dashboard_bp
     from routes.ai_routes import ai_bp
+    from routes.event_routes import events_bp
+    from routes.job_routes import jobs_bp
+    from routes.export_routes import export_bp
+    from routes.import_routes import import_bp
+    from routes.metrics_routes import metrics_bp
+    from routes.search_routes import search_bp
 
     app.register_blueprint(meetings_bp)
     app.register_blueprint(agenda_bp)
@@ -52,16 +108,68 @@ def create_app():
     app.register_blueprint(reviews_bp)
     app.register_blueprint(dashboard_bp)
     app.register_blueprint(ai_bp)
+    app.register_blueprint(events_bp)
+    app.register_blueprint(jobs_bp)
+    app.register_blueprint(export_bp)
+    app.register_blueprint(import_bp)
+    app.register_blueprint(metrics_bp)
+    app.register_blueprint(search_bp)
 
     # Health check
     @app.route("/api/health")
     def health():
         return {"status": "ok", "service": "ClarityMeet"}
 
-    # Create tables
+    @app.route("/api/cache/stats")
+    def cache_stats():
+        return cache.stats()
+
+    # Create tables, then bring existing ones forward
     with app.app_context():
-        db.create_all()
-        logger.info("Database tables created / verified.")
+        with schema_lock(db.engine):
+            db.create_all()
+            logger.info("Database tables created / verified.")
+            applied = run_migrations(db.engine)
+        if applied:
+            logger.info("Applied migrations: %s", applied)
+        if jobs.runner == "thread":
+            from services.job_handlers import schedule_overdue_sweep
+
+            schedule_overdue_sweep()
+
+    @app.cli.command("migrate")
+    def migrate():
+        """Apply pending schema migrations."""
+        with schema_lock(db.engine):
+            applied = run_migrations(db.engine)
+        click.echo(f"Applied migrations: {applied or 'none'}")
+
+    @app.cli.command("import")
+    @click.argument("source", type=click.File("r", encoding="utf-8"))
+    @click.option("--format", "fmt", type=click.Choice(["ndjson", "csv"]), default=None)
+    @click.option("--historical", is_flag=True, help="Relax the live-only rules.")
+    @click.option("--chunk-size", type=int, default=None)
+    def import_command(source, fmt, historical, chunk_size):
+        """Bulk-import meetings and their items from SOURCE ('-' for stdin)."""
+        from services import import_service
+
+        if fmt is None:
+            fmt = "csv" if source.name.endswith(".csv") else "ndjson"
+        try:
+            report = import_service.import_records(
+                import_service.parse(source, fmt),
+                mode="historical" if historical else "live",
+                chunk_size=chunk_size or app.config["IMPORT_CHUNK_SIZE"],
+            )
+        except ValueError as e:
+            raise click.UsageError(str(e))
+        for error in report["errors"]:
+            click.echo(f"line {error['line']}: {error['error']}", err=True)
+        click.echo(
+            f"{report['rows']} rows in {report['seconds']}s "
+            f"({report['rows_per_second']} rows/s): imported {report['imported']}, "
+            f"{report['failed']} rejected"
+        )
 
     return app
 
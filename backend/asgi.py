@@ -0,0 +1,328 @@
+"""ASGI entrypoint — concurrent serving mode for I/O-bound endpoints.
+
+    uvicorn asgi:app --port 7777
+
+The AI suggestion routes (plain and ``:stream``) and the meeting event
+stream are served natively on the event loop, so a slow model call or an
+idle SSE watcher costs a coroutine instead of a worker thread. Every other request is handed to the
+regular Flask app (same routes, same service-layer rules) on a bounded
+thread pool. See ``bench/README.md`` for the WSGI vs ASGI comparison.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from app import app as flask_app
+from services import ai_service, async_db
+from services.event_bus import events
+
+logger = logging.getLogger(__name__)
+
+KEEPALIVE_SECONDS = 15
+WSGI_THREADS = int(os.getenv("ASGI_WSGI_THREADS", "32"))
+
+
+# ─── Helpers ────────────────────────────────────────────
+
+
+async def read_body(receive) -> bytes:
+    body = bytearray()
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        body.extend(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    return bytes(body)
+
+
+def _cors_headers(scope) -> list:
+    """Mirror Flask-CORS (all origins, credentials allowed) for native routes."""
+    for name, value in scope.get("headers", []):
+        if name == b"origin":
+            return [
+                (b"access-control-allow-origin", value),
+                (b"access-control-allow-credentials", b"true"),
+                (b"vary", b"Origin"),
+            ]
+    return []
+
+
+async def send_json(scope, send, payload, status: int = 200) -> None:
+    body = json.dumps(payload).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                *_cors_headers(scope),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+# ─── Native async routes ────────────────────────────────
+
+
+async def suggest_agenda(scope, receive, send, data):
+    suggestions = await ai_service.suggest_agenda_topics_async(
+        title=data.get("title", ""),
+        context=data.get("context", ""),
+    )
+    await send_json(scope, send, {"suggestions": suggestions})
+
+
+async def suggest_actions(scope, receive, send, data):
+    suggestions = await ai_service.suggest_action_items_async(
+        meeting_title=data.get("title", ""),
+        agenda_topics=data.get("agenda_topics", []),
+    )
+    await send_json(scope, send, {"suggestions": suggestions})
+
+
+async def summarize_review(scope, receive, send, data):
+    summary = await ai_service.summarize_review_async(
+        meeting_title=data.get("title", ""),
+        action_items=data.get("action_items", []),
+    )
+    await send_json(scope, send, summary)
+
+
+async def send_ndjson(scope, send, events) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/x-ndjson"),
+                (b"cache-control", b"no-cache"),
+                (b"x-accel-buffering", b"no"),
+                *_cors_headers(scope),
+            ],
+        }
+    )
+    try:
+        async for event in events:
+            line = (json.dumps(event) + "\n").encode()
+            await send({"type": "http.response.body", "body": line, "more_body": True})
+    finally:
+        await events.aclose()
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def stream_agenda(scope, receive, send, data):
+    events = ai_service.stream_agenda_topics_async(
+        title=data.get("title", ""),
+        context=data.get("context", ""),
+    )
+    await send_ndjson(scope, send, events)
+
+
+async def stream_actions(scope, receive, send, data):
+    events = ai_service.stream_action_items_async(
+        meeting_title=data.get("title", ""),
+        agenda_topics=data.get("agenda_topics", []),
+    )
+    await send_ndjson(scope, send, events)
+
+
+async def stream_summary(scope, receive, send, data):
+    events = ai_service.stream_review_summary_async(
+        meeting_title=data.get("title", ""),
+        action_items=data.get("action_items", []),
+    )
+    await send_ndjson(scope, send, events)
+
+
+async def _wait_for_disconnect(receive) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def stream_meeting_events(scope, receive, send, meeting_id):
+    from routes.event_routes import format_sse
+
+    try:
+        await async_db.get_meeting_version(meeting_id)
+    except LookupError as e:
+        await send_json(scope, send, {"error": str(e)}, status=404)
+        return
+
+    subscription = await events.subscribe_async(meeting_id)
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+    try:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/event-stream; charset=utf-8"),
+                    (b"cache-control", b"no-cache"),
+                    (b"x-accel-buffering", b"no"),
+                    *_cors_headers(scope),
+                ],
+            }
+        )
+        ready = json.dumps({"meeting_id": meeting_id})
+        chunk = f"retry: 3000\nevent: ready\ndata: {ready}\n\n"
+        while True:
+            await send({"type": "http.response.body", "body": chunk.encode(), "more_body": True})
+            getter = asyncio.ensure_future(subscription.get(KEEPALIVE_SECONDS))
+            await asyncio.wait({getter, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected.done():
+                getter.cancel()
+                break
+            event = getter.result()
+            chunk = ": keepalive\n\n" if event is None else format_sse(event)
+    finally:
+        disconnected.cancel()
+        await subscription.aclose()
+
+
+JSON_ROUTES = {
+    "/api/ai/suggest-agenda": suggest_agenda,
+    "/api/ai/suggest-actions": suggest_actions,
+    "/api/ai/summarize-review": summarize_review,
+    "/api/ai/suggest-agenda:stream": stream_agenda,
+    "/api/ai/suggest-actions:stream": stream_actions,
+    "/api/ai/summarize-review:stream": stream_summary,
+}
+EVENTS_ROUTE = re.compile(r"^/api/meetings/(\d+)/events$")
+
+
+# ─── WSGI bridge ────────────────────────────────────────
+
+
+class WSGIBridge:
+    """Run a WSGI app on a thread pool, streaming its body back to ASGI."""
+
+    def __init__(self, wsgi_app, max_workers: int = WSGI_THREADS):
+        self.wsgi_app = wsgi_app
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="wsgi")
+
+    @staticmethod
+    def build_environ(scope, body: bytes) -> dict:
+        from io import BytesIO
+
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": scope.get("root_path", ""),
+            "PATH_INFO": scope["path"],
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin1"),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "SERVER_NAME": (scope.get("server") or ("localhost", 80))[0],
+            "SERVER_PORT": str((scope.get("server") or ("localhost", 80))[1]),
+            "REMOTE_ADDR": (scope.get("client") or ("", 0))[0],
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False,
+        }
+        for name, value in scope.get("headers", []):
+            key = name.decode("latin1").upper().replace("-", "_")
+            if key not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+                key = "HTTP_" + key
+            value = value.decode("latin1")
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+        # The body has been read in full, so its length is known
+        environ["CONTENT_LENGTH"] = str(len(body))
+        return environ
+
+    async def __call__(self, scope, receive, send):
+        environ = self.build_environ(scope, await read_body(receive))
+        loop = asyncio.get_running_loop()
+        started = {}
+
+        def start_response(status, headers, exc_info=None):
+            started["status"] = int(status.split(" ", 1)[0])
+            started["headers"] = [
+                (k.lower().encode("latin1"), v.encode("latin1")) for k, v in headers
+            ]
+
+        def emit(message):
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        def run():
+            result = self.wsgi_app(environ, start_response)
+            try:
+                first = True
+                for chunk in result:
+                    if first:
+                        emit({"type": "http.response.start", **started})
+                        first = False
+                    if chunk:
+                        emit({"type": "http.response.body", "body": chunk, "more_body": True})
+                if first:
+                    emit({"type": "http.response.start", **started})
+                emit({"type": "http.response.body", "body": b""})
+            finally:
+                if hasattr(result, "close"):
+                    result.close()
+
+        await loop.run_in_executor(self.executor, run)
+
+
+# ─── Application ────────────────────────────────────────
+
+
+class ClarityMeetASGI:
+    def __init__(self, wsgi_app):
+        self.flask_app = wsgi_app
+        self.wsgi = WSGIBridge(wsgi_app)
+        self._db_ready = False
+
+    def _init_db(self) -> None:
+        if not self._db_ready:
+            async_db.init_async_db(self.flask_app)
+            self._db_ready = True
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self._init_db()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await async_db.dispose_async_db()
+                self._db_ready = False
+                self.wsgi.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+
+        self._init_db()
+        path, method = scope["path"], scope["method"]
+        if method == "POST" and path in JSON_ROUTES:
+            try:
+                data = json.loads(await read_body(receive) or b"{}")
+            except ValueError:
+                await send_json(scope, send, {"error": "Invalid JSON body."}, status=400)
+                return
+            await JSON_ROUTES[path](scope, receive, send, data if isinstance(data, dict) else {})
+            return
+
+        match = EVENTS_ROUTE.match(path)
+        if method == "GET" and match:
+            await stream_meeting_events(scope, receive, send, int(match.group(1)))
+            return
+
+        await self.wsgi(scope, receive, send)
+
+
+app = ClarityMeetASGI(flask_app)
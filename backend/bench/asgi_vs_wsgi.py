@@ -0,0 +1,155 @@
+"""Concurrent-request throughput: WSGI (thread pool) vs ASGI (uvicorn).
+
+Both servers run in this process against a throwaway SQLite file. Model
+latency is simulated by patching ``ai_service`` (``time.sleep`` on the sync
+path, ``asyncio.sleep`` on the async path), so the numbers isolate how each
+serving mode copes with slow I/O-bound calls.
+
+    cd backend
+    python bench/asgi_vs_wsgi.py --requests 400 --concurrency 100 --latency-ms 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(
+    tempfile.mkdtemp(), "bench.db"
+)
+
+import uvicorn  # noqa: E402
+from werkzeug.serving import BaseWSGIServer  # noqa: E402
+
+from asgi import app as asgi_app  # noqa: E402
+from app import app as flask_app  # noqa: E402
+from services import ai_service  # noqa: E402
+
+BODY = b'{"title": "Sprint Planning"}'
+
+
+def patch_latency(seconds: float) -> None:
+    sync_impl = ai_service.suggest_agenda_topics
+
+    def slow(title, context=""):
+        time.sleep(seconds)
+        return sync_impl(title, context)
+
+    async def slow_async(title, context=""):
+        await asyncio.sleep(seconds)
+        return sync_impl(title, context)
+
+    ai_service.suggest_agenda_topics = slow
+    ai_service.suggest_agenda_topics_async = slow_async
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """Werkzeug server with a fixed worker pool, like gunicorn --threads N."""
+
+    def __init__(self, host, port, app, threads):
+        super().__init__(host, port, app)
+        self.pool = ThreadPoolExecutor(threads)
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+def start_wsgi(port, threads):
+    server = PooledWSGIServer("127.0.0.1", port, flask_app, threads)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.shutdown
+
+
+def start_asgi(port):
+    server = uvicorn.Server(
+        uvicorn.Config(asgi_app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    def stop():
+        server.should_exit = True
+
+    return stop
+
+
+async def one_request(port, path) -> float:
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        b"POST " + path.encode() + b" HTTP/1.1\r\nHost: bench\r\n"
+        b"Content-Type: application/json\r\nConnection: close\r\n"
+        b"Content-Length: " + str(len(BODY)).encode() + b"\r\n\r\n" + BODY
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    if response[9:12] != b"200":
+        raise RuntimeError(response[:200])
+    return time.perf_counter() - started
+
+
+async def load(port, path, total, concurrency):
+    gate = asyncio.Semaphore(concurrency)
+
+    async def bounded():
+        async with gate:
+            return await one_request(port, path)
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(bounded() for _ in range(total)))
+    return time.perf_counter() - started, sorted(latencies)
+
+
+def report(name, elapsed, latencies):
+    q = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<28} {len(latencies) / elapsed:8.1f} req/s   "
+        f"p50 {q[49] * 1000:7.1f} ms   p95 {q[94] * 1000:7.1f} ms   "
+        f"p99 {q[98] * 1000:7.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency-ms", type=int, default=200)
+    parser.add_argument("--wsgi-threads", type=int, default=8)
+    args = parser.parse_args()
+
+    patch_latency(args.latency_ms / 1000)
+    path = "/api/ai/suggest-agenda"
+    print(
+        f"{args.requests} x POST {path}, concurrency {args.concurrency}, "
+        f"simulated model latency {args.latency_ms} ms"
+    )
+
+    stop = start_wsgi(18001, args.wsgi_threads)
+    report(f"WSGI ({args.wsgi_threads} threads)", *asyncio.run(
+        load(18001, path, args.requests, args.concurrency)
+    ))
+    stop()
+
+    stop = start_asgi(18002)
+    report("ASGI (uvicorn, 1 process)", *asyncio.run(
+        load(18002, path, args.requests, args.concurrency)
+    ))
+    stop()
+
+
+if __name__ == "__main__":
+    main()
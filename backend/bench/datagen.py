@@ -0,0 +1,193 @@
+"""Synthetic ClarityMeet data for benchmarks.
+
+``seed(meetings, agenda, actions, seed)`` bulk-inserts ``meetings`` meetings
+with ``agenda`` agenda items and ``actions`` action items each, shaped like
+a real installation rather than a uniform grid:
+
+- statuses follow the lifecycle: most meetings are in the past and Closed or
+  Reviewed, a few are InProgress, the rest are Scheduled in the future
+- deadlines are skewed: days after the meeting drawn from an exponential
+  distribution (mean a week), so old meetings leave a long tail of overdue
+  open items
+- owners are Zipf-like: a handful of people own most of the action items
+- items of Reviewed meetings are mostly Completed; Reviewed meetings carry a
+  review (ratings below 3 need follow-up, as the API enforces)
+
+Rows go in through multi-row INSERTs and leave ``allocated_minutes`` and
+``version`` as the service layer would. The same ``seed`` value gives the
+same data.
+
+    cd backend
+    python bench/datagen.py --database sqlite:///bench.db --meetings 10000
+"""
+
+import argparse
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta, timezone
+
+STATUS_WEIGHTS = {"Scheduled": 25, "InProgress": 5, "Closed": 25, "Reviewed": 45}
+DURATIONS = (15, 30, 45, 60, 90)
+OWNERS = 200
+HISTORY_DAYS = 365
+BATCH = 1000
+
+TOPICS = (
+    "Roadmap review",
+    "Q3 migration plan",
+    "Incident follow-up",
+    "Hiring pipeline",
+    "Budget check-in",
+    "Release readiness",
+    "Customer feedback",
+    "Security audit",
+)
+
+OWNER_NAMES = [f"Owner {k}" for k in range(1, OWNERS + 1)]
+OWNER_WEIGHTS = [1 / k for k in range(1, OWNERS + 1)]  # Zipf: P(k) ~ 1/k
+
+
+def _owner(rng) -> str:
+    return rng.choices(OWNER_NAMES, OWNER_WEIGHTS)[0]
+
+
+def generate(meetings: int, agenda: int, actions: int, seed: int = 1):
+    """Yield ``(meeting, agenda_items, action_items, review)`` dicts; child
+    rows have no ``meeting_id`` yet."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    today = date.today()
+    statuses = list(STATUS_WEIGHTS)
+    weights = list(STATUS_WEIGHTS.values())
+
+    for i in range(meetings):
+        status = rng.choices(statuses, weights)[0]
+        if status == "Scheduled":
+            scheduled = now + timedelta(minutes=rng.randrange(60, 60 * 24 * 60))
+        elif status == "InProgress":
+            scheduled = now - timedelta(minutes=rng.randrange(0, 60))
+        else:
+            scheduled = now - timedelta(minutes=rng.randrange(60, 60 * 24 * HISTORY_DAYS))
+        duration = rng.choice(DURATIONS)
+        slot = max(1, duration // max(agenda, 1))
+        closed = status in ("Closed", "Reviewed")
+
+        agenda_rows = [
+            {
+                "topic": f"{rng.choice(TOPICS)} #{n + 1}",
+                "time_allocation": slot,
+                "created_at": scheduled,
+            }
+            for n in range(agenda if slot * agenda <= duration else 0)
+        ]
+        action_rows = []
+        for n in range(actions if status != "Scheduled" else rng.randrange(actions + 1)):
+            deadline = scheduled.date() + timedelta(days=1 + int(rng.expovariate(1 / 7)))
+            done = (status == "Reviewed" and rng.random() < 0.7) or (
+                closed and deadline < today and rng.random() < 0.4
+            )
+            action_rows.append(
+                {
+                    "description": f"Follow up on item {n + 1} of meeting {i + 1}",
+                    "owner": _owner(rng),
+                    "deadline": deadline,
+                    "status": "Completed" if done else "Open",
+                    "created_at": scheduled,
+                }
+            )
+        if closed and not action_rows:
+            action_rows.append(
+                {
+                    "description": f"Share notes of meeting {i + 1}",
+                    "owner": _owner(rng),
+                    "deadline": scheduled.date() + timedelta(days=2),
+                    "status": "Open",
+                    "created_at": scheduled,
+                }
+            )
+        review = None
+        if status == "Reviewed":
+            rating = rng.choices((1, 2, 3, 4, 5), (5, 10, 25, 35, 25))[0]
+            review = {
+                "summary": f"Outcome of meeting {i + 1}",
+                "outcome_rating": rating,
+                "followup_required": rating < 3 or rng.random() < 0.2,
+                "created_at": scheduled + timedelta(minutes=duration),
+            }
+        end = scheduled + timedelta(minutes=duration)
+        meeting = {
+            "title": f"{rng.choice(TOPICS)} {i + 1}",
+            "scheduled_time": scheduled,
+            "duration_minutes": duration,
+            "status": status,
+            "created_at": scheduled - timedelta(days=rng.randrange(1, 14)),
+            "closed_at": end if closed else None,
+            "updated_at": end if closed else scheduled,
+            "allocated_minutes": sum(a["time_allocation"] for a in agenda_rows),
+            # one bump per agenda item / action item / transition, like the API
+            "version": 1 + len(agenda_rows) + len(action_rows)
+            + {"Scheduled": 0, "InProgress": 1, "Closed": 2, "Reviewed": 3}[status],
+        }
+        yield meeting, agenda_rows, action_rows, review
+
+
+def seed(meetings: int, agenda: int = 4, actions: int = 3, seed: int = 1) -> dict:
+    """Insert the generated data; return row counts per table."""
+    from sqlalchemy import insert
+
+    from models import ActionItem, AgendaItem, Meeting, Review, db
+
+    counts = {"meetings": 0, "agenda_items": 0, "action_items": 0, "reviews": 0}
+    rows = generate(meetings, agenda, actions, seed)
+    while True:
+        batch = [row for _, row in zip(range(BATCH), rows)]
+        if not batch:
+            break
+        ids = db.session.scalars(
+            insert(Meeting).returning(Meeting.id, sort_by_parameter_order=True),
+            [meeting for meeting, _, _, _ in batch],
+        ).all()
+        children = {AgendaItem: [], ActionItem: [], Review: []}
+        for meeting_id, (_, agenda_rows, action_rows, review) in zip(ids, batch):
+            for row in agenda_rows:
+                children[AgendaItem].append({**row, "meeting_id": meeting_id})
+            for row in action_rows:
+                children[ActionItem].append(
+                    {**row, "meeting_id": meeting_id, "updated_at": row["created_at"]}
+                )
+            if review:
+                children[Review].append(
+                    {**review, "meeting_id": meeting_id, "updated_at": review["created_at"]}
+                )
+        for model, items in children.items():
+            if items:
+                db.session.execute(insert(model), items)
+        db.session.commit()
+        counts["meetings"] += len(ids)
+        counts["agenda_items"] += len(children[AgendaItem])
+        counts["action_items"] += len(children[ActionItem])
+        counts["reviews"] += len(children[Review])
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", required=True, help="SQLAlchemy URL to seed")
+    parser.add_argument("--meetings", type=int, default=10000)
+    parser.add_argument("--agenda", type=int, default=4, help="agenda items per meeting")
+    parser.add_argument("--actions", type=int, default=3, help="action items per meeting")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    os.environ["DATABASE_URL"] = args.database
+    os.environ.setdefault("JOB_RUNNER", "manual")
+    from app import app
+
+    with app.app_context():
+        print(seed(args.meetings, args.agenda, args.actions, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""Load test of the meeting lifecycle API: latency, throughput and SQL counts.
+
+Seeds the database with ``datagen.seed`` (skewed, ``--seed``-reproducible
+data), then runs scripted workloads through the Flask app on
+``--concurrency`` threads:
+
+- ``lifecycle``: create → agenda ×3 → start → actions ×2 → close → review
+- ``dashboard``: ``GET /api/dashboard`` plus the overdue page, then the same
+  poll revalidated with ``If-None-Match`` (what a browser tab does)
+- ``browse``: three pages of ``GET /api/meetings``, a status-filtered list
+  and one meeting's detail
+
+Every request is timed and its SQL statements counted; the report gives
+p50/p95/p99 latency and mean/max statements per step and throughput per
+workload. ``--json`` saves the report; ``--baseline`` compares against a
+saved one and exits 1 if a step's statement count grew or its p95 grew by
+more than ``--tolerance``. Requests go through the WSGI app in process
+(``app.test_client``), so the numbers cover routing, services, SQL and
+serialization but not the HTTP server.
+
+    cd backend
+    python bench/load.py --meetings 10000 --iterations 200 --concurrency 4
+    python bench/load.py --database postgresql://localhost/claritymeet_bench --reset
+
+The response cache is off by default (``--cache memory`` to enable it) so
+that repeated reads measure the service layer rather than cache hits.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+WORKLOADS = ("lifecycle", "dashboard", "browse")
+
+
+class Recorder:
+    """Latency and SQL statement count per step, across threads."""
+
+    def __init__(self):
+        self.samples = defaultdict(list)  # step -> [(seconds, statements)]
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def on_statement(self, *_):
+        self._local.statements = getattr(self._local, "statements", 0) + 1
+
+    def call(self, client, step, method, path, expect=(200,), **kwargs):
+        self._local.statements = 0
+        started = time.perf_counter()
+        res = client.open(path, method=method, **kwargs)
+        elapsed = time.perf_counter() - started
+        if res.status_code not in expect:
+            raise RuntimeError(f"{step}: {method} {path} -> {res.status_code} {res.data[:200]}")
+        with self._lock:
+            self.samples[step].append((elapsed, self._local.statements))
+        return res
+
+
+# ─── Workloads ──────────────────────────────────────────
+
+
+def lifecycle(rec, client, i):
+    now = datetime.now(timezone.utc)
+    res = rec.call(
+        client,
+        "create",
+        "POST",
+        "/api/meetings",
+        expect=(201,),
+        json={
+            "title": f"Load test {i}",
+            "scheduled_time": (now + timedelta(hours=1)).isoformat(),
+            "duration_minutes": 60,
+        },
+    )
+    meeting_id = res.get_json()["id"]
+    base = f"/api/meetings/{meeting_id}"
+    for n in range(3):
+        rec.call(
+            client,
+            "agenda",
+            "POST",
+            f"{base}/agenda",
+            expect=(201,),
+            json={"topic": f"Topic {n}", "time_allocation": 15},
+        )
+    rec.call(client, "start", "PATCH", f"{base}/start")
+    for n in range(2):
+        rec.call(
+            client,
+            "action",
+            "POST",
+            f"{base}/actions",
+            expect=(201,),
+            json={
+                "description": f"Task {n}",
+                "owner": f"Owner {n + 1}",
+                "deadline": (date.today() + timedelta(days=7)).isoformat(),
+            },
+        )
+    rec.call(client, "close", "PATCH", f"{base}/close")
+    rec.call(
+        client,
+        "review",
+        "POST",
+        f"{base}/review",
+        expect=(201,),
+        json={"summary": "Done", "outcome_rating": 4, "followup_required": False},
+    )
+
+
+def dashboard(rec, client, i):
+    res = rec.call(client, "dashboard", "GET", "/api/dashboard")
+    rec.call(client, "overdue page", "GET", "/api/dashboard/action-items?overdue=true")
+    rec.call(
+        client,
+        "dashboard (revalidate)",
+        "GET",
+        "/api/dashboard",
+        expect=(200, 304),
+        headers={"If-None-Match": res.headers["ETag"]},
+    )
+
+
+def browse(rec, client, i):
+    cursor, first = None, None
+    for _ in range(3):
+        query = "/api/meetings?limit=20" + (f"&cursor={cursor}" if cursor else "")
+        page = rec.call(client, "list page", "GET", query).get_json()
+        first = first or page["meetings"]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    status = ("Scheduled", "Closed", "Reviewed")[i % 3]
+    rec.call(client, "list by status", "GET", f"/api/meetings?status={status}&limit=20")
+    if first:
+        meeting = first[i % len(first)]
+        rec.call(client, "detail", "GET", f"/api/meetings/{meeting['id']}")
+
+
+# ─── Reporting ──────────────────────────────────────────
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+def summarize(samples, elapsed, iterations):
+    steps = {}
+    for step, rows in samples.items():
+        latencies = [s * 1000 for s, _ in rows]
+        statements = [n for _, n in rows]
+        steps[step] = {
+            "requests": len(rows),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "queries_mean": round(statistics.fmean(statements), 2),
+            "queries_max": max(statements),
+        }
+    requests = sum(s["requests"] for s in steps.values())
+    return {
+        "iterations": iterations,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(requests / elapsed, 1),
+        "iterations_per_second": round(iterations / elapsed, 1),
+        "steps": steps,
+    }
+
+
+def print_report(name, result):
+    print(
+        f"\n{name}: {result['iterations']} iterations in {result['seconds']} s — "
+        f"{result['requests_per_second']} req/s, "
+        f"{result['iterations_per_second']} iterations/s"
+    )
+    print(f"  {'step':<24}{'n':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'SQL':>7}{'max':>5}")
+    for step, s in result["steps"].items():
+        print(
+            f"  {step:<24}{s['requests']:>6}{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}"
+            f"{s['p99_ms']:>9.1f}{s['queries_mean']:>7.1f}{s['queries_max']:>5}"
+        )
+
+
+def compare(report, baseline, tolerance):
+    """Regressions of ``report`` against ``baseline`` (list of messages)."""
+    problems = []
+    for name, result in report["workloads"].items():
+        old = baseline.get("workloads", {}).get(name, {}).get("steps", {})
+        for step, now in result["steps"].items():
+            before = old.get(step)
+            if before is None:
+                continue
+            if now["queries_max"] > before["queries_max"]:
+                problems.append(
+                    f"{name}/{step}: {now['queries_max']} statements "
+                    f"(baseline {before['queries_max']})"
+                )
+            if now["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+                problems.append(
+                    f"{name}/{step}: p95 {now['p95_ms']} ms (baseline {before['p95_ms']} ms)"
+                )
+    return problems
+
+
+def run(app, workload, iterations, concurrency):
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    rec = Recorder()
+    fn = globals()[workload]
+    local = threading.local()
+
+    def one(i):
+        if not hasattr(local, "client"):
+            local.client = app.test_client()
+        fn(rec, local.client, i)
+
+    event.listen(Engine, "before_cursor_execute", rec.on_statement)
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as pool:
+            list(pool.map(one, range(iterations)))
+        elapsed = time.perf_counter() - started
+    finally:
+        event.remove(Engine, "before_cursor_execute", rec.on_statement)
+    return summarize(rec.samples, elapsed, iterations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", help="SQLAlchemy URL (default: a new SQLite file)")
+    parser.add_argument("--reset", action="store_true", help="drop and recreate all tables first")
+    parser.add_argument("--meetings", type=int, default=10000)
+    parser.add_argument("--agenda", type=int, default=4, help="agenda items per meeting")
+    parser.add_argument("--actions", type=int, default=3, help="action items per meeting")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workload", choices=WORKLOADS, action="append")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--cache", choices=("none", "memory"), default="none")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--baseline", help="compare against a saved --json report")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95 growth")
+    args = parser.parse_args()
+
+    os.environ["DATABASE_URL"] = args.database or "sqlite:///" + os.path.join(
+        tempfile.mkdtemp(), "bench.db"
+    )
+    os.environ["CACHE_BACKEND"] = args.cache
+    os.environ.setdefault("JOB_RUNNER", "manual")
+
+    import logging
+
+    from app import app
+    from datagen import seed
+    from models import db
+
+    logging.getLogger().setLevel(logging.WARNING)
+    with app.app_context():
+        if args.reset:
+            db.drop_all()
+            db.create_all()
+        started = time.perf_counter()
+        counts = seed(args.meetings, args.agenda, args.actions, args.seed)
+        dialect = db.engine.dialect.name
+        print(f"{dialect}: seeded {counts} in {time.perf_counter() - started:.1f} s")
+
+    report = {
+        "database": dialect,
+        "meetings": args.meetings,
+        "concurrency": args.concurrency,
+        "workloads": {},
+    }
+    for workload in args.workload or WORKLOADS:
+        result = run(app, workload, args.iterations, args.concurrency)
+        report["workloads"][workload] = result
+        print_report(workload, result)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            problems = compare(report, json.load(f), args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Serialization cost of a large meeting listing: ORM + to_dict vs rows + orjson.
+
+Seeds a throwaway SQLite file with ``--meetings`` meetings (one agenda item
+and one action item each, every fourth one reviewed) and times producing the
+JSON body of the full nested listing in one page:
+
+- ``orm+stdlib``: ``get_meetings_page`` → ``Meeting.to_dict`` → stdlib json
+  (the previous path of ``GET /api/meetings``)
+- ``orm+orjson``: the same ORM objects encoded by the orjson provider
+- ``rows+stdlib``: ``get_meeting_dicts_page`` (no ORM objects) → stdlib json
+- ``rows+orjson``: ``get_meeting_dicts_page`` → orjson (the current path)
+
+    cd backend
+    python bench/serialization.py --meetings 10000 --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(
+    tempfile.mkdtemp(), "bench.db"
+)
+os.environ.setdefault("JOB_RUNNER", "manual")
+
+from app import app  # noqa: E402
+from models import ActionItem, AgendaItem, Meeting, Review, db  # noqa: E402
+from services import meeting_service  # noqa: E402
+from services.json_provider import OrjsonProvider, StdlibJSONProvider  # noqa: E402
+
+
+def seed(n: int) -> None:
+    now = datetime.now(timezone.utc)
+    statuses = ("Scheduled", "InProgress", "Closed", "Reviewed")
+    db.session.execute(
+        Meeting.__table__.insert(),
+        [
+            {
+                "id": i,
+                "title": f"Meeting {i}",
+                "scheduled_time": now + timedelta(minutes=i),
+                "duration_minutes": 60,
+                "status": statuses[i % 4],
+                "created_at": now,
+                "version": 1,
+                "allocated_minutes": 10,
+            }
+            for i in range(1, n + 1)
+        ],
+    )
+    db.session.execute(
+        AgendaItem.__table__.insert(),
+        [
+            {"meeting_id": i, "topic": "Topic", "time_allocation": 10, "created_at": now}
+            for i in range(1, n + 1)
+        ],
+    )
+    db.session.execute(
+        ActionItem.__table__.insert(),
+        [
+            {
+                "meeting_id": i,
+                "description": "Task",
+                "owner": "Alice",
+                "deadline": date.today() + timedelta(days=i % 7 - 3),
+                "status": "Open",
+                "created_at": now,
+            }
+            for i in range(1, n + 1)
+        ],
+    )
+    db.session.execute(
+        Review.__table__.insert(),
+        [
+            {
+                "meeting_id": i,
+                "summary": "Done",
+                "outcome_rating": 4,
+                "followup_required": False,
+                "created_at": now,
+            }
+            for i in range(4, n + 1, 4)
+        ],
+    )
+    db.session.commit()
+
+
+def orm_body(provider, n):
+    meetings, _ = meeting_service.get_meetings_page(limit=n)
+    return provider.dumps({"meetings": [m.to_dict() for m in meetings]})
+
+
+def rows_body(provider, n):
+    meetings, _ = meeting_service.get_meeting_dicts_page(limit=n)
+    return provider.dumps({"meetings": meetings})
+
+
+def timed(fn, repeat):
+    samples, body = [], None
+    for _ in range(repeat):
+        db.session.expunge_all()
+        started = time.perf_counter()
+        body = fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples), body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with app.app_context():
+        seed(args.meetings)
+        stdlib, fast = StdlibJSONProvider(app), OrjsonProvider(app)
+        n = args.meetings
+        cases = [
+            ("orm+stdlib", lambda: orm_body(stdlib, n)),
+            ("orm+orjson", lambda: orm_body(fast, n)),
+            ("rows+stdlib", lambda: rows_body(stdlib, n)),
+            ("rows+orjson", lambda: rows_body(fast, n)),
+        ]
+        print(f"GET /api/meetings body for {n} meetings, median of {args.repeat}")
+        baseline, bodies = None, []
+        for name, fn in cases:
+            elapsed, body = timed(fn, args.repeat)
+            bodies.append(fast.loads(body))
+            baseline = baseline or elapsed
+            print(f"{name:<12} {elapsed * 1000:8.1f} ms   {baseline / elapsed:5.2f}x")
+        assert all(b == bodies[0] for b in bodies), "serializers disagree"
+
+
+if __name__ == "__main__":
+    main()
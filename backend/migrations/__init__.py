@@ -0,0 +1,107 @@
+"""Versioned schema migrations.
+
+``db.create_all()`` creates missing tables — with every column and index the
+models declare — but never alters a table that already exists. Each module
+in ``migrations/versions`` named ``NNNN_description.py`` brings an existing
+database forward with an ``upgrade(conn)`` function. Applied versions are
+recorded in ``schema_migrations`` so every migration runs exactly once.
+
+Migrations run right after ``create_all``, so each one must also be a no-op
+against a schema that ``create_all`` has just built (use ``IF NOT EXISTS`` /
+``column_exists`` guards). Every worker process does this at startup, so
+callers hold ``schema_lock`` around both steps.
+"""
+
+import importlib
+import logging
+import pkgutil
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, text
+
+from migrations import versions
+
+logger = logging.getLogger(__name__)
+
+_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+def discover() -> list[tuple[int, str]]:
+    """Return ``(version, module_name)`` for every migration, in order."""
+    found = []
+    for info in pkgutil.iter_modules(versions.__path__):
+        prefix = info.name.split("_", 1)[0]
+        if prefix.isdigit():
+            found.append((int(prefix), info.name))
+    return sorted(found)
+
+
+def applied_versions(conn) -> set[int]:
+    return {row.version for row in conn.execute(schema_migrations.select())}
+
+
+# Arbitrary application-wide key for pg_advisory_lock
+SCHEMA_LOCK_ID = 0x436C4D74
+
+
+@contextmanager
+def schema_lock(engine):
+    """Serialize schema changes across processes sharing the database.
+
+    On PostgreSQL this holds a session-level advisory lock on a dedicated
+    connection, so workers starting together run ``create_all`` and the
+    migrations one at a time; the others then find nothing left to do.
+    Other databases are not locked: run ``flask migrate`` once before
+    starting several workers against them.
+    """
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": SCHEMA_LOCK_ID})
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": SCHEMA_LOCK_ID})
+
+
+def run_migrations(engine) -> list[int]:
+    """Apply pending migrations, each in its own transaction.
+
+    Not locked itself: run it inside ``schema_lock`` when other processes
+    may be migrating the same database.
+    """
+    _metadata.create_all(engine)
+
+    with engine.connect() as conn:
+        done = applied_versions(conn)
+
+    applied = []
+    for version, name in discover():
+        if version in done:
+            continue
+        module = importlib.import_module(f"migrations.versions.{name}")
+        with engine.begin() as conn:
+            module.upgrade(conn)
+            conn.execute(
+                schema_migrations.insert().values(
+                    version=version,
+                    name=name,
+                    applied_at=datetime.now(timezone.utc),
+                )
+            )
+        logger.info("Applied migration %s", name)
+        applied.append(version)
+    return applied
+
+
+def column_exists(conn, table: str, column: str) -> bool:
+    return column in {c["name"] for c in inspect(conn).get_columns(table)}
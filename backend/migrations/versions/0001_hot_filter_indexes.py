@@ -0,0 +1,26 @@
+"""Indexes for the hot filter and sort columns.
+
+- meetings (scheduled_time, id): list ordering and keyset pagination
+- meetings (status, scheduled_time, id): status-filtered lists, dashboard
+- agenda_items / action_items (meeting_id): relation loads per meeting
+- action_items (deadline, id) WHERE status = 'Open': dashboard open/overdue
+  lists and counts (partial, so completed items cost nothing)
+"""
+
+STATEMENTS = (
+    "CREATE INDEX IF NOT EXISTS ix_meetings_scheduled_time_id "
+    "ON meetings (scheduled_time, id)",
+    "CREATE INDEX IF NOT EXISTS ix_meetings_status_scheduled_time "
+    "ON meetings (status, scheduled_time, id)",
+    "CREATE INDEX IF NOT EXISTS ix_agenda_items_meeting_id "
+    "ON agenda_items (meeting_id)",
+    "CREATE INDEX IF NOT EXISTS ix_action_items_meeting_id "
+    "ON action_items (meeting_id)",
+    "CREATE INDEX IF NOT EXISTS ix_action_items_open_deadline "
+    "ON action_items (deadline, id) WHERE status = 'Open'",
+)
+
+
+def upgrade(conn):
+    for statement in STATEMENTS:
+        conn.exec_driver_sql(statement)
@@ -0,0 +1,10 @@
+"""Per-meeting version counter, bumped by every mutation (ETags)."""
+
+from migrations import column_exists
+
+
+def upgrade(conn):
+    if not column_exists(conn, "meetings", "version"):
+        conn.exec_driver_sql(
+            "ALTER TABLE meetings ADD COLUMN version INTEGER NOT NULL DEFAULT 1"
+        )
@@ -0,0 +1,25 @@
+"""Maintained agenda-time counter on meetings, backfilled from agenda_items."""
+
+from migrations import column_exists
+
+CONSTRAINT = "ck_meetings_allocated_minutes"
+
+
+def upgrade(conn):
+    if column_exists(conn, "meetings", "allocated_minutes"):
+        return
+    conn.exec_driver_sql(
+        "ALTER TABLE meetings ADD COLUMN allocated_minutes INTEGER NOT NULL DEFAULT 0"
+    )
+    conn.exec_driver_sql(
+        "UPDATE meetings SET allocated_minutes = ("
+        " SELECT COALESCE(SUM(time_allocation), 0) FROM agenda_items"
+        " WHERE agenda_items.meeting_id = meetings.id)"
+    )
+    # SQLite cannot add a constraint to an existing table; there the
+    # guarded UPDATE in the agenda service is the only enforcement.
+    if conn.dialect.name == "postgresql":
+        conn.exec_driver_sql(
+            f"ALTER TABLE meetings ADD CONSTRAINT {CONSTRAINT} CHECK "
+            "(allocated_minutes >= 0 AND allocated_minutes <= duration_minutes)"
+        )
@@ -0,0 +1,30 @@
+"""``updated_at`` on meetings, action_items and reviews, for incremental exports.
+
+Existing rows are backfilled with their last known change (``closed_at`` or
+``created_at``).
+"""
+
+from migrations import column_exists
+
+BACKFILL = {
+    "meetings": "COALESCE(closed_at, created_at)",
+    "action_items": "created_at",
+    "reviews": "created_at",
+}
+
+
+def upgrade(conn):
+    timestamp = (
+        "TIMESTAMP WITH TIME ZONE" if conn.dialect.name == "postgresql" else "DATETIME"
+    )
+    for table, backfill in BACKFILL.items():
+        if not column_exists(conn, table, "updated_at"):
+            conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN updated_at {timestamp}")
+            conn.exec_driver_sql(f"UPDATE {table} SET updated_at = {backfill}")
+            if conn.dialect.name == "postgresql":
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {table} ALTER COLUMN updated_at SET NOT NULL"
+                )
+        conn.exec_driver_sql(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_updated_at ON {table} (updated_at)"
+        )
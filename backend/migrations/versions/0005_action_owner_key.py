@@ -0,0 +1,31 @@
+"""Normalized ``owner_key`` on action_items, indexed for per-owner lookups.
+
+The key is computed in Python (``models.action_item.owner_key``) rather than
+with SQL ``lower(trim())`` so that backfilled rows match new ones exactly.
+"""
+
+from sqlalchemy import text
+
+from migrations import column_exists
+from models.action_item import owner_key
+
+INDEX = "ix_action_items_owner_status_deadline"
+
+
+def upgrade(conn):
+    if not column_exists(conn, "action_items", "owner_key"):
+        conn.exec_driver_sql(
+            "ALTER TABLE action_items ADD COLUMN owner_key VARCHAR(255) NOT NULL DEFAULT ''"
+        )
+        owners = conn.execute(text("SELECT DISTINCT owner FROM action_items")).scalars()
+        keys = [{"owner": owner, "key": owner_key(owner)} for owner in owners]
+        if keys:
+            conn.execute(
+                text("UPDATE action_items SET owner_key = :key WHERE owner = :owner"), keys
+            )
+        if conn.dialect.name == "postgresql":
+            conn.exec_driver_sql("ALTER TABLE action_items ALTER COLUMN owner_key DROP DEFAULT")
+    conn.exec_driver_sql(
+        f"CREATE INDEX IF NOT EXISTS {INDEX} ON action_items"
+        " (owner_key, status, deadline, id)"
+    )
@@ -0,0 +1,18 @@
+"""Full-text search indexes (``models.search``) for existing tables.
+
+On PostgreSQL adding the generated ``search_vector`` column computes it for
+every existing row (a table rewrite). On SQLite the FTS5 tables are rebuilt
+from their content tables.
+"""
+
+from models.search import SEARCHABLE, create_statements
+
+
+def upgrade(conn):
+    dialect = conn.dialect.name
+    for model, column in SEARCHABLE.values():
+        table = model.__table__.name
+        for statement in create_statements(table, column, dialect):
+            conn.exec_driver_sql(statement)
+        if dialect == "sqlite":
+            conn.exec_driver_sql(f"INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild')")
@@ -0,0 +1,63 @@
+"""``ends_at`` on meetings and the indexes behind calendar conflict checks.
+
+PostgreSQL backfills with interval arithmetic and gets the
+``tstzrange(scheduled_time, ends_at)`` GiST index; SQLite backfills in
+Python so the stored timestamps use the same format as ORM-written ones.
+"""
+
+from datetime import timedelta
+
+from sqlalchemy import DateTime, Integer, bindparam, column, select, table
+
+from migrations import column_exists
+from models.meeting import TIME_RANGE_INDEX
+
+BATCH = 1000
+
+
+def upgrade(conn):
+    postgres = conn.dialect.name == "postgresql"
+    if not column_exists(conn, "meetings", "ends_at"):
+        timestamp = "TIMESTAMP WITH TIME ZONE" if postgres else "DATETIME"
+        conn.exec_driver_sql(f"ALTER TABLE meetings ADD COLUMN ends_at {timestamp}")
+        if postgres:
+            conn.exec_driver_sql(
+                "UPDATE meetings"
+                " SET ends_at = scheduled_time + duration_minutes * INTERVAL '1 minute'"
+            )
+            conn.exec_driver_sql("ALTER TABLE meetings ALTER COLUMN ends_at SET NOT NULL")
+        else:
+            _backfill(conn)
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_meetings_duration_minutes ON meetings (duration_minutes)"
+    )
+    if postgres:
+        conn.exec_driver_sql(TIME_RANGE_INDEX)
+
+
+def _backfill(conn):
+    # Only the columns involved (no model onupdate hooks); typed so SQLite
+    # round-trips the stored timestamp format
+    meetings = table(
+        "meetings",
+        column("id", Integer),
+        column("scheduled_time", DateTime(timezone=True)),
+        column("duration_minutes", Integer),
+        column("ends_at", DateTime(timezone=True)),
+    )
+    rows = conn.execute(
+        select(meetings.c.id, meetings.c.scheduled_time, meetings.c.duration_minutes)
+    ).all()
+    update = (
+        meetings.update()
+        .where(meetings.c.id == bindparam("meeting_id"))
+        .values(ends_at=bindparam("ends"))
+    )
+    for i in range(0, len(rows), BATCH):
+        conn.execute(
+            update,
+            [
+                {"meeting_id": r.id, "ends": r.scheduled_time + timedelta(minutes=r.duration_minutes)}
+                for r in rows[i : i + BATCH]
+            ],
+        )
@@ -0,0 +1,11 @@
+"""Seed the ``change_counter`` row behind list and dashboard ETags.
+
+``create_all`` creates the table (and seeds it) on existing databases; this
+only guarantees the row exists if the table predates the seed.
+"""
+
+from models.change_counter import SEED_ROW
+
+
+def upgrade(conn):
+    conn.exec_driver_sql(SEED_ROW)
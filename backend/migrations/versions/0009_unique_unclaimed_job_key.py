@@ -0,0 +1,20 @@
+"""Unique partial index: at most one unclaimed queued job per ``key``.
+
+Duplicates queued before the index existed (e.g. two processes scheduling
+the overdue sweep at the same start-up) are dropped first, keeping the
+oldest, so the index can be built.
+"""
+
+INDEX = "ux_jobs_unclaimed_key"
+WHERE = "status = 'queued' AND attempts = 0 AND key IS NOT NULL"
+
+
+def upgrade(conn):
+    conn.exec_driver_sql(
+        f"DELETE FROM jobs WHERE {WHERE} AND id NOT IN"
+        f" (SELECT min(id) FROM jobs WHERE {WHERE} GROUP BY key)"
+    )
+    conn.exec_driver_sql(
+        f"CREATE UNIQUE INDEX IF NOT EXISTS {INDEX} ON jobs (key)"
+        " WHERE status = 'queued' AND attempts = 0"
+    )
@@ -6,5 +6,9 @@ from models.meeting import Meeting
 from models.agenda_item import AgendaItem
 from models.action_item import ActionItem
 from models.review import Review
+from models.ai_suggestion import AISuggestion
+from models.job import Job
+from models.change_counter import ChangeCounter
+import models.search  # noqa: E402,F401 - full-text index DDL
 
-__all__ = ["db", "Meeting", "AgendaItem", "ActionItem", "Review"]
+__all__ = ["db", "Meeting", "AgendaItem", "ActionItem", "Review", "AISuggestion", "Job", "ChangeCounter"]
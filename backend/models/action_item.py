@@ -1,16 +1,51 @@
 from datetime import datetime, date, timezone
+
+from sqlalchemy import and_, func
+from sqlalchemy.ext.hybrid import hybrid_property
+
 from models import db
 
 
+def owner_key(owner: str) -> str:
+    """Normalized owner used for lookups: case-folded, whitespace collapsed."""
+    return " ".join(owner.split()).casefold()
+
+
+def _owner_key_default(context) -> str:
+    return owner_key(context.get_current_parameters()["owner"])
+
+
 class ActionItem(db.Model):
     __tablename__ = "action_items"
+    __table_args__ = (
+        # Open items by deadline: dashboard lists, counts and overdue checks
+        db.Index(
+            "ix_action_items_open_deadline",
+            "deadline",
+            "id",
+            postgresql_where=db.text("status = 'Open'"),
+            sqlite_where=db.text("status = 'Open'"),
+        ),
+        # "My actions": one owner's items by status, then deadline
+        db.Index(
+            "ix_action_items_owner_status_deadline",
+            "owner_key",
+            "status",
+            "deadline",
+            "id",
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     meeting_id = db.Column(
-        db.Integer, db.ForeignKey("meetings.id"), nullable=False
+        db.Integer, db.ForeignKey("meetings.id"), nullable=False, index=True
     )
     description = db.Column(db.Text, nullable=False)
     owner = db.Column(db.String(255), nullable=False)
+    # Derived from owner on insert (every path: ORM, batch, import)
+    owner_key = db.Column(
+        db.String(255), nullable=False, default=_owner_key_default
+    )
     deadline = db.Column(db.Date, nullable=False)
     status = db.Column(db.String(20), nullable=False, default="Open")
     created_at = db.Column(
@@ -18,12 +53,25 @@ class ActionItem(db.Model):
         nullable=False,
         default=lambda: datetime.now(timezone.utc),
     )
+    # Maintained on every write; drives incremental exports (?updated_since=)
+    updated_at = db.Column(
+        db.DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        index=True,
+    )
 
-    @property
+    @hybrid_property
     def is_overdue(self) -> bool:
         """Overdue is computed dynamically — never stored."""
         return self.status != "Completed" and self.deadline < date.today()
 
+    @is_overdue.expression
+    def is_overdue(cls):
+        """SQL form of ``is_overdue`` for filters and aggregates."""
+        return and_(cls.status != "Completed", cls.deadline < func.current_date())
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -7,7 +7,7 @@ class AgendaItem(db.Model):
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     meeting_id = db.Column(
-        db.Integer, db.ForeignKey("meetings.id"), nullable=False
+        db.Integer, db.ForeignKey("meetings.id"), nullable=False, index=True
     )
     topic = db.Column(db.Text, nullable=False)
     time_allocation = db.Column(db.Integer, nullable=False)  # minutes
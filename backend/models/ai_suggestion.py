@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+
+from models import db
+
+
+class AISuggestion(db.Model):
+    """Persistent tier of the AI suggestion cache (``AI_CACHE_BACKEND=database``).
+
+    Rows are keyed by a hash of the normalized request, so identical
+    requests from any worker share one entry.
+    """
+
+    __tablename__ = "ai_suggestions"
+
+    key = db.Column(db.String(64), primary_key=True)
+    task = db.Column(db.String(32), nullable=False)
+    value = db.Column(db.JSON, nullable=False)
+    expires_at = db.Column(db.DateTime(timezone=True), nullable=False)
+    last_used_at = db.Column(
+        db.DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        index=True,
+    )
@@ -0,0 +1,26 @@
+from sqlalchemy import DDL, event
+
+from models import db
+
+
+class ChangeCounter(db.Model):
+    """Single-row counter bumped after every write to meetings or their items.
+
+    ``services.meeting_service.get_global_version`` reads it by primary key,
+    so list/dashboard ETags cost one index lookup regardless of table size.
+    """
+
+    __tablename__ = "change_counter"
+
+    ID = 1
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+
+
+SEED_ROW = (
+    "INSERT INTO change_counter (id, version)"
+    f" SELECT {ChangeCounter.ID}, 0"
+    f" WHERE NOT EXISTS (SELECT 1 FROM change_counter WHERE id = {ChangeCounter.ID})"
+)
+event.listen(ChangeCounter.__table__, "after_create", DDL(SEED_ROW))
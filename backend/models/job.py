@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+
+from models import db
+
+# A queued job that no runner has claimed yet; at most one per key
+UNCLAIMED = text("status = 'queued' AND attempts = 0")
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+class Job(db.Model):
+    """A unit of background work, claimed and run by ``services.job_queue``."""
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Claim query: due jobs in run_at order
+        db.Index("ix_jobs_status_run_at", "status", "run_at"),
+        # Dedupe: concurrent enqueues of the same key cannot both insert.
+        # Retries (attempts > 0) are exempt so re-queueing never conflicts.
+        db.Index(
+            "ux_jobs_unclaimed_key",
+            "key",
+            unique=True,
+            sqlite_where=UNCLAIMED,
+            postgresql_where=UNCLAIMED,
+        ),
+    )
+
+    STATUSES = ("queued", "running", "done", "failed")
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    kind = db.Column(db.String(64), nullable=False)
+    # Groups related jobs (e.g. "review_draft:12") for lookups and dedupe
+    key = db.Column(db.String(255), nullable=True, index=True)
+    payload = db.Column(db.JSON, nullable=False, default=dict)
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=5)
+    run_at = db.Column(db.DateTime(timezone=True), nullable=False, default=_now)
+    locked_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    result = db.Column(db.JSON, nullable=True)
+    created_at = db.Column(db.DateTime(timezone=True), nullable=False, default=_now)
+    finished_at = db.Column(db.DateTime(timezone=True), nullable=True)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "key": self.key,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "run_at": self.run_at.isoformat(),
+            "last_error": self.last_error,
+            "result": self.result,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
@@ -1,9 +1,41 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import DDL, event
+
 from models import db
 
 
+def _ends_at_default(context):
+    params = context.get_current_parameters()
+    return params["scheduled_time"] + timedelta(minutes=params["duration_minutes"])
+
+
 class Meeting(db.Model):
     __tablename__ = "meetings"
+    __table_args__ = (
+        db.Index("ix_meetings_scheduled_time_id", "scheduled_time", "id"),
+        db.Index("ix_meetings_status_scheduled_time", "status", "scheduled_time", "id"),
+        # max(duration_minutes) bounds how far back a calendar window reaches
+        db.Index("ix_meetings_duration_minutes", "duration_minutes"),
+        db.CheckConstraint(
+            "allocated_minutes >= 0 AND allocated_minutes <= duration_minutes",
+            name="ck_meetings_allocated_minutes",
+        ),
+    )
+
+    # Projection vocabulary for list endpoints (?fields= / ?expand=)
+    SCALAR_FIELDS = (
+        "id",
+        "title",
+        "scheduled_time",
+        "duration_minutes",
+        "status",
+        "created_at",
+        "closed_at",
+        "version",
+        "allocated_minutes",
+    )
+    RELATION_FIELDS = ("agenda_items", "action_items", "review")
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     title = db.Column(db.String(255), nullable=False)
@@ -20,6 +52,23 @@ class Meeting(db.Model):
         default=lambda: datetime.now(timezone.utc),
     )
     closed_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    # Maintained on every write; drives incremental exports (?updated_since=)
+    updated_at = db.Column(
+        db.DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        index=True,
+    )
+    # Bumped by every service mutation of the meeting or its items (ETags)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+    # Sum of agenda_items.time_allocation, maintained by the agenda service
+    allocated_minutes = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0"
+    )
+    # scheduled_time + duration_minutes, set on insert (neither is editable);
+    # stored so that [scheduled_time, ends_at) can be indexed as an interval
+    ends_at = db.Column(db.DateTime(timezone=True), nullable=False, default=_ends_at_default)
 
     # Relationships
     agenda_items = db.relationship(
@@ -32,8 +81,17 @@ class Meeting(db.Model):
         "Review", backref="meeting", uselist=False, cascade="all, delete-orphan"
     )
 
-    def to_dict(self):
-        return {
+    def to_dict(self, fields=None, expand=None):
+        """Serialize the meeting.
+
+        ``fields`` limits the scalar columns and ``expand`` the embedded
+        relations; ``None`` means "all of them". Relations that are not
+        expanded are never touched, so they are never lazy-loaded.
+        """
+        fields = self.SCALAR_FIELDS if fields is None else fields
+        expand = self.RELATION_FIELDS if expand is None else expand
+
+        data = {
             "id": self.id,
             "title": self.title,
             "scheduled_time": self.scheduled_time.isoformat(),
@@ -41,7 +99,26 @@ class Meeting(db.Model):
             "status": self.status,
             "created_at": self.created_at.isoformat(),
             "closed_at": self.closed_at.isoformat() if self.closed_at else None,
-            "agenda_items": [a.to_dict() for a in self.agenda_items],
-            "action_items": [a.to_dict() for a in self.action_items],
-            "review": self.review.to_dict() if self.review else None,
+            "version": self.version,
+            "allocated_minutes": self.allocated_minutes,
         }
+        data = {name: data[name] for name in fields}
+
+        if "agenda_items" in expand:
+            data["agenda_items"] = [a.to_dict() for a in self.agenda_items]
+        if "action_items" in expand:
+            data["action_items"] = [a.to_dict() for a in self.action_items]
+        if "review" in expand:
+            data["review"] = self.review.to_dict() if self.review else None
+        return data
+
+
+# Interval index for overlap (&&) queries; tstzrange is PostgreSQL-only, so
+# it cannot be declared in __table_args__
+TIME_RANGE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS ix_meetings_time_range ON meetings"
+    " USING GIST (tstzrange(scheduled_time, ends_at))"
+)
+event.listen(
+    Meeting.__table__, "after_create", DDL(TIME_RANGE_INDEX).execute_if(dialect="postgresql")
+)
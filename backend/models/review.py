@@ -20,6 +20,14 @@ class Review(db.Model):
         nullable=False,
         default=lambda: datetime.now(timezone.utc),
     )
+    # Maintained on every write; drives incremental exports (?updated_since=)
+    updated_at = db.Column(
+        db.DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        index=True,
+    )
 
     def to_dict(self):
         return {
@@ -0,0 +1,73 @@
+"""Full-text search indexes on the searchable text columns.
+
+``create_all`` cannot declare these, so they are attached to the tables as
+``after_create`` DDL (and created for existing databases by migration 0006):
+
+- PostgreSQL: a stored generated ``search_vector tsvector`` column per table
+  with a GIN index. The database recomputes it on every INSERT/UPDATE.
+- SQLite: an external-content FTS5 table ``<table>_fts`` per table (porter
+  stemming), kept in sync by insert/update/delete triggers.
+
+Either way the index is maintained row by row on write; there is no batch
+reindexing. ``services.search_service`` queries it.
+"""
+
+from sqlalchemy import DDL, event
+
+from models.action_item import ActionItem
+from models.agenda_item import AgendaItem
+from models.meeting import Meeting
+from models.review import Review
+
+# result type -> (model, text column)
+SEARCHABLE = {
+    "meeting": (Meeting, "title"),
+    "agenda_item": (AgendaItem, "topic"),
+    "action_item": (ActionItem, "description"),
+    "review": (Review, "summary"),
+}
+
+TS_CONFIG = "english"
+
+
+def create_statements(table: str, column: str, dialect: str) -> list[str]:
+    """Idempotent DDL creating the search index for ``table.column``."""
+    if dialect == "postgresql":
+        return [
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector"
+            f" GENERATED ALWAYS AS (to_tsvector('{TS_CONFIG}', coalesce({column}, '')))"
+            " STORED",
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_search ON {table}"
+            " USING GIN (search_vector)",
+        ]
+    if dialect == "sqlite":
+        fts = f"{table}_fts"
+        delete = (
+            f"INSERT INTO {fts} ({fts}, rowid, {column})"
+            f" VALUES ('delete', old.id, old.{column});"
+        )
+        insert = f"INSERT INTO {fts} (rowid, {column}) VALUES (new.id, new.{column});"
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({column},"
+            f" content='{table}', content_rowid='id', tokenize='porter unicode61')",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table}"
+            f" BEGIN {insert} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table}"
+            f" BEGIN {delete} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column} ON {table}"
+            f" BEGIN {delete} {insert} END",
+        ]
+    return []
+
+
+for _model, _column in SEARCHABLE.values():
+    _table = _model.__table__
+    for _dialect in ("postgresql", "sqlite"):
+        for _statement in create_statements(_table.name, _column, _dialect):
+            event.listen(_table, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+    # The FTS table outlives its content table otherwise (test teardown)
+    event.listen(
+        _table,
+        "after_drop",
+        DDL(f"DROP TABLE IF EXISTS {_table.name}_fts").execute_if(dialect="sqlite"),
+    )
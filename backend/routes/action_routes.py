@@ -1,7 +1,11 @@
 """Action item API routes."""
 
 from flask import Blueprint, request, jsonify
-from services import action_item_service
+from routes.conditional import conditional
+from services import action_item_service, meeting_service
+from services.batch import BatchValidationError
+from services.meeting_service import ConflictError
+from services.pagination import parse_limit
 
 actions_bp = Blueprint("actions", __name__)
 
@@ -19,6 +23,27 @@ def create_action_item(meeting_id):
         return jsonify(action.to_dict()), 201
     except LookupError as e:
         return jsonify({"error": str(e)}), 404
+    except ConflictError as e:
+        return jsonify({"error": str(e)}), e.status_code
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+@actions_bp.route("/api/meetings/<int:meeting_id>/actions:batch", methods=["POST"])
+def create_action_items(meeting_id):
+    data = request.get_json()
+    try:
+        actions = action_item_service.create_action_items(
+            meeting_id=meeting_id,
+            items=data.get("items"),
+        )
+        return jsonify({"items": [a.to_dict() for a in actions]}), 201
+    except LookupError as e:
+        return jsonify({"error": str(e)}), 404
+    except ConflictError as e:
+        return jsonify({"error": str(e)}), e.status_code
+    except BatchValidationError as e:
+        return jsonify({"error": str(e), "errors": e.errors}), 400
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
 
@@ -30,14 +55,37 @@ def complete_action_item(action_id):
         return jsonify(action.to_dict())
     except LookupError as e:
         return jsonify({"error": str(e)}), 404
+    except ConflictError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
 
 
 @actions_bp.route("/api/meetings/<int:meeting_id>/actions", methods=["GET"])
-def list_action_items(meeting_id):
+@conditional(meeting_service.get_meeting_version)
+def list_action_items(meeting_id, version):
     try:
         actions = action_item_service.get_actions_for_meeting(meeting_id)
         return jsonify([a.to_dict() for a in actions])
     except LookupError as e:
         return jsonify({"error": str(e)}), 404
+
+
+@actions_bp.route("/api/owners/<owner>/actions", methods=["GET"])
+@conditional(lambda owner: meeting_service.get_global_version())
+def list_owner_action_items(owner, version):
+    try:
+        actions, next_cursor = action_item_service.get_owner_actions_page(
+            owner,
+            status=request.args.get("status") or None,
+            overdue=request.args.get("overdue", "").lower() in ("1", "true"),
+            deadline_from=request.args.get("deadline_from"),
+            deadline_to=request.args.get("deadline_to"),
+            limit=parse_limit(request.args.get("limit")),
+            cursor=request.args.get("cursor"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(
+        {"action_items": [a.to_dict() for a in actions], "next_cursor": next_cursor}
+    )
@@ -2,6 +2,8 @@
 
 from flask import Blueprint, request, jsonify
 from services import agenda_service
+from services.batch import BatchValidationError
+from services.meeting_service import ConflictError
 
 agenda_bp = Blueprint("agenda", __name__)
 
@@ -18,6 +20,27 @@ def add_agenda_item(meeting_id):
         return jsonify(item.to_dict()), 201
     except LookupError as e:
         return jsonify({"error": str(e)}), 404
+    except ConflictError as e:
+        return jsonify({"error": str(e)}), e.status_code
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+@agenda_bp.route("/api/meetings/<int:meeting_id>/agenda:batch", methods=["POST"])
+def add_agenda_items(meeting_id):
+    data = request.get_json()
+    try:
+        items = agenda_service.add_agenda_items(
+            meeting_id=meeting_id,
+            items=data.get("items"),
+        )
+        return jsonify({"items": [i.to_dict() for i in items]}), 201
+    except LookupError as e:
+        return jsonify({"error": str(e)}), 404
+    except ConflictError as e:
+        return jsonify({"error": str(e)}), e.status_code
+    except BatchValidationError as e:
+        return jsonify({"error": str(e), "errors": e.errors}), 400
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
 
@@ -33,6 +56,8 @@ def update_agenda_item(item_id):
         return jsonify(item.to_dict()), 200
     except LookupError as e:
         return jsonify({"error": str(e)}), 404
+    except ConflictError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
 
@@ -44,5 +69,7 @@ def delete_agenda_item(item_id):
         return jsonify({"message": "Agenda item deleted."}), 200
     except LookupError as e:
         return jsonify({"error": str(e)}), 404
+    except ConflictError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
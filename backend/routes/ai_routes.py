@@ -2,10 +2,16 @@
 
 AI outputs are suggestions only — they do NOT modify state.
 All suggestions must be submitted through normal validated endpoints.
+
+The ``:stream`` variants return the same suggestions as newline-delimited
+JSON events, written as the provider produces them (see ``ai_service``).
 """
 
-from flask import Blueprint, request, jsonify
+import json
+
+from flask import Blueprint, Response, request, jsonify
 from services import ai_service
+from services.ai_cache import suggestion_cache
 
 ai_bp = Blueprint("ai", __name__)
 
@@ -38,3 +44,50 @@ def summarize_review():
         action_items=data.get("action_items", []),
     )
     return jsonify(summary)
+
+
+def ndjson(events) -> Response:
+    lines = (json.dumps(event) + "\n" for event in events)
+    return Response(
+        lines,
+        mimetype="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@ai_bp.route("/api/ai/suggest-agenda:stream", methods=["POST"])
+def stream_agenda():
+    data = request.get_json()
+    return ndjson(
+        ai_service.stream_agenda_topics(
+            title=data.get("title", ""),
+            context=data.get("context", ""),
+        )
+    )
+
+
+@ai_bp.route("/api/ai/suggest-actions:stream", methods=["POST"])
+def stream_actions():
+    data = request.get_json()
+    return ndjson(
+        ai_service.stream_action_items(
+            meeting_title=data.get("title", ""),
+            agenda_topics=data.get("agenda_topics", []),
+        )
+    )
+
+
+@ai_bp.route("/api/ai/summarize-review:stream", methods=["POST"])
+def stream_summary():
+    data = request.get_json()
+    return ndjson(
+        ai_service.stream_review_summary(
+            meeting_title=data.get("title", ""),
+            action_items=data.get("action_items", []),
+        )
+    )
+
+
+@ai_bp.route("/api/ai/cache/stats")
+def cache_stats():
+    return jsonify(suggestion_cache.stats())
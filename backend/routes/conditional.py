@@ -0,0 +1,76 @@
+"""Conditional requests: ETag / If-None-Match for reads, If-Match for writes."""
+
+import hashlib
+from datetime import date
+from functools import wraps
+
+from flask import Response, jsonify, make_response, request
+
+# Clients may keep a copy but must revalidate it (cheaply, via ETag) on use.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(stamp, path: str | None = None, query: str | None = None) -> str:
+    """Strong ETag for the current request given a resource version stamp.
+
+    The path and query string distinguish representations; today's date is
+    mixed in because ``is_overdue`` changes at midnight without a write.
+    ``path`` / ``query`` compute the tag of another representation.
+    """
+    if path is None:
+        path, query = request.path, request.query_string.decode()
+    raw = "|".join((path, query or "", str(stamp), date.today().isoformat()))
+    return hashlib.sha1(raw.encode()).hexdigest()[:20]
+
+
+def conditional(stamp_fn):
+    """Answer ``If-None-Match`` with 304 before the view builds its body.
+
+    ``stamp_fn`` receives the view's URL arguments and returns a cheap
+    version stamp (raising LookupError for a missing resource). The stamp is
+    passed on to the view as ``version`` so it can key cached bodies on it.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(**kwargs):
+            try:
+                stamp = stamp_fn(**kwargs)
+            except LookupError as e:
+                return jsonify({"error": str(e)}), 404
+
+            etag = make_etag(stamp)
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+            else:
+                response = make_response(view(version=stamp, **kwargs))
+
+            if response.status_code in (200, 304):
+                response.set_etag(etag)
+                response.headers["Cache-Control"] = CACHE_CONTROL
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def if_match_version(meeting_id: int) -> int | None:
+    """Meeting version named by the request's ``If-Match``, if it sent one.
+
+    Accepts the ETag of ``GET /api/meetings/<id>`` or the meeting's
+    ``version`` field (quoted). A tag that does not match the current
+    version raises PreconditionFailed; ``If-Match: *`` or no header at all
+    means "any version".
+    """
+    from services.meeting_service import PreconditionFailed, get_meeting_version
+
+    if not request.if_match or request.if_match.star_tag:
+        return None
+    version = get_meeting_version(meeting_id)
+    current = (make_etag(version, path=f"/api/meetings/{meeting_id}", query=""), str(version))
+    if any(request.if_match.contains(tag) for tag in current):
+        return version
+    raise PreconditionFailed(
+        f"If-Match does not match the current version of meeting {meeting_id}."
+    )
@@ -1,12 +1,31 @@
 """Dashboard API route."""
 
-from flask import Blueprint, jsonify
-from services import meeting_service
+from flask import Blueprint, request, jsonify
+from routes.conditional import conditional
+from services import action_item_service, meeting_service
+from services.pagination import parse_limit
 
 dashboard_bp = Blueprint("dashboard", __name__)
 
 
 @dashboard_bp.route("/api/dashboard", methods=["GET"])
-def get_dashboard():
-    stats = meeting_service.get_dashboard_stats()
+@conditional(meeting_service.get_global_version)
+def get_dashboard(version):
+    stats = meeting_service.get_dashboard_stats(version=version)
     return jsonify(stats)
+
+
+@dashboard_bp.route("/api/dashboard/action-items", methods=["GET"])
+@conditional(meeting_service.get_global_version)
+def list_open_action_items(version):
+    try:
+        actions, next_cursor = action_item_service.get_open_actions_page(
+            overdue=request.args.get("overdue", "").lower() in ("1", "true"),
+            limit=parse_limit(request.args.get("limit")),
+            cursor=request.args.get("cursor"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(
+        {"action_items": [a.to_dict() for a in actions], "next_cursor": next_cursor}
+    )
@@ -0,0 +1,47 @@
+"""Server-Sent Events stream of per-meeting changes."""
+
+import json
+
+from flask import Blueprint, Response, jsonify
+from services import meeting_service
+from services.event_bus import events
+
+events_bp = Blueprint("events", __name__)
+
+KEEPALIVE_SECONDS = 15
+
+
+def format_sse(event: dict) -> str:
+    # No ``id:`` field: events carry no id that is unique across processes
+    # (with the Redis bus each publisher is separate), so a ``Last-Event-ID``
+    # could not be resumed from. Clients re-fetch the meeting on reconnect.
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+@events_bp.route("/api/meetings/<int:meeting_id>/events", methods=["GET"])
+def stream_meeting_events(meeting_id):
+    try:
+        meeting_service.get_meeting_version(meeting_id)
+    except LookupError as e:
+        return jsonify({"error": str(e)}), 404
+
+    # Subscribe before the response starts so nothing published after this
+    # request was accepted is missed. The generator never touches the
+    # database: the session is released when the view returns.
+    subscription = events.subscribe(meeting_id)
+
+    def stream():
+        yield f"retry: 3000\nevent: ready\ndata: {json.dumps({'meeting_id': meeting_id})}\n\n"
+        while True:
+            event = subscription.get(timeout=KEEPALIVE_SECONDS)
+            yield ": keepalive\n\n" if event is None else format_sse(event)
+
+    response = Response(
+        stream(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    # Runs when the server closes the response, even if the client went away
+    # before the generator started (its ``finally`` would never run then).
+    response.call_on_close(subscription.close)
+    return response
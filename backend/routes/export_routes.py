@@ -0,0 +1,29 @@
+"""Analytics export API routes (see ``export_service``)."""
+
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from services import export_service
+
+export_bp = Blueprint("export", __name__)
+
+
+@export_bp.route("/api/export/<table>", methods=["GET"])
+def export_table(table):
+    fmt = request.args.get("format", "ndjson")
+    try:
+        updated_since = export_service.parse_updated_since(request.args.get("updated_since"))
+        chunks = export_service.stream_export(table, fmt, updated_since)
+    except LookupError as e:
+        return jsonify({"error": str(e)}), 404
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    mimetype, extension = export_service.FORMATS[fmt]
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f'attachment; filename="{table}.{extension}"',
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",
+        },
+    )
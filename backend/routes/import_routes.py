@@ -0,0 +1,30 @@
+"""Bulk import API routes (see ``import_service``)."""
+
+import io
+
+from flask import Blueprint, current_app, jsonify, request
+from services import import_service
+
+import_bp = Blueprint("import", __name__)
+
+
+@import_bp.route("/api/import", methods=["POST"])
+def import_records():
+    """Import an NDJSON (default) or CSV request body; returns the report.
+
+    ``?format=csv`` or ``Content-Type: text/csv`` selects CSV;
+    ``?mode=historical`` relaxes the live-only rules.
+    """
+    default_format = "csv" if request.mimetype == "text/csv" else "ndjson"
+    fmt = request.args.get("format", default_format)
+    mode = request.args.get("mode", "live")
+    try:
+        lines = io.TextIOWrapper(request.stream, encoding="utf-8", newline="")
+        report = import_service.import_records(
+            import_service.parse(lines, fmt),
+            mode=mode,
+            chunk_size=current_app.config["IMPORT_CHUNK_SIZE"],
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(report)
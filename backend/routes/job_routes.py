@@ -0,0 +1,14 @@
+"""Background job status API routes."""
+
+from flask import Blueprint, jsonify
+from services.job_queue import jobs
+
+jobs_bp = Blueprint("jobs", __name__)
+
+
+@jobs_bp.route("/api/jobs/<int:job_id>", methods=["GET"])
+def get_job(job_id):
+    try:
+        return jsonify(jobs.get_job(job_id).to_dict())
+    except LookupError as e:
+        return jsonify({"error": str(e)}), 404
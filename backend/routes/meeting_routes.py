@@ -1,7 +1,10 @@
 """Meeting API routes."""
 
 from flask import Blueprint, request, jsonify
-from services import meeting_service
+from routes.conditional import conditional, if_match_version
+from services import calendar_service, meeting_service
+from services.meeting_service import ConflictError
+from services.pagination import parse_limit
 
 meetings_bp = Blueprint("meetings", __name__)
 
@@ -21,17 +24,45 @@ def create_meeting():
 
 
 @meetings_bp.route("/api/meetings", methods=["GET"])
-def list_meetings():
-    status = request.args.get("status")
-    meetings = meeting_service.get_all_meetings(status=status)
-    return jsonify([m.to_dict() for m in meetings])
+@conditional(meeting_service.get_global_version)
+def list_meetings(version):
+    try:
+        fields, expand = meeting_service.parse_projection(
+            request.args.get("fields"), request.args.get("expand")
+        )
+        meetings, next_cursor = meeting_service.get_meeting_dicts_page(
+            status=request.args.get("status"),
+            limit=parse_limit(request.args.get("limit")),
+            cursor=request.args.get("cursor"),
+            start=calendar_service.parse_timestamp(request.args.get("from"), "from"),
+            end=calendar_service.parse_timestamp(request.args.get("to"), "to"),
+            fields=fields,
+            expand=expand,
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"meetings": meetings, "next_cursor": next_cursor})
+
+
+@meetings_bp.route("/api/meetings/conflicts", methods=["GET"])
+def meeting_conflicts():
+    try:
+        start, end = calendar_service.parse_window(request.args.get("from"), request.args.get("to"))
+        limit = parse_limit(
+            request.args.get("limit"),
+            default=calendar_service.CONFLICT_LIMIT,
+            maximum=calendar_service.MAX_CONFLICT_LIMIT,
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(calendar_service.find_conflicts(start, end, limit))
 
 
 @meetings_bp.route("/api/meetings/<int:meeting_id>", methods=["GET"])
-def get_meeting(meeting_id):
+@conditional(meeting_service.get_meeting_version)
+def get_meeting(meeting_id, version):
     try:
-        meeting = meeting_service.get_meeting(meeting_id)
-        return jsonify(meeting.to_dict())
+        return jsonify(meeting_service.get_meeting_detail(meeting_id, version=version))
     except LookupError as e:
         return jsonify({"error": str(e)}), 404
 
@@ -39,10 +70,14 @@ def get_meeting(meeting_id):
 @meetings_bp.route("/api/meetings/<int:meeting_id>/start", methods=["PATCH"])
 def start_meeting(meeting_id):
     try:
-        meeting = meeting_service.start_meeting(meeting_id)
+        meeting = meeting_service.start_meeting(
+            meeting_id, expected_version=if_match_version(meeting_id)
+        )
         return jsonify(meeting.to_dict())
     except LookupError as e:
         return jsonify({"error": str(e)}), 404
+    except ConflictError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
 
@@ -50,9 +85,13 @@ def start_meeting(meeting_id):
 @meetings_bp.route("/api/meetings/<int:meeting_id>/close", methods=["PATCH"])
 def close_meeting(meeting_id):
     try:
-        meeting = meeting_service.close_meeting(meeting_id)
+        meeting = meeting_service.close_meeting(
+            meeting_id, expected_version=if_match_version(meeting_id)
+        )
         return jsonify(meeting.to_dict())
     except LookupError as e:
         return jsonify({"error": str(e)}), 404
+    except ConflictError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
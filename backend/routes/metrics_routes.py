@@ -0,0 +1,13 @@
+"""Prometheus metrics endpoint."""
+
+from flask import Blueprint, Response
+from services.metrics import metrics
+
+metrics_bp = Blueprint("metrics", __name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@metrics_bp.route("/api/metrics", methods=["GET"])
+def get_metrics():
+    return Response(metrics.render(), content_type=CONTENT_TYPE)
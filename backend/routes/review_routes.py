@@ -1,7 +1,10 @@
 """Review API routes."""
 
 from flask import Blueprint, request, jsonify
+from routes.conditional import if_match_version
 from services import review_service
+from services.meeting_service import ConflictError
+from services.job_queue import jobs
 
 reviews_bp = Blueprint("reviews", __name__)
 
@@ -15,9 +18,22 @@ def create_review(meeting_id):
             summary=data.get("summary", ""),
             outcome_rating=data.get("outcome_rating"),
             followup_required=data.get("followup_required", False),
+            expected_version=if_match_version(meeting_id),
         )
         return jsonify(review.to_dict()), 201
     except LookupError as e:
         return jsonify({"error": str(e)}), 404
+    except ConflictError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
+
+
+@reviews_bp.route("/api/meetings/<int:meeting_id>/review-draft", methods=["GET"])
+def get_review_draft(meeting_id):
+    """Review summary drafted in the background when the meeting closed."""
+    try:
+        job = jobs.latest(f"review_draft:{meeting_id}")
+    except LookupError as e:
+        return jsonify({"error": str(e)}), 404
+    return jsonify({"status": job.status, "draft": job.result})
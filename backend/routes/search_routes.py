@@ -0,0 +1,22 @@
+"""Full-text search API route."""
+
+from flask import Blueprint, request, jsonify
+from routes.conditional import conditional
+from services import meeting_service, search_service
+from services.pagination import parse_limit
+
+search_bp = Blueprint("search", __name__)
+
+
+@search_bp.route("/api/search", methods=["GET"])
+@conditional(meeting_service.get_global_version)
+def search(version):
+    try:
+        results = search_service.search(
+            request.args.get("q", ""),
+            types=search_service.parse_types(request.args.get("type")),
+            limit=parse_limit(request.args.get("limit"), default=search_service.DEFAULT_LIMIT),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"results": results})
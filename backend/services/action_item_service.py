@@ -3,32 +3,37 @@
 import logging
 from datetime import date, datetime
 
+from sqlalchemy import func, tuple_
+
 from models import db, ActionItem
-from services.meeting_service import get_meeting
+from models.action_item import owner_key
+from services.batch import BatchValidationError, bulk_insert, check_batch
+from services.meeting_service import get_meeting, meeting_changed, touch_meeting
+from services.pagination import DEFAULT_LIMIT, decode_cursor, encode_cursor
+from services.unit_of_work import unit_of_work
 
 logger = logging.getLogger(__name__)
 
+ACTION_STATUSES = ("Open", "Completed")
 
-def create_action_item(
-    meeting_id: int, description: str, owner: str, deadline: str
-) -> ActionItem:
-    """Create an action item for a meeting.
-
-    Rules:
-        - Meeting must be InProgress
-        - Owner required
-        - Deadline required and must be future
-    """
-    meeting = get_meeting(meeting_id)
 
+def _check_accepts_actions(meeting) -> None:
     if meeting.status not in ("Scheduled", "InProgress"):
         raise ValueError(
             f"Cannot add action items when meeting is {meeting.status}."
         )
 
-    if not description or not description.strip():
+
+def _validate_item(
+    description, owner, deadline, historical: bool = False
+) -> tuple[str, str, date]:
+    """Validate one action item's fields; return the cleaned values.
+
+    ``historical`` (bulk import of past meetings) allows past deadlines.
+    """
+    if not isinstance(description, str) or not description.strip():
         raise ValueError("Description is required.")
-    if not owner or not owner.strip():
+    if not isinstance(owner, str) or not owner.strip():
         raise ValueError("Owner is required.")
     if not deadline:
         raise ValueError("Deadline is required.")
@@ -39,18 +44,37 @@ def create_action_item(
         else deadline
     )
 
-    if deadline_date <= date.today():
+    if not historical and deadline_date <= date.today():
         raise ValueError("Deadline must be a future date.")
+    return description.strip(), owner.strip(), deadline_date
 
-    action = ActionItem(
-        meeting_id=meeting_id,
-        description=description.strip(),
-        owner=owner.strip(),
-        deadline=deadline_date,
-        status="Open",
-    )
-    db.session.add(action)
-    db.session.commit()
+
+def create_action_item(
+    meeting_id: int, description: str, owner: str, deadline: str
+) -> ActionItem:
+    """Create an action item for a meeting.
+
+    Rules:
+        - Meeting must be InProgress
+        - Owner required
+        - Deadline required and must be future
+    """
+    meeting = get_meeting(meeting_id)
+    _check_accepts_actions(meeting)
+    description, owner, deadline_date = _validate_item(description, owner, deadline)
+
+    with unit_of_work():
+        action = ActionItem(
+            meeting_id=meeting_id,
+            description=description,
+            owner=owner,
+            deadline=deadline_date,
+            status="Open",
+        )
+        db.session.add(action)
+        touch_meeting(meeting_id, expected_status=meeting.status)
+        db.session.flush()
+        meeting_changed(meeting_id, "action.created", {"item": action.to_dict()})
 
     logger.info(
         "Action item created: id=%s meeting=%s owner=%s deadline=%s",
@@ -62,6 +86,53 @@ def create_action_item(
     return action
 
 
+def create_action_items(meeting_id: int, items: list[dict]) -> list[ActionItem]:
+    """Create a batch of action items in one transaction.
+
+    The meeting is loaded and checked once; every item is validated with the
+    same rules as ``create_action_item``. If any item fails, a
+    BatchValidationError lists every failure and nothing is inserted;
+    otherwise all rows go in with a single multi-row INSERT.
+    """
+    check_batch(items)
+    meeting = get_meeting(meeting_id)
+    _check_accepts_actions(meeting)
+
+    rows, errors = [], []
+    for index, raw in enumerate(items):
+        try:
+            if not isinstance(raw, dict):
+                raise ValueError("Item must be an object.")
+            description, owner, deadline_date = _validate_item(
+                raw.get("description"), raw.get("owner"), raw.get("deadline")
+            )
+        except ValueError as e:
+            errors.append({"index": index, "error": str(e)})
+            continue
+        rows.append(
+            {
+                "meeting_id": meeting_id,
+                "description": description,
+                "owner": owner,
+                "deadline": deadline_date,
+                "status": "Open",
+            }
+        )
+
+    if errors:
+        raise BatchValidationError(errors)
+
+    with unit_of_work():
+        created = bulk_insert(ActionItem, rows)
+        touch_meeting(meeting_id, expected_status=meeting.status)
+        meeting_changed(
+            meeting_id, "action.created", {"items": [a.to_dict() for a in created]}
+        )
+
+    logger.info("Action item batch created: meeting=%s count=%s", meeting_id, len(created))
+    return created
+
+
 def complete_action_item(action_id: int) -> ActionItem:
     """Mark an action item as Completed."""
     action = db.session.get(ActionItem, action_id)
@@ -72,8 +143,10 @@ def complete_action_item(action_id: int) -> ActionItem:
     if meeting.status == "Reviewed":
         raise ValueError("Cannot modify action items after meeting is Reviewed.")
 
-    action.status = "Completed"
-    db.session.commit()
+    with unit_of_work():
+        action.status = "Completed"
+        touch_meeting(meeting.id, expected_status=meeting.status)
+        meeting_changed(action.meeting_id, "action.completed", {"item": action.to_dict()})
 
     logger.info("Action item %s completed.", action_id)
     return action
@@ -83,3 +156,93 @@ def get_actions_for_meeting(meeting_id: int):
     """Return all action items for a meeting with overdue computed."""
     _ = get_meeting(meeting_id)  # validates meeting exists
     return ActionItem.query.filter_by(meeting_id=meeting_id).all()
+
+
+def _deadline_page(query, limit: int, cursor: str | None):
+    """Keyset page of ``query`` on ``(deadline, id)``: ``(actions, next_cursor)``."""
+    if cursor:
+        raw_deadline, last_id = decode_cursor(cursor, 2)
+        try:
+            last_deadline = date.fromisoformat(raw_deadline)
+            last_id = int(last_id)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid cursor.")
+        query = query.filter(
+            tuple_(ActionItem.deadline, ActionItem.id) > (last_deadline, last_id)
+        )
+
+    rows = (
+        query.order_by(ActionItem.deadline.asc(), ActionItem.id.asc())
+        .limit(limit + 1)
+        .all()
+    )
+    actions, extra = rows[:limit], rows[limit:]
+    next_cursor = None
+    if extra:
+        last = actions[-1]
+        next_cursor = encode_cursor(last.deadline.isoformat(), last.id)
+    return actions, next_cursor
+
+
+def get_open_actions_page(
+    overdue: bool = False, limit: int = DEFAULT_LIMIT, cursor: str | None = None
+):
+    """Return one page of open action items by soonest deadline.
+
+    Keyset-paged on ``(deadline, id)``; with ``overdue`` only items whose
+    deadline is before ``CURRENT_DATE`` are returned.
+    """
+    query = ActionItem.query.filter(ActionItem.status == "Open")
+    if overdue:
+        query = query.filter(ActionItem.is_overdue)
+    return _deadline_page(query, limit, cursor)
+
+
+def _parse_date(raw, name: str) -> date | None:
+    if not raw:
+        return None
+    try:
+        return date.fromisoformat(raw)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be an ISO 8601 date (YYYY-MM-DD).")
+
+
+def get_owner_actions_page(
+    owner: str,
+    status: str | None = None,
+    overdue: bool = False,
+    deadline_from: str | None = None,
+    deadline_to: str | None = None,
+    limit: int = DEFAULT_LIMIT,
+    cursor: str | None = None,
+):
+    """Return one page of an owner's action items by soonest deadline.
+
+    ``owner`` matches case- and whitespace-insensitively (``owner_key``).
+    ``deadline_from`` / ``deadline_to`` are inclusive ISO dates. Served by
+    the ``(owner_key, status, deadline, id)`` index: with a ``status`` (or
+    ``overdue``, which implies Open) each page is a single index range scan.
+    """
+    key = owner_key(owner or "")
+    if not key:
+        raise ValueError("Owner is required.")
+    if status is not None and status not in ACTION_STATUSES:
+        raise ValueError(f"Status must be one of: {', '.join(ACTION_STATUSES)}.")
+    start = _parse_date(deadline_from, "deadline_from")
+    end = _parse_date(deadline_to, "deadline_to")
+    if start and end and start > end:
+        raise ValueError("deadline_from must not be after deadline_to.")
+
+    query = ActionItem.query.filter(ActionItem.owner_key == key)
+    if overdue:
+        if status == "Completed":
+            return [], None
+        status = "Open"
+        query = query.filter(ActionItem.deadline < func.current_date())
+    if status is not None:
+        query = query.filter(ActionItem.status == status)
+    if start:
+        query = query.filter(ActionItem.deadline >= start)
+    if end:
+        query = query.filter(ActionItem.deadline <= end)
+    return _deadline_page(query, limit, cursor)
@@ -2,51 +2,105 @@
 
 import logging
 
-from models import db, AgendaItem
-from services.meeting_service import get_meeting
+from sqlalchemy import delete, update
+
+from models import db, AgendaItem, Meeting
+from services.batch import BatchValidationError, bulk_insert, check_batch
+from services.meeting_service import (
+    ConflictError,
+    get_meeting,
+    meeting_changed,
+    touch_meeting,
+)
+from services.unit_of_work import unit_of_work
 
 logger = logging.getLogger(__name__)
 
 
-def add_agenda_item(meeting_id: int, topic: str, time_allocation: int) -> AgendaItem:
-    """Add an agenda item to a meeting.
+def _check_budget(meeting, minutes: int, verb: str, released: int = 0) -> None:
+    """Reject ``minutes`` more agenda time (after freeing ``released``) if it
+    does not fit the meeting's remaining duration."""
+    remaining = meeting.duration_minutes - meeting.allocated_minutes + released
+    if minutes > remaining:
+        raise ValueError(
+            f"Cannot {verb} {minutes} min — only {remaining} min remaining "
+            f"out of {meeting.duration_minutes} min meeting."
+        )
 
-    Rules:
-        - Meeting must be Scheduled (cannot add once started)
-        - Topic required
-        - Time allocation must be positive
-        - Total agenda time cannot exceed meeting duration
+
+def _allocate(meeting, delta: int) -> None:
+    """Move the meeting's ``allocated_minutes`` counter by ``delta``.
+
+    The counter changes in the same UPDATE that bumps the version, guarded
+    in SQL so it can never exceed ``duration_minutes``: of two concurrent
+    edits that each fit on their own but not together, the second matches
+    no row and gets ConflictError.
     """
-    meeting = get_meeting(meeting_id)
+    touch_meeting(
+        meeting.id,
+        expected_status=meeting.status,
+        guard=Meeting.allocated_minutes + delta <= Meeting.duration_minutes,
+        allocated_minutes=Meeting.allocated_minutes + delta,
+    )
+
+
+def _item_changed(item_id: int) -> ConflictError:
+    return ConflictError(
+        f"Agenda item {item_id} was modified concurrently. Reload and retry."
+    )
 
+
+def _check_scheduled(meeting) -> None:
     if meeting.status != "Scheduled":
         raise ValueError(
             f"Cannot modify agenda when meeting is {meeting.status}. "
             "Agenda can only be added when meeting is Scheduled."
         )
 
-    if not topic or not topic.strip():
-        raise ValueError("Topic is required.")
 
-    if time_allocation is None or time_allocation <= 0:
+def _validate_allocation(time_allocation) -> int:
+    if (
+        not isinstance(time_allocation, int)
+        or isinstance(time_allocation, bool)
+        or time_allocation <= 0
+    ):
         raise ValueError("Time allocation must be a positive integer.")
+    return time_allocation
+
+
+def _validate_item(topic, time_allocation) -> tuple[str, int]:
+    """Validate one agenda item's fields; return the cleaned values."""
+    if not isinstance(topic, str) or not topic.strip():
+        raise ValueError("Topic is required.")
+    return topic.strip(), _validate_allocation(time_allocation)
+
+
+def add_agenda_item(meeting_id: int, topic: str, time_allocation: int) -> AgendaItem:
+    """Add an agenda item to a meeting.
+
+    Rules:
+        - Meeting must be Scheduled (cannot add once started)
+        - Topic required
+        - Time allocation must be positive
+        - Total agenda time cannot exceed meeting duration
+    """
+    meeting = get_meeting(meeting_id)
+    _check_scheduled(meeting)
+    topic, time_allocation = _validate_item(topic, time_allocation)
 
     # Check total agenda time doesn't exceed meeting duration
-    current_total = sum(a.time_allocation for a in meeting.agenda_items)
-    if current_total + time_allocation > meeting.duration_minutes:
-        remaining = meeting.duration_minutes - current_total
-        raise ValueError(
-            f"Cannot add {time_allocation} min — only {remaining} min remaining "
-            f"out of {meeting.duration_minutes} min meeting."
+    _check_budget(meeting, time_allocation, "add")
+
+    with unit_of_work():
+        _allocate(meeting, time_allocation)
+        item = AgendaItem(
+            meeting_id=meeting_id,
+            topic=topic,
+            time_allocation=time_allocation,
         )
-
-    item = AgendaItem(
-        meeting_id=meeting_id,
-        topic=topic.strip(),
-        time_allocation=time_allocation,
-    )
-    db.session.add(item)
-    db.session.commit()
+        db.session.add(item)
+        db.session.flush()
+        meeting_changed(meeting_id, "agenda.added", {"item": item.to_dict()})
 
     logger.info(
         "Agenda item added: id=%s meeting=%s topic=%s",
@@ -57,6 +111,52 @@ def add_agenda_item(meeting_id: int, topic: str, time_allocation: int) -> Agenda
     return item
 
 
+def add_agenda_items(meeting_id: int, items: list[dict]) -> list[AgendaItem]:
+    """Add a batch of agenda items in one transaction.
+
+    The meeting is loaded and checked once and every item is validated
+    against the same rules as ``add_agenda_item`` (including the running
+    duration budget). If any item fails, a BatchValidationError lists every
+    failure and nothing is inserted; otherwise all rows go in with a single
+    multi-row INSERT.
+    """
+    check_batch(items)
+    meeting = get_meeting(meeting_id)
+    _check_scheduled(meeting)
+
+    allocated = meeting.allocated_minutes
+    rows, errors = [], []
+    for index, raw in enumerate(items):
+        try:
+            if not isinstance(raw, dict):
+                raise ValueError("Item must be an object.")
+            topic, minutes = _validate_item(raw.get("topic"), raw.get("time_allocation"))
+            if allocated + minutes > meeting.duration_minutes:
+                raise ValueError(
+                    f"Cannot add {minutes} min — only "
+                    f"{meeting.duration_minutes - allocated} min remaining "
+                    f"out of {meeting.duration_minutes} min meeting."
+                )
+        except ValueError as e:
+            errors.append({"index": index, "error": str(e)})
+            continue
+        allocated += minutes
+        rows.append({"meeting_id": meeting_id, "topic": topic, "time_allocation": minutes})
+
+    if errors:
+        raise BatchValidationError(errors)
+
+    with unit_of_work():
+        _allocate(meeting, allocated - meeting.allocated_minutes)
+        created = bulk_insert(AgendaItem, rows)
+        meeting_changed(
+            meeting_id, "agenda.added", {"items": [i.to_dict() for i in created]}
+        )
+
+    logger.info("Agenda batch added: meeting=%s count=%s", meeting_id, len(created))
+    return created
+
+
 def update_agenda_item(item_id: int, time_allocation: int) -> AgendaItem:
     """Update an agenda item's time allocation.
 
@@ -75,22 +175,24 @@ def update_agenda_item(item_id: int, time_allocation: int) -> AgendaItem:
             f"Cannot modify agenda when meeting is {meeting.status}."
         )
 
-    if time_allocation is None or time_allocation <= 0:
-        raise ValueError("Time allocation must be a positive integer.")
+    time_allocation = _validate_allocation(time_allocation)
 
     # Check total (excluding this item) + new value doesn't exceed duration
-    other_total = sum(
-        a.time_allocation for a in meeting.agenda_items if a.id != item_id
-    )
-    if other_total + time_allocation > meeting.duration_minutes:
-        remaining = meeting.duration_minutes - other_total
-        raise ValueError(
-            f"Cannot set {time_allocation} min — only {remaining} min remaining "
-            f"out of {meeting.duration_minutes} min meeting."
-        )
-
-    item.time_allocation = time_allocation
-    db.session.commit()
+    previous = item.time_allocation
+    _check_budget(meeting, time_allocation, "set", released=previous)
+
+    with unit_of_work():
+        _allocate(meeting, time_allocation - previous)
+        # Compare-and-swap on the old value keeps the counter exact when
+        # the same item is edited twice at once
+        changed = db.session.execute(
+            update(AgendaItem)
+            .where(AgendaItem.id == item_id, AgendaItem.time_allocation == previous)
+            .values(time_allocation=time_allocation)
+        ).rowcount
+        if changed != 1:
+            raise _item_changed(item_id)
+        meeting_changed(meeting.id, "agenda.updated", {"item": item.to_dict()})
 
     logger.info("Agenda item %s updated to %s min.", item_id, time_allocation)
     return item
@@ -112,6 +214,16 @@ def delete_agenda_item(item_id: int) -> None:
             f"Cannot modify agenda when meeting is {meeting.status}."
         )
 
-    db.session.delete(item)
-    db.session.commit()
+    meeting_id = meeting.id
+    with unit_of_work():
+        _allocate(meeting, -item.time_allocation)
+        deleted = db.session.execute(
+            delete(AgendaItem).where(
+                AgendaItem.id == item_id,
+                AgendaItem.time_allocation == item.time_allocation,
+            )
+        ).rowcount
+        if deleted != 1:
+            raise _item_changed(item_id)
+        meeting_changed(meeting_id, "agenda.deleted", {"id": item_id})
     logger.info("Agenda item %s deleted.", item_id)
@@ -0,0 +1,237 @@
+"""Content-addressed memoization of AI suggestions.
+
+Requests are keyed by a SHA-256 of their normalized inputs — case, runs of
+whitespace and trailing punctuation are ignored, and review summaries only
+depend on the action items' statuses — so "Weekly Sync" and "weekly  sync."
+share one entry. Only validated provider output is stored; heuristic
+fallbacks are never cached.
+
+Entries always live in an in-process LRU with TTL. ``AI_CACHE_BACKEND=database``
+adds the ``ai_suggestions`` table behind it, shared by every worker and kept
+across restarts; ``none`` disables memoization.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+
+from models import AISuggestion, db
+from services.cache_service import MemoryBackend
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 86400
+DEFAULT_MAX_ENTRIES = 4096
+# Writes between LRU trims of the database tier
+DEFAULT_EVICT_EVERY = 64
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize_text(value) -> str:
+    return _WHITESPACE.sub(" ", str(value)).strip().rstrip(".!?:;,").strip().casefold()
+
+
+def _key_inputs(task: str, payload: dict):
+    title = _normalize_text(payload.get("title", ""))
+    if task == "suggest_agenda":
+        return [title, _normalize_text(payload.get("context", ""))]
+    if task == "suggest_actions":
+        return [title, [_normalize_text(t) for t in payload.get("agenda_topics", [])]]
+    if task == "summarize_review":
+        statuses = sorted(
+            _normalize_text(a.get("status", "")) if isinstance(a, dict) else ""
+            for a in payload.get("action_items", [])
+        )
+        return [title, statuses]
+    raise ValueError(f"Unknown AI task: {task}")
+
+
+def suggestion_key(task: str, payload: dict) -> str:
+    """Hash of the normalized inputs that determine a suggestion."""
+    raw = json.dumps([task, _key_inputs(task, payload)], separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class DatabaseBackend:
+    """``ai_suggestions`` table, LRU-trimmed to about ``max_entries`` rows.
+
+    Writes are upserts, so workers memoizing the same key concurrently both
+    succeed. Expired and least recently used rows are trimmed every
+    ``evict_every`` writes rather than on each one.
+    """
+
+    name = "database"
+
+    def __init__(
+        self,
+        engine,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        evict_every: int = DEFAULT_EVICT_EVERY,
+    ):
+        self.engine = engine
+        self.max_entries = max_entries
+        self.evict_every = evict_every
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        table = AISuggestion.__table__
+        now = datetime.now(timezone.utc)
+        with self.engine.begin() as conn:
+            row = conn.execute(
+                select(table.c.value).where(table.c.key == key, table.c.expires_at > now)
+            ).first()
+            if row is not None:
+                conn.execute(
+                    update(table).where(table.c.key == key).values(last_used_at=now)
+                )
+        return None if row is None else row.value
+
+    def _upsert(self, conn, values: dict) -> None:
+        table = AISuggestion.__table__
+        dialect = {"postgresql": postgresql, "sqlite": sqlite}.get(conn.dialect.name)
+        if dialect is None:
+            conn.execute(delete(table).where(table.c.key == values["key"]))
+            conn.execute(table.insert().values(**values))
+            return
+        stmt = dialect.insert(table).values(**values)
+        conn.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.key],
+                set_={c: stmt.excluded[c] for c in values if c != "key"},
+            )
+        )
+
+    def _evict(self, conn, now) -> None:
+        table = AISuggestion.__table__
+        # Walks ix_ai_suggestions_last_used_at newest first
+        stale = (
+            select(table.c.key)
+            .order_by(table.c.last_used_at.desc())
+            .offset(self.max_entries)
+        )
+        conn.execute(
+            delete(table).where(
+                (table.c.expires_at <= now) | table.c.key.in_(stale.scalar_subquery())
+            )
+        )
+
+    def set(self, key, task: str, value, ttl: int) -> None:
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % self.evict_every == 0
+        with self.engine.begin() as conn:
+            self._upsert(
+                conn,
+                {
+                    "key": key,
+                    "task": task,
+                    "value": value,
+                    "expires_at": now + timedelta(seconds=ttl),
+                    "last_used_at": now,
+                },
+            )
+            if evict:
+                self._evict(conn, now)
+
+    def clear(self) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(delete(AISuggestion.__table__))
+
+
+class SuggestionCache:
+    def __init__(self):
+        self.enabled = True
+        self.memory = MemoryBackend(DEFAULT_MAX_ENTRIES)
+        self.store = None
+        self.ttl = DEFAULT_TTL_SECONDS
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        kind = app.config.get("AI_CACHE_BACKEND", "memory")
+        max_entries = app.config.get("AI_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        self.enabled = kind != "none"
+        self.memory = MemoryBackend(max_entries)
+        self.ttl = app.config.get("AI_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)
+        self.store = None
+        if kind == "database":
+            with app.app_context():
+                self.store = DatabaseBackend(db.engine, max_entries)
+        logger.info("AI suggestion cache: %s (ttl=%ss)", kind, self.ttl)
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key: str):
+        if not self.enabled:
+            return None
+        value = self.memory.get(key)
+        if value is None and self.store is not None:
+            # An unreadable store is a miss: the caller computes or falls back
+            try:
+                value = self.store.get(key)
+            except SQLAlchemyError as e:
+                logger.warning("AI suggestion cache read failed: %r", e)
+            if value is not None:
+                self.memory.set(key, value, self.ttl)
+        self._count(value is not None)
+        return value
+
+    def set(self, key: str, task: str, value) -> None:
+        if not self.enabled:
+            return
+        self.memory.set(key, value, self.ttl)
+        if self.store is not None:
+            # The suggestion is already computed; a failed write only costs a miss
+            try:
+                self.store.set(key, task, value, self.ttl)
+            except SQLAlchemyError as e:
+                logger.warning("AI suggestion cache write failed: %r", e)
+
+    async def aget(self, key: str):
+        if self.store is None:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, task: str, value) -> None:
+        if self.store is None:
+            self.set(key, task, value)
+        else:
+            await asyncio.to_thread(self.set, key, task, value)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.store is not None:
+            self.store.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "backend": "none" if not self.enabled else (self.store or self.memory).name,
+            "entries": len(self.memory),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+suggestion_cache = SuggestionCache()
@@ -0,0 +1,274 @@
+"""Dispatch AI requests to the configured provider.
+
+All provider calls run on one private event loop thread, shared by Flask
+worker threads (``run``) and the ASGI loop (``arun``). There:
+
+- concurrent requests for the same task arriving within ``AI_BATCH_WINDOW_MS``
+  are coalesced into one ``complete_batch`` call (up to ``AI_MAX_BATCH``);
+- at most ``AI_MAX_CONCURRENCY`` provider calls are in flight per process;
+- every request waits at most ``AI_TIMEOUT_SECONDS``, and at most
+  ``AI_MAX_PENDING`` requests may wait at once.
+
+A request that times out, is shed, fails, or returns output that does not
+validate gets the caller's heuristic fallback instead, so a slow model
+degrades suggestions rather than tying up workers.
+
+Streamed requests (``stream`` / ``astream``) are not batched but share the
+concurrency limit; ``AI_TIMEOUT_SECONDS`` bounds the wait for each piece.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+
+from services.ai_providers import load_provider
+from services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class AIGateway:
+    def __init__(self):
+        self.provider = None
+        self.timeout = 5.0
+        self.max_concurrency = 4
+        self.batch_window = 0.01
+        self.max_batch = 16
+        self.max_pending = 256
+        self._loop = None
+        self._semaphore = None
+        self._pending = {}
+        self._timers = {}
+        self._waiting = 0
+        self._lock = threading.Lock()
+        self.fallbacks = 0
+
+    def init_app(self, app) -> None:
+        self.configure(
+            provider=load_provider(app.config.get("AI_PROVIDER", "heuristic")),
+            timeout=app.config.get("AI_TIMEOUT_SECONDS", 5.0),
+            max_concurrency=app.config.get("AI_MAX_CONCURRENCY", 4),
+            batch_window_ms=app.config.get("AI_BATCH_WINDOW_MS", 10),
+            max_batch=app.config.get("AI_MAX_BATCH", 16),
+            max_pending=app.config.get("AI_MAX_PENDING", 256),
+        )
+
+    def configure(
+        self,
+        provider=None,
+        timeout: float = 5.0,
+        max_concurrency: int = 4,
+        batch_window_ms: float = 10,
+        max_batch: int = 16,
+        max_pending: int = 256,
+    ) -> None:
+        self.provider = provider
+        self.timeout = float(timeout)
+        self.max_concurrency = int(max_concurrency)
+        self.batch_window = float(batch_window_ms) / 1000
+        self.max_batch = max(1, int(max_batch))
+        self.max_pending = int(max_pending)
+        self.fallbacks = 0
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._reset_semaphore)
+
+    # ─── Event loop thread ──────────────────────────────
+
+    def _reset_semaphore(self) -> None:
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="ai-gateway", daemon=True
+                ).start()
+                self._loop = loop
+                loop.call_soon_threadsafe(self._reset_semaphore)
+            return self._loop
+
+    async def _enqueue(self, task: str, payload: dict):
+        future = asyncio.get_running_loop().create_future()
+        batch = self._pending.setdefault(task, [])
+        batch.append((payload, future))
+        if len(batch) >= self.max_batch:
+            self._flush(task)
+        elif task not in self._timers:
+            self._timers[task] = asyncio.get_running_loop().call_later(
+                self.batch_window, self._flush, task
+            )
+        return await future
+
+    def _flush(self, task: str) -> None:
+        timer = self._timers.pop(task, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(task, [])
+        if batch:
+            asyncio.get_running_loop().create_task(self._call(task, batch))
+
+    async def _call(self, task: str, batch: list) -> None:
+        # Requests whose caller already gave up are not sent to the model
+        batch = [(p, f) for p, f in batch if not f.done()]
+        if not batch:
+            return
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                results = await self.provider.complete_batch(task, [p for p, _ in batch])
+                if len(results) != len(batch):
+                    raise ValueError(
+                        f"Provider returned {len(results)} results for {len(batch)} requests"
+                    )
+            except Exception as e:
+                metrics.ai_latency.observe(
+                    time.perf_counter() - started, task=task, mode="batch", outcome="error"
+                )
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            metrics.ai_latency.observe(
+                time.perf_counter() - started, task=task, mode="batch", outcome="ok"
+            )
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _produce(self, task: str, payload: dict, deliver) -> None:
+        started, outcome = None, "ok"
+        try:
+            async with self._semaphore:
+                started = time.perf_counter()
+                pieces = self.provider.stream(task, payload)
+                try:
+                    async for piece in pieces:
+                        deliver(("piece", piece))
+                finally:
+                    await pieces.aclose()
+        except Exception as e:
+            outcome = "error"
+            deliver(("error", e))
+        else:
+            deliver(("end", None))
+        if started is not None:
+            metrics.ai_latency.observe(
+                time.perf_counter() - started, task=task, mode="stream", outcome=outcome
+            )
+
+    def _admit(self) -> bool:
+        with self._lock:
+            if self._waiting >= self.max_pending:
+                return False
+            self._waiting += 1
+            return True
+
+    def _release(self, *_) -> None:
+        with self._lock:
+            self._waiting -= 1
+
+    def _submit(self, task: str, payload: dict):
+        """Schedule a request on the gateway loop; None if it must be shed."""
+        if not self._admit():
+            return None
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(self._enqueue(task, payload), self.timeout),
+            self._ensure_loop(),
+        )
+        future.add_done_callback(self._release)
+        return future
+
+    def _finish(self, task: str, raw, error, validate, fallback):
+        if error is None:
+            try:
+                return validate(raw)
+            except ValueError as e:
+                error = e
+        self.fallbacks += 1
+        metrics.ai_fallbacks.inc(task=task)
+        logger.warning("AI %s fell back to heuristics: %r", task, error)
+        return fallback()
+
+    # ─── Public API ─────────────────────────────────────
+
+    def run(self, task: str, payload: dict, validate, fallback):
+        """Blocking call for WSGI workers."""
+        if self.provider is None:
+            return fallback()
+        future = self._submit(task, payload)
+        if future is None:
+            return self._finish(task, None, "queue full", validate, fallback)
+        try:
+            raw, error = future.result(), None
+        except Exception as e:  # TimeoutError, provider failure
+            raw, error = None, e
+        return self._finish(task, raw, error, validate, fallback)
+
+    async def arun(self, task: str, payload: dict, validate, fallback):
+        """Awaitable call for the ASGI event loop."""
+        if self.provider is None:
+            return fallback()
+        future = self._submit(task, payload)
+        if future is None:
+            return self._finish(task, None, "queue full", validate, fallback)
+        try:
+            raw, error = await asyncio.wrap_future(future), None
+        except Exception as e:
+            raw, error = None, e
+        return self._finish(task, raw, error, validate, fallback)
+
+    def stream(self, task: str, payload: dict):
+        """Yield raw pieces from the provider; raises on timeout or failure."""
+        if not self._admit():
+            raise RuntimeError("AI request queue is full")
+        pieces = queue.Queue()
+        future = asyncio.run_coroutine_threadsafe(
+            self._produce(task, payload, pieces.put), self._ensure_loop()
+        )
+        try:
+            while True:
+                try:
+                    kind, value = pieces.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"AI {task} stream stalled") from None
+                if kind == "end":
+                    return
+                if kind == "error":
+                    raise value
+                yield value
+        finally:
+            future.cancel()
+            self._release()
+
+    async def astream(self, task: str, payload: dict):
+        """Async counterpart of ``stream`` for the ASGI event loop."""
+        if not self._admit():
+            raise RuntimeError("AI request queue is full")
+        loop = asyncio.get_running_loop()
+        pieces = asyncio.Queue()
+        future = asyncio.run_coroutine_threadsafe(
+            self._produce(
+                task, payload, lambda m: loop.call_soon_threadsafe(pieces.put_nowait, m)
+            ),
+            self._ensure_loop(),
+        )
+        try:
+            while True:
+                try:
+                    kind, value = await asyncio.wait_for(pieces.get(), self.timeout)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"AI {task} stream stalled") from None
+                if kind == "end":
+                    return
+                if kind == "error":
+                    raise value
+                yield value
+        finally:
+            future.cancel()
+            self._release()
+
+
+gateway = AIGateway()
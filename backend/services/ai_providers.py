@@ -0,0 +1,109 @@
+"""LLM provider backends for ``ai_service``.
+
+A provider answers a whole batch of same-task requests in one call:
+``complete_batch(task, payloads)`` returns one raw result per payload, in
+order. Raw results are untrusted — ``ai_service`` validates every one of
+them before anything reaches a client. ``stream(task, payload)`` yields one
+request's result piece by piece: each suggestion of a list task, or summary
+text fragments followed by the complete summary object.
+
+Tasks and payloads:
+    "suggest_agenda"   {"title", "context"}            -> [{"topic", "time_allocation"}]
+    "suggest_actions"  {"title", "agenda_topics"}      -> [{"description", ...}]
+    "summarize_review" {"title", "action_items"}       -> {"summary", "suggested_rating"}
+
+``AI_PROVIDER`` selects the backend: ``heuristic`` (no model, the built-in
+stubs), ``fake`` (deterministic, for tests and benchmarks) or a
+``package.module:ClassName`` import path for a real model client.
+"""
+
+import asyncio
+import hashlib
+import importlib
+
+
+class AIProvider:
+    """Interface every provider implements."""
+
+    name = "base"
+
+    async def complete_batch(self, task: str, payloads: list[dict]) -> list:
+        raise NotImplementedError
+
+    async def stream(self, task: str, payload: dict):
+        """Providers without native streaming emit the whole result at once."""
+        (result,) = await self.complete_batch(task, [payload])
+        for piece in result if isinstance(result, list) else [result]:
+            yield piece
+
+
+class FakeProvider(AIProvider):
+    """Deterministic provider: output depends only on the input.
+
+    ``latency`` (seconds) is awaited once per batch, like a model call, and
+    every batch size is recorded in ``batches`` so tests can assert on
+    request coalescing.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.batches = []
+
+    @staticmethod
+    def _seed(text: str) -> int:
+        return int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+
+    def _one(self, task: str, payload: dict):
+        title = payload.get("title", "")
+        if task == "suggest_agenda":
+            base = 5 + self._seed(title) % 11
+            return [
+                {"topic": f"Goals for {title}", "time_allocation": base},
+                {"topic": f"Risks and blockers: {title}", "time_allocation": base},
+                {"topic": "Decisions and owners", "time_allocation": 10},
+            ]
+        if task == "suggest_actions":
+            return [
+                {"description": f"Draft plan for {topic}", "owner": "", "deadline": ""}
+                for topic in payload.get("agenda_topics", [])[:3]
+            ]
+        if task == "summarize_review":
+            items = payload.get("action_items", [])
+            done = sum(1 for a in items if a.get("status") == "Completed")
+            return {
+                "summary": f"'{title}': {done} of {len(items)} action items completed.",
+                "suggested_rating": 4 if items and done == len(items) else 3,
+            }
+        raise ValueError(f"Unknown AI task: {task}")
+
+    async def complete_batch(self, task: str, payloads: list[dict]) -> list:
+        self.batches.append(len(payloads))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return [self._one(task, p) for p in payloads]
+
+    async def stream(self, task: str, payload: dict):
+        result = self._one(task, payload)
+        if isinstance(result, list):
+            pieces = result
+        else:
+            words = result["summary"].split(" ")
+            pieces = [word + " " for word in words[:-1]] + [words[-1], result]
+        for piece in pieces:
+            if self.latency:
+                await asyncio.sleep(self.latency / len(pieces))
+            yield piece
+
+
+def load_provider(spec: str):
+    """Build the provider named by ``AI_PROVIDER`` (None for heuristics)."""
+    if not spec or spec == "heuristic":
+        return None
+    if spec == "fake":
+        return FakeProvider()
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        raise ValueError(f"AI_PROVIDER must be 'heuristic', 'fake' or 'module:Class', got {spec!r}")
+    return getattr(importlib.import_module(module_name), class_name)()
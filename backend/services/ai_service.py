@@ -1,19 +1,42 @@
-"""AI-assisted features — stub service.
+"""AI-assisted features.
 
 AI outputs are treated as untrusted input.
 AI cannot modify meeting state, assign ownership, or change deadlines.
 All suggestions must pass backend validation before being persisted.
+
+Requests go to the configured provider through ``ai_gateway``; the
+heuristics below answer when no provider is configured or it is too slow.
+Validated provider output is memoized in ``ai_cache``.
+
+The ``stream_*`` functions emit the same results incrementally as NDJSON-ready
+events, validating every piece before it is yielded:
+
+    {"type": "suggestion", "suggestion": {...}}   one per valid suggestion
+    {"type": "fragment", "text": "..."}           summary text as it arrives
+    {"type": "summary", "summary": ..., "suggested_rating": ...}  final summary
+    {"type": "done", "fallback": bool}            last event of every stream
+
+If the provider fails before producing anything valid, the heuristic result
+is streamed instead; a summary always ends with an authoritative "summary"
+event that replaces the fragments shown so far.
 """
 
 import logging
 
+from services.ai_cache import suggestion_cache, suggestion_key
+from services.ai_gateway import gateway
+
 logger = logging.getLogger(__name__)
 
+MAX_SUGGESTIONS = 10
+MAX_TEXT_LENGTH = 500
+MAX_TIME_ALLOCATION = 240
 
-def suggest_agenda_topics(title: str, context: str = "") -> list[dict]:
-    """Suggest agenda topics based on meeting title."""
-    logger.info("AI: Generating agenda suggestions for '%s'", title)
-    # Stub — in production this would call an LLM
+
+# ─── Heuristic fallbacks ────────────────────────────────
+
+
+def _heuristic_agenda(title: str) -> list[dict]:
     return [
         {"topic": f"Review progress on {title}", "time_allocation": 10},
         {"topic": "Open discussion and blockers", "time_allocation": 10},
@@ -21,24 +44,14 @@ def suggest_agenda_topics(title: str, context: str = "") -> list[dict]:
     ]
 
 
-def suggest_action_items(meeting_title: str, agenda_topics: list[str]) -> list[dict]:
-    """Suggest action items based on meeting agenda."""
-    logger.info("AI: Generating action items for '%s'", meeting_title)
-    suggestions = []
-    for topic in agenda_topics[:3]:
-        suggestions.append(
-            {
-                "description": f"Follow up on: {topic}",
-                "owner": "",
-                "deadline": "",
-            }
-        )
-    return suggestions
+def _heuristic_actions(agenda_topics: list[str]) -> list[dict]:
+    return [
+        {"description": f"Follow up on: {topic}", "owner": "", "deadline": ""}
+        for topic in agenda_topics[:3]
+    ]
 
 
-def summarize_review(meeting_title: str, action_items: list[dict]) -> dict:
-    """Generate a review summary suggestion."""
-    logger.info("AI: Generating review summary for '%s'", meeting_title)
+def _heuristic_summary(meeting_title: str, action_items: list[dict]) -> dict:
     completed = sum(1 for a in action_items if a.get("status") == "Completed")
     total = len(action_items)
     return {
@@ -48,3 +61,319 @@ def summarize_review(meeting_title: str, action_items: list[dict]) -> dict:
         ),
         "suggested_rating": 3 if completed >= total // 2 else 2,
     }
+
+
+# ─── Output validation ──────────────────────────────────
+
+
+def _text(value, field: str) -> str:
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"AI output: {field} must be a non-empty string.")
+    return value.strip()[:MAX_TEXT_LENGTH]
+
+
+def validate_agenda_item(raw) -> dict:
+    if not isinstance(raw, dict):
+        raise ValueError("AI output: agenda suggestion must be an object.")
+    minutes = raw.get("time_allocation")
+    if (
+        not isinstance(minutes, int)
+        or isinstance(minutes, bool)
+        or not 0 < minutes <= MAX_TIME_ALLOCATION
+    ):
+        raise ValueError("AI output: time_allocation out of range.")
+    return {"topic": _text(raw.get("topic"), "topic"), "time_allocation": minutes}
+
+
+def validate_action_item(raw) -> dict:
+    if not isinstance(raw, dict):
+        raise ValueError("AI output: action suggestion must be an object.")
+    # Owners and deadlines are always left for a human to fill in
+    return {"description": _text(raw.get("description"), "description"), "owner": "", "deadline": ""}
+
+
+def validate_summary(raw) -> dict:
+    if not isinstance(raw, dict):
+        raise ValueError("AI output: review summary must be an object.")
+    rating = raw.get("suggested_rating")
+    if not isinstance(rating, int) or isinstance(rating, bool) or not 1 <= rating <= 5:
+        raise ValueError("AI output: suggested_rating must be 1-5.")
+    return {"summary": _text(raw.get("summary"), "summary"), "suggested_rating": rating}
+
+
+def _validate_list(validate_item):
+    def validate(raw) -> list[dict]:
+        if not isinstance(raw, list):
+            raise ValueError("AI output: expected a list of suggestions.")
+        items = []
+        for entry in raw[:MAX_SUGGESTIONS]:
+            try:
+                items.append(validate_item(entry))
+            except ValueError as e:
+                logger.info("Dropping invalid AI suggestion: %s", e)
+        if not items:
+            raise ValueError("AI output: no valid suggestions.")
+        return items
+
+    return validate
+
+
+_validate_agenda = _validate_list(validate_agenda_item)
+_validate_actions = _validate_list(validate_action_item)
+
+
+# ─── Requests ───────────────────────────────────────────
+
+
+def _agenda_request(title: str, context: str):
+    return (
+        "suggest_agenda",
+        {"title": title, "context": context},
+        _validate_agenda,
+        lambda: _heuristic_agenda(title),
+    )
+
+
+def _actions_request(meeting_title: str, agenda_topics: list[str]):
+    return (
+        "suggest_actions",
+        {"title": meeting_title, "agenda_topics": list(agenda_topics)},
+        _validate_actions,
+        lambda: _heuristic_actions(agenda_topics),
+    )
+
+
+def _summary_request(meeting_title: str, action_items: list[dict]):
+    return (
+        "summarize_review",
+        {"title": meeting_title, "action_items": list(action_items)},
+        validate_summary,
+        lambda: _heuristic_summary(meeting_title, action_items),
+    )
+
+
+def _keeping(validate, kept: dict):
+    """Wrap ``validate`` to record output that came from the provider."""
+
+    def wrapped(raw):
+        kept["value"] = validate(raw)
+        return kept["value"]
+
+    return wrapped
+
+
+def _run(task: str, payload: dict, validate, fallback):
+    if gateway.provider is None:
+        return fallback()
+    key = suggestion_key(task, payload)
+    cached = suggestion_cache.get(key)
+    if cached is not None:
+        return cached
+    kept = {}
+    result = gateway.run(task, payload, _keeping(validate, kept), fallback)
+    if "value" in kept:
+        suggestion_cache.set(key, task, result)
+    return result
+
+
+async def _arun(task: str, payload: dict, validate, fallback):
+    if gateway.provider is None:
+        return fallback()
+    key = suggestion_key(task, payload)
+    cached = await suggestion_cache.aget(key)
+    if cached is not None:
+        return cached
+    kept = {}
+    result = await gateway.arun(task, payload, _keeping(validate, kept), fallback)
+    if "value" in kept:
+        await suggestion_cache.aset(key, task, result)
+    return result
+
+
+def suggest_agenda_topics(title: str, context: str = "") -> list[dict]:
+    """Suggest agenda topics based on meeting title."""
+    logger.info("AI: Generating agenda suggestions for '%s'", title)
+    return _run(*_agenda_request(title, context))
+
+
+def suggest_action_items(meeting_title: str, agenda_topics: list[str]) -> list[dict]:
+    """Suggest action items based on meeting agenda."""
+    logger.info("AI: Generating action items for '%s'", meeting_title)
+    return _run(*_actions_request(meeting_title, agenda_topics))
+
+
+def summarize_review(meeting_title: str, action_items: list[dict]) -> dict:
+    """Generate a review summary suggestion."""
+    logger.info("AI: Generating review summary for '%s'", meeting_title)
+    return _run(*_summary_request(meeting_title, action_items))
+
+
+# Async variants for the ASGI serving mode — same contract as above.
+
+
+async def suggest_agenda_topics_async(title: str, context: str = "") -> list[dict]:
+    return await _arun(*_agenda_request(title, context))
+
+
+async def suggest_action_items_async(
+    meeting_title: str, agenda_topics: list[str]
+) -> list[dict]:
+    return await _arun(*_actions_request(meeting_title, agenda_topics))
+
+
+async def summarize_review_async(meeting_title: str, action_items: list[dict]) -> dict:
+    return await _arun(*_summary_request(meeting_title, action_items))
+
+
+# ─── Streaming ──────────────────────────────────────────
+
+
+class _ListStream:
+    """Validate a streamed list of suggestions one item at a time."""
+
+    def __init__(self, validate_item, fallback):
+        self.validate_item = validate_item
+        self.fallback = fallback
+        self.items = []
+        self.result = None
+
+    @property
+    def full(self) -> bool:
+        return len(self.items) >= MAX_SUGGESTIONS
+
+    def replay(self, cached) -> list[dict]:
+        return [{"type": "suggestion", "suggestion": item} for item in cached] + [
+            {"type": "done", "fallback": False}
+        ]
+
+    def feed(self, raw) -> list[dict]:
+        if self.full:
+            return []
+        try:
+            item = self.validate_item(raw)
+        except ValueError as e:
+            logger.info("Dropping invalid AI suggestion: %s", e)
+            return []
+        self.items.append(item)
+        return [{"type": "suggestion", "suggestion": item}]
+
+    def finish(self, completed: bool) -> list[dict]:
+        if self.items:
+            if completed:
+                self.result = self.items
+            return [{"type": "done", "fallback": False}]
+        return self.replay(self.fallback())[:-1] + [{"type": "done", "fallback": True}]
+
+
+class _SummaryStream:
+    """Pass summary text fragments through, then validate the final summary."""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.length = 0
+        self.final = None
+        self.result = None
+
+    def replay(self, cached) -> list[dict]:
+        return [{"type": "summary", **cached}, {"type": "done", "fallback": False}]
+
+    def feed(self, raw) -> list[dict]:
+        if isinstance(raw, str):
+            text = raw[: max(0, MAX_TEXT_LENGTH - self.length)]
+            self.length += len(text)
+            return [{"type": "fragment", "text": text}] if text else []
+        try:
+            self.final = validate_summary(raw)
+        except ValueError as e:
+            logger.info("Dropping invalid AI summary: %s", e)
+        return []
+
+    def finish(self, completed: bool) -> list[dict]:
+        if self.final is not None and completed:
+            self.result = self.final
+            return self.replay(self.final)
+        return [
+            {"type": "summary", **self.fallback()},
+            {"type": "done", "fallback": True},
+        ]
+
+
+def _stream(task: str, payload: dict, state):
+    key = suggestion_key(task, payload)
+    if gateway.provider is None:
+        yield from state.finish(False)
+        return
+    cached = suggestion_cache.get(key)
+    if cached is not None:
+        yield from state.replay(cached)
+        return
+    completed = False
+    try:
+        for raw in gateway.stream(task, payload):
+            yield from state.feed(raw)
+        completed = True
+    except Exception as e:
+        logger.warning("AI %s stream fell back: %r", task, e)
+    yield from state.finish(completed)
+    if state.result is not None:
+        suggestion_cache.set(key, task, state.result)
+
+
+async def _astream(task: str, payload: dict, state):
+    key = suggestion_key(task, payload)
+    if gateway.provider is None:
+        for event in state.finish(False):
+            yield event
+        return
+    cached = await suggestion_cache.aget(key)
+    if cached is not None:
+        for event in state.replay(cached):
+            yield event
+        return
+    completed = False
+    try:
+        async for raw in gateway.astream(task, payload):
+            for event in state.feed(raw):
+                yield event
+        completed = True
+    except Exception as e:
+        logger.warning("AI %s stream fell back: %r", task, e)
+    for event in state.finish(completed):
+        yield event
+    if state.result is not None:
+        await suggestion_cache.aset(key, task, state.result)
+
+
+def _stream_args(request):
+    task, payload, _, fallback = request
+    if task == "summarize_review":
+        return task, payload, _SummaryStream(fallback)
+    validate_item = validate_agenda_item if task == "suggest_agenda" else validate_action_item
+    return task, payload, _ListStream(validate_item, fallback)
+
+
+def stream_agenda_topics(title: str, context: str = ""):
+    logger.info("AI: Streaming agenda suggestions for '%s'", title)
+    return _stream(*_stream_args(_agenda_request(title, context)))
+
+
+def stream_action_items(meeting_title: str, agenda_topics: list[str]):
+    logger.info("AI: Streaming action items for '%s'", meeting_title)
+    return _stream(*_stream_args(_actions_request(meeting_title, agenda_topics)))
+
+
+def stream_review_summary(meeting_title: str, action_items: list[dict]):
+    logger.info("AI: Streaming review summary for '%s'", meeting_title)
+    return _stream(*_stream_args(_summary_request(meeting_title, action_items)))
+
+
+def stream_agenda_topics_async(title: str, context: str = ""):
+    return _astream(*_stream_args(_agenda_request(title, context)))
+
+
+def stream_action_items_async(meeting_title: str, agenda_topics: list[str]):
+    return _astream(*_stream_args(_actions_request(meeting_title, agenda_topics)))
+
+
+def stream_review_summary_async(meeting_title: str, action_items: list[dict]):
+    return _astream(*_stream_args(_summary_request(meeting_title, action_items)))
@@ -0,0 +1,74 @@
+"""Async database access for the ASGI serving mode (``asgi.py``).
+
+Uses SQLAlchemy's asyncio engine when the configured driver has an async
+counterpart: psycopg v3 is async-capable as-is, SQLite needs ``aiosqlite``.
+Otherwise — including in-memory SQLite, which cannot be shared between
+two engines — queries run through the regular Flask-SQLAlchemy session on a
+worker thread, so the async routes keep working everywhere.
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import select
+
+from models import Meeting, db
+
+logger = logging.getLogger(__name__)
+
+_engine = None
+_flask_app = None
+
+
+def async_url(sync_url: str) -> str | None:
+    """Map a sync SQLAlchemy URL to its async-driver form, if there is one."""
+    if sync_url.startswith("postgresql+psycopg://"):
+        return sync_url
+    if sync_url.startswith("sqlite:///") and ":memory:" not in sync_url:
+        try:
+            import aiosqlite  # noqa: F401
+        except ImportError:
+            return None
+        return sync_url.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+    return None
+
+
+def init_async_db(flask_app) -> None:
+    global _engine, _flask_app
+    _flask_app = flask_app
+    url = async_url(flask_app.config["SQLALCHEMY_DATABASE_URI"])
+    if url is None:
+        logger.info("Async DB: no async driver, using worker-thread fallback.")
+        return
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    _engine = create_async_engine(url, pool_pre_ping=True, pool_recycle=300)
+    logger.info("Async DB engine: %s", _engine.dialect.driver)
+
+
+async def dispose_async_db() -> None:
+    global _engine
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+
+
+async def scalar(stmt):
+    """Execute a SELECT and return its first column of the first row."""
+    if _engine is not None:
+        async with _engine.connect() as conn:
+            return await conn.scalar(stmt)
+
+    def _run():
+        with _flask_app.app_context():
+            return db.session.scalar(stmt)
+
+    return await asyncio.to_thread(_run)
+
+
+async def get_meeting_version(meeting_id: int) -> int:
+    """Async twin of ``meeting_service.get_meeting_version``."""
+    version = await scalar(select(Meeting.version).where(Meeting.id == meeting_id))
+    if version is None:
+        raise LookupError(f"Meeting {meeting_id} not found.")
+    return version
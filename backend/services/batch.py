@@ -0,0 +1,44 @@
+"""Helpers shared by the batch creation endpoints."""
+
+from sqlalchemy import insert
+
+from models import db
+
+MAX_BATCH_SIZE = 1000
+
+
+class BatchValidationError(ValueError):
+    """Raised when one or more items of a batch fail validation.
+
+    ``errors`` is a list of ``{"index": i, "error": message}`` entries, one
+    per rejected item, in input order. Nothing from the batch is persisted.
+    """
+
+    def __init__(self, errors: list[dict]):
+        self.errors = errors
+        super().__init__(f"{len(errors)} item(s) in the batch are invalid.")
+
+
+def check_batch(items) -> None:
+    """Validate the batch envelope itself (type and size)."""
+    if not isinstance(items, list) or not items:
+        raise ValueError("Items must be a non-empty list.")
+    if len(items) > MAX_BATCH_SIZE:
+        raise ValueError(f"A batch may contain at most {MAX_BATCH_SIZE} items.")
+
+
+def bulk_insert(model, rows: list[dict]) -> list:
+    """Insert ``rows`` with multi-row INSERT ... RETURNING.
+
+    Returns the persisted instances in input order; the caller's unit of
+    work commits. SQLite numbers the rows of one INSERT in VALUES order, so
+    sorting by the generated id restores input order there (asking for
+    ``sort_by_parameter_order`` would make it fall back to one INSERT per
+    row). Other databases make no such promise, so the driver correlates
+    RETURNING rows with their parameters instead.
+    """
+    if db.session.get_bind().dialect.name != "sqlite":
+        stmt = insert(model).returning(model, sort_by_parameter_order=True)
+        return list(db.session.scalars(stmt, rows))
+    stmt = insert(model).returning(model)
+    return sorted(db.session.scalars(stmt, rows), key=lambda obj: obj.id)
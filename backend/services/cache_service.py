@@ -0,0 +1,182 @@
+"""Response cache for read endpoints, invalidated by service mutations.
+
+Cached values are the JSON-ready dicts that routes return. Entries live in
+namespaces ("dashboard", "meeting:<id>"); every namespace has a version
+token stored alongside the entries, and invalidating a namespace simply
+replaces its token, orphaning the old entries until LRU/TTL evicts them.
+That works identically for the in-process backend and for Redis shared by
+several workers.
+
+Keys also carry today's date: ``ActionItem.is_overdue`` flips at midnight
+without any write, so yesterday's payloads must never be served today.
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import date
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300
+DEFAULT_MAX_ENTRIES = 1024
+
+
+def _today() -> str:
+    return date.today().isoformat()
+
+
+class MemoryBackend:
+    """Thread-safe in-process LRU cache with per-entry TTL."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisBackend:
+    """Redis (or any Redis-protocol server) backend, shared across workers."""
+
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str = "claritymeet:"):
+        try:
+            import redis
+        except ImportError as e:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the 'redis' package."
+            ) from e
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key):
+        raw = self._client.get(self._prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key, value, ttl: int) -> None:
+        self._client.set(self._prefix + key, json.dumps(value), ex=ttl)
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(match=self._prefix + "*"):
+            self._client.delete(key)
+
+
+class NullBackend:
+    """Caching disabled: every lookup is a miss."""
+
+    name = "none"
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl: int) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class ResponseCache:
+    def __init__(self):
+        self.backend = MemoryBackend()
+        self.ttl = DEFAULT_TTL_SECONDS
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        kind = app.config.get("CACHE_BACKEND", "memory")
+        if kind == "redis":
+            self.backend = RedisBackend(app.config["CACHE_URL"])
+        elif kind == "none":
+            self.backend = NullBackend()
+        else:
+            self.backend = MemoryBackend(
+                app.config.get("CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+            )
+        self.ttl = app.config.get("CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)
+        logger.info("Response cache backend: %s (ttl=%ss)", self.backend.name, self.ttl)
+
+    @property
+    def shared(self) -> bool:
+        """Whether other processes read the entries this one writes."""
+        return self.backend.name == "redis"
+
+    def _token(self, namespace: str) -> str:
+        token = self.backend.get(f"ns:{namespace}")
+        if token is None:
+            token = uuid.uuid4().hex
+            self.backend.set(f"ns:{namespace}", token, self.ttl)
+        return token
+
+    def get_or_build(self, namespace: str, key: str, builder):
+        """Return the cached value for ``key`` or build, store and return it."""
+        full_key = f"{namespace}:{self._token(namespace)}:{_today()}:{key}"
+        value = self.backend.get(full_key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if value is None:
+            value = builder()
+            self.backend.set(full_key, value, self.ttl)
+        return value
+
+    def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            self.backend.set(f"ns:{namespace}", uuid.uuid4().hex, self.ttl)
+
+    def invalidate_meeting(self, meeting_id: int) -> None:
+        """Drop cached payloads that embed this meeting (detail + dashboard)."""
+        self.invalidate(f"meeting:{meeting_id}", "dashboard")
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "backend": self.backend.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+cache = ResponseCache()
@@ -0,0 +1,129 @@
+"""Calendar windows: meetings whose ``[scheduled_time, ends_at)`` intervals overlap.
+
+On PostgreSQL the overlapping pairs come from a self-join on
+``tstzrange(scheduled_time, ends_at) && ...``, answered by the
+``ix_meetings_time_range`` GiST index. Elsewhere the window's meetings are
+read once in start order and paired by a sweep that keeps only the meetings
+still running, so the cost is O(n log n + conflicts) instead of comparing
+every pair.
+"""
+
+import heapq
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import aliased
+
+from models import db, Meeting
+
+DEFAULT_WINDOW = timedelta(days=7)
+MAX_WINDOW = timedelta(days=366)
+CONFLICT_LIMIT = 100
+MAX_CONFLICT_LIMIT = 1000
+
+
+def parse_timestamp(raw: str | None, name: str) -> datetime | None:
+    """Parse an ISO 8601 query parameter; naive values are taken as UTC."""
+    if not raw:
+        return None
+    try:
+        value = datetime.fromisoformat(raw)
+    except ValueError:
+        raise ValueError(f"Invalid {name}: expected an ISO 8601 timestamp.")
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def parse_window(raw_from: str | None, raw_to: str | None) -> tuple[datetime, datetime]:
+    """``?from=&to=`` for conflict checks: default the next 7 days, at most 366."""
+    start = parse_timestamp(raw_from, "from") or datetime.now(timezone.utc)
+    end = parse_timestamp(raw_to, "to") or start + DEFAULT_WINDOW
+    if end <= start:
+        raise ValueError("'to' must be after 'from'.")
+    if end - start > MAX_WINDOW:
+        raise ValueError(f"Window is limited to {MAX_WINDOW.days} days.")
+    return start, end
+
+
+_COLUMNS = ("id", "title", "scheduled_time", "duration_minutes", "ends_at")
+
+
+def _span(meeting):
+    # Same expression as ix_meetings_time_range, so the planner can use it
+    return func.tstzrange(meeting.scheduled_time, meeting.ends_at)
+
+
+def _postgres_pairs(start, end, limit):
+    a, b = aliased(Meeting), aliased(Meeting)
+    window = func.tstzrange(start, end)
+    stmt = (
+        select(*(getattr(a, c) for c in _COLUMNS), *(getattr(b, c) for c in _COLUMNS))
+        .join(b, _span(a).op("&&")(_span(b)))
+        .where(
+            _span(a).op("&&")(window),
+            _span(b).op("&&")(window),
+            tuple_(a.scheduled_time, a.id) < tuple_(b.scheduled_time, b.id),
+        )
+        .order_by(b.scheduled_time, b.id, a.scheduled_time, a.id)
+        .limit(limit + 1)
+    )
+    width = len(_COLUMNS)
+    for row in db.session.execute(stmt):
+        yield dict(zip(_COLUMNS, row[:width])), dict(zip(_COLUMNS, row[width:]))
+
+
+def _swept_pairs(start, end):
+    # A meeting overlapping the window starts at most one (longest) duration
+    # before it, so the scan is one bounded range of the scheduled-time index;
+    # max() is a single lookup in ix_meetings_duration_minutes
+    longest = db.session.scalar(select(func.max(Meeting.duration_minutes)))
+    if longest is None:
+        return
+    stmt = (
+        select(*(getattr(Meeting, c) for c in _COLUMNS))
+        .where(
+            Meeting.scheduled_time >= start - timedelta(minutes=longest),
+            Meeting.scheduled_time < end,
+            Meeting.ends_at > start,
+        )
+        .order_by(Meeting.scheduled_time, Meeting.id)
+    )
+    running = []  # heap of (ends_at, id, meeting) started before the current one
+    for row in db.session.execute(stmt):
+        meeting = row._asdict()
+        while running and running[0][0] <= meeting["scheduled_time"]:
+            heapq.heappop(running)
+        for _, _, earlier in sorted(running, key=lambda r: (r[2]["scheduled_time"], r[1])):
+            yield earlier, meeting
+        heapq.heappush(running, (meeting["ends_at"], meeting["id"], meeting))
+
+
+def _conflict(first, second) -> dict:
+    return {
+        "meetings": [
+            {k: m[k] for k in ("id", "title", "scheduled_time", "duration_minutes")}
+            for m in (first, second)
+        ],
+        "overlap_start": max(first["scheduled_time"], second["scheduled_time"]),
+        "overlap_end": min(first["ends_at"], second["ends_at"]),
+    }
+
+
+def find_conflicts(start: datetime, end: datetime, limit: int = CONFLICT_LIMIT) -> dict:
+    """Pairs of meetings in ``[start, end)`` whose time slots intersect.
+
+    Intervals are half-open, so back-to-back meetings do not conflict. Pairs
+    are ordered by the later meeting's start; ``truncated`` is set when more
+    than ``limit`` pairs exist.
+    """
+    if db.session.get_bind().dialect.name == "postgresql":
+        pairs = _postgres_pairs(start, end, limit)
+    else:
+        pairs = _swept_pairs(start, end)
+    conflicts = []
+    for first, second in pairs:
+        if len(conflicts) == limit:
+            return {"conflicts": conflicts, "truncated": True}
+        conflicts.append(_conflict(first, second))
+    return {"conflicts": conflicts, "truncated": False}
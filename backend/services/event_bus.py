@@ -0,0 +1,224 @@
+"""Publish/subscribe bus for per-meeting change events (SSE stream).
+
+Services publish small delta events after they commit; every open
+``/api/meetings/<id>/events`` stream holds a subscription to that meeting's
+channel. The default backend is in-process: a subscriber is just a bounded
+queue, so idle watchers cost a few hundred bytes and publishing touches
+only the watchers of that meeting. With several worker processes, set
+``EVENT_BUS=redis`` so events published by one worker reach streams held
+by another.
+"""
+
+import asyncio
+import json
+import logging
+import queue
+import threading
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# Delivered instead of the next event when a subscriber fell too far
+# behind; clients should re-fetch the meeting.
+RESYNC = {"type": "resync"}
+
+
+class _QueueSubscription:
+    def __init__(self, bus, channel):
+        self._bus = bus
+        self.channel = channel
+        self._queue = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._overflowed = False
+
+    def _offer(self, event) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self._overflowed = True
+
+    def get(self, timeout: float):
+        """Next event, or None if nothing arrived within ``timeout`` seconds."""
+        if self._overflowed:
+            self._overflowed = False
+            with self._queue.mutex:
+                self._queue.queue.clear()
+            return RESYNC
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        self._bus._unsubscribe(self)
+
+
+class _AsyncQueueSubscription:
+    """Subscription consumed by a coroutine (ASGI serving mode).
+
+    Publishers run on worker threads, so events are handed to the owning
+    event loop with ``call_soon_threadsafe``.
+    """
+
+    def __init__(self, bus, channel, loop):
+        self._bus = bus
+        self.channel = channel
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def _put(self, event) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(RESYNC)
+
+    def _offer(self, event) -> None:
+        self._loop.call_soon_threadsafe(self._put, event)
+
+    async def get(self, timeout: float):
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        self._bus._unsubscribe(self)
+
+
+class InProcessEventBus:
+    name = "memory"
+
+    def __init__(self):
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: str):
+        subscription = _QueueSubscription(self, channel)
+        with self._lock:
+            self._subscribers[channel].add(subscription)
+        return subscription
+
+    async def subscribe_async(self, channel: str):
+        subscription = _AsyncQueueSubscription(
+            self, channel, asyncio.get_running_loop()
+        )
+        with self._lock:
+            self._subscribers[channel].add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription) -> None:
+        with self._lock:
+            watchers = self._subscribers.get(subscription.channel)
+            if watchers is not None:
+                watchers.discard(subscription)
+                if not watchers:
+                    del self._subscribers[subscription.channel]
+
+    def publish(self, channel: str, event: dict) -> None:
+        with self._lock:
+            watchers = list(self._subscribers.get(channel, ()))
+        for subscription in watchers:
+            subscription._offer(event)
+
+    def subscriber_count(self, channel: str | None = None) -> int:
+        with self._lock:
+            if channel is not None:
+                return len(self._subscribers.get(channel, ()))
+            return sum(len(s) for s in self._subscribers.values())
+
+
+class _RedisSubscription:
+    def __init__(self, client, channel):
+        self.channel = channel
+        self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(channel)
+
+    def get(self, timeout: float):
+        message = self._pubsub.get_message(timeout=timeout)
+        if message is None:
+            return None
+        return json.loads(message["data"])
+
+    def close(self) -> None:
+        self._pubsub.close()
+
+
+class _AsyncRedisSubscription:
+    def __init__(self, pubsub, channel):
+        self.channel = channel
+        self._pubsub = pubsub
+
+    async def get(self, timeout: float):
+        message = await self._pubsub.get_message(
+            ignore_subscribe_messages=True, timeout=timeout
+        )
+        if message is None:
+            return None
+        return json.loads(message["data"])
+
+    async def aclose(self) -> None:
+        await self._pubsub.aclose()
+
+
+class RedisEventBus:
+    """Redis pub/sub adapter for multi-worker deployments."""
+
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str = "claritymeet:events:"):
+        try:
+            import redis
+        except ImportError as e:  # pragma: no cover - optional dependency
+            raise RuntimeError("EVENT_BUS=redis requires the 'redis' package.") from e
+        self._url = url
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def subscribe(self, channel: str):
+        return _RedisSubscription(self._client, self._prefix + channel)
+
+    async def subscribe_async(self, channel: str):
+        import redis.asyncio
+
+        pubsub = redis.asyncio.Redis.from_url(self._url).pubsub()
+        await pubsub.subscribe(self._prefix + channel)
+        return _AsyncRedisSubscription(pubsub, self._prefix + channel)
+
+    def publish(self, channel: str, event: dict) -> None:
+        self._client.publish(self._prefix + channel, json.dumps(event))
+
+
+class EventBus:
+    def __init__(self):
+        self.backend = InProcessEventBus()
+
+    def init_app(self, app) -> None:
+        if app.config.get("EVENT_BUS", "memory") == "redis":
+            self.backend = RedisEventBus(app.config["EVENT_BUS_URL"])
+        else:
+            self.backend = InProcessEventBus()
+        logger.info("Event bus backend: %s", self.backend.name)
+
+    def subscribe(self, meeting_id: int):
+        return self.backend.subscribe(f"meeting:{meeting_id}")
+
+    async def subscribe_async(self, meeting_id: int):
+        return await self.backend.subscribe_async(f"meeting:{meeting_id}")
+
+    def publish(self, meeting_id: int, event_type: str, data: dict | None = None) -> None:
+        event = {
+            "type": event_type,
+            "meeting_id": meeting_id,
+            "data": data or {},
+        }
+        try:
+            self.backend.publish(f"meeting:{meeting_id}", event)
+        except Exception:
+            # Events are best-effort; the write has already been committed.
+            logger.exception("Failed to publish %s for meeting %s", event_type, meeting_id)
+
+
+events = EventBus()
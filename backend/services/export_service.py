@@ -0,0 +1,211 @@
+"""Flat, streamed table exports for analytics (``/api/export/<table>``).
+
+Rows are read with ``yield_per`` — a server-side cursor on PostgreSQL — and
+encoded one batch at a time, so memory stays flat however large the table.
+Every exported table carries ``updated_at``; ``updated_since`` selects the
+rows changed at or after a point in time, so an incremental pull can pass
+the largest ``updated_at`` it has seen. Rows come in ``(updated_at, id)``
+order.
+
+Formats: ``csv``, ``ndjson`` and, when ``pyarrow`` is installed, ``parquet``
+(one row group per batch) and ``arrow`` (Arrow IPC stream).
+"""
+
+import csv
+import io
+from datetime import date, datetime, timezone
+
+from flask import current_app
+from sqlalchemy import select
+
+from models import db, ActionItem, Meeting, Review
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+DEFAULT_BATCH_SIZE = 1000
+
+TABLES = {
+    "meetings": (
+        Meeting,
+        (
+            "id",
+            "title",
+            "scheduled_time",
+            "duration_minutes",
+            "allocated_minutes",
+            "status",
+            "version",
+            "created_at",
+            "closed_at",
+            "updated_at",
+        ),
+    ),
+    "action_items": (
+        ActionItem,
+        (
+            "id",
+            "meeting_id",
+            "description",
+            "owner",
+            "deadline",
+            "status",
+            "created_at",
+            "updated_at",
+        ),
+    ),
+    "reviews": (
+        Review,
+        (
+            "id",
+            "meeting_id",
+            "summary",
+            "outcome_rating",
+            "followup_required",
+            "created_at",
+            "updated_at",
+        ),
+    ),
+}
+
+# format -> (mimetype, file extension)
+FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+ARROW_FORMATS = ("parquet", "arrow")
+
+
+def parse_updated_since(raw: str | None) -> datetime | None:
+    """Parse ``?updated_since=`` (ISO 8601; naive means UTC)."""
+    if not raw:
+        return None
+    try:
+        value = datetime.fromisoformat(raw)
+    except ValueError:
+        raise ValueError("updated_since must be an ISO 8601 timestamp.")
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def check_export(table: str, fmt: str) -> None:
+    if table not in TABLES:
+        raise LookupError(f"Unknown export: {table}. Allowed: {', '.join(TABLES)}")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format: {fmt}. Allowed: {', '.join(FORMATS)}")
+    if fmt in ARROW_FORMATS and pyarrow is None:
+        raise ValueError(f"Format '{fmt}' requires the 'pyarrow' package.")
+
+
+def iter_batches(table: str, updated_since=None, batch_size: int = DEFAULT_BATCH_SIZE):
+    """Yield lists of row tuples (``TABLES[table]`` column order)."""
+    model, fields = TABLES[table]
+    stmt = select(*(getattr(model, name) for name in fields))
+    if updated_since is not None:
+        stmt = stmt.where(model.updated_at >= updated_since)
+    stmt = stmt.order_by(model.updated_at, model.id)
+    result = db.session.execute(stmt.execution_options(yield_per=batch_size))
+    for partition in result.partitions():
+        yield [tuple(row) for row in partition]
+
+
+def _text(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _csv(fields, batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    for batch in batches:
+        writer.writerows([[_text(v) for v in row] for row in batch])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _ndjson(fields, batches):
+    dumps = current_app.json.dumps
+    for batch in batches:
+        yield "".join(dumps(dict(zip(fields, row))) + "\n" for row in batch)
+
+
+class _Drain:
+    """Write-only file object for pyarrow writers; ``take`` empties it."""
+
+    closed = False
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def take(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def _arrow_schema(table: str):
+    types = {
+        int: pyarrow.int64(),
+        str: pyarrow.string(),
+        bool: pyarrow.bool_(),
+        datetime: pyarrow.timestamp("us", tz="UTC"),
+        date: pyarrow.date32(),
+    }
+    model, fields = TABLES[table]
+    return pyarrow.schema(
+        [(name, types[getattr(model, name).type.python_type]) for name in fields]
+    )
+
+
+def _arrow(table, batches, fmt):
+    schema = _arrow_schema(table)
+    sink = _Drain()
+    if fmt == "parquet":
+        writer = pyarrow.parquet.ParquetWriter(sink, schema)
+    else:
+        writer = pyarrow.ipc.new_stream(sink, schema)
+    for batch in batches:
+        columns = dict(zip(schema.names, map(list, zip(*batch))))
+        writer.write_table(pyarrow.Table.from_pydict(columns, schema=schema))
+        yield sink.take()
+    writer.close()
+    yield sink.take()
+
+
+def stream_export(table: str, fmt: str, updated_since=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Encoded chunks of the export, one per batch of rows."""
+    check_export(table, fmt)
+    fields = TABLES[table][1]
+    batches = iter_batches(table, updated_since, batch_size)
+    if fmt == "csv":
+        return _csv(fields, batches)
+    if fmt == "ndjson":
+        return _ndjson(fields, batches)
+    return _arrow(table, batches, fmt)
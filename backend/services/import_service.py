@@ -0,0 +1,390 @@
+"""Streaming bulk import of meetings and their items (``POST /api/import``,
+``flask --app app import``).
+
+The input is a stream of flat records, one per NDJSON line or CSV row, each
+with a ``type``:
+
+- ``meeting``: ``ref``, ``title``, ``scheduled_time``, ``duration_minutes``
+  and, in historical mode, ``status`` and ``closed_at``
+- ``agenda_item``: ``meeting_ref``, ``topic``, ``time_allocation``
+- ``action_item``: ``meeting_ref``, ``description``, ``owner``,
+  ``deadline`` and, in historical mode, ``status``
+- ``review``: ``meeting_ref``, ``summary``, ``outcome_rating``,
+  ``followup_required``
+
+``ref`` is any string naming the meeting within the import; items must come
+after the meeting they reference. Records are validated with the services'
+own rules and inserted in chunks of multi-row INSERTs, one transaction per
+chunk, so memory is bounded by the chunk size (plus a small entry per
+imported meeting ref). A record that fails validation is skipped and
+reported with its line number; the rest of the import carries on.
+
+``live`` mode applies every rule of the interactive API: meetings are
+Scheduled, action deadlines lie in the future and items only go where the
+state machine allows them. ``historical`` mode, for migrating past meetings,
+accepts any meeting status, past deadlines and completed items, and reviews
+of Reviewed meetings. The agenda time budget and per-field rules always
+apply.
+"""
+
+import csv
+import json
+import logging
+import time
+from datetime import datetime
+
+from sqlalchemy import bindparam, insert, update
+
+from models import ActionItem, AgendaItem, Meeting, Review
+from services import action_item_service, agenda_service, review_service
+from services.batch import bulk_insert
+from services.cache_service import cache
+from services.meeting_service import _validate_meeting, bump_global_version
+from services.meeting_state_service import ALL_STATES
+from services.unit_of_work import after_commit, unit_of_work
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 100
+MODES = ("live", "historical")
+
+CSV_INT_FIELDS = ("duration_minutes", "time_allocation", "outcome_rating")
+CSV_BOOL_FIELDS = ("followup_required",)
+CSV_TRUE = ("1", "true", "yes", "y")
+CSV_FALSE = ("0", "false", "no", "n")
+
+
+# ─── Parsing ────────────────────────────────────────────
+
+
+def parse_ndjson(lines):
+    """Yield ``(line, record, error)`` for each non-blank NDJSON line."""
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield number, None, "Invalid JSON."
+            continue
+        if not isinstance(record, dict):
+            yield number, None, "Record must be a JSON object."
+            continue
+        yield number, record, None
+
+
+def _csv_value(field: str, raw: str):
+    if field in CSV_INT_FIELDS:
+        try:
+            return int(raw)
+        except ValueError:
+            raise ValueError(f"{field} must be an integer.")
+    if field in CSV_BOOL_FIELDS:
+        if raw.lower() in CSV_TRUE:
+            return True
+        if raw.lower() in CSV_FALSE:
+            return False
+        raise ValueError(f"{field} must be true or false.")
+    return raw
+
+
+def parse_csv(lines):
+    """Yield ``(line, record, error)`` per CSV row (header row required).
+
+    Empty cells are treated as missing; numeric and boolean columns are
+    converted so the records match their NDJSON form.
+    """
+    reader = csv.DictReader(lines)
+    for row in reader:
+        try:
+            record = {
+                field: _csv_value(field, raw.strip())
+                for field, raw in row.items()
+                if field is not None and raw is not None and raw.strip()
+            }
+        except ValueError as e:
+            yield reader.line_num, None, str(e)
+            continue
+        yield reader.line_num, record, None
+
+
+PARSERS = {"ndjson": parse_ndjson, "csv": parse_csv}
+
+
+def parse(lines, fmt: str):
+    if fmt not in PARSERS:
+        raise ValueError(f"Unknown format: {fmt}. Allowed: {', '.join(PARSERS)}")
+    return PARSERS[fmt](lines)
+
+
+# ─── Importing ──────────────────────────────────────────
+
+
+class _MeetingState:
+    """What validating later records needs to know about an imported meeting."""
+
+    __slots__ = ("id", "status", "duration_minutes", "allocated_minutes", "reviewed", "row")
+
+    def __init__(self, status: str, duration_minutes: int, row: dict):
+        self.id = None
+        self.status = status
+        self.duration_minutes = duration_minutes
+        self.allocated_minutes = 0
+        self.reviewed = False
+        self.row = row
+
+
+class _Chunk:
+    """Validated rows of one chunk, plus how to undo their bookkeeping."""
+
+    def __init__(self):
+        self.meetings = []  # (ref, state)
+        self.agenda = []  # (state, row)
+        self.actions = []
+        self.reviews = []
+        self.lines = []
+
+    @staticmethod
+    def with_meeting_ids(staged) -> list[dict]:
+        return [dict(row, meeting_id=state.id) for state, row in staged]
+
+
+class Importer:
+    def __init__(self, mode: str = "live"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode}. Allowed: {', '.join(MODES)}")
+        self.historical = mode == "historical"
+        self.mode = mode
+        self.refs = {}
+        self.rows = 0
+        self.failed = 0
+        self.errors = []
+        self.imported = {"meetings": 0, "agenda_items": 0, "action_items": 0, "reviews": 0}
+
+    def fail(self, line: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": error})
+
+    # Each _stage_* validates one record, updates the in-memory meeting
+    # state and adds the row to insert to the chunk.
+
+    def _meeting_for(self, record) -> _MeetingState:
+        ref = record.get("meeting_ref")
+        if ref is None:
+            raise ValueError("meeting_ref is required.")
+        state = self.refs.get(str(ref))
+        if state is None:
+            raise ValueError(f"Unknown meeting_ref: {ref}.")
+        return state
+
+    def _stage_meeting(self, chunk, record):
+        ref = record.get("ref")
+        if ref is not None and str(ref) in self.refs:
+            raise ValueError(f"Duplicate ref: {ref}.")
+        title, scheduled = _validate_meeting(
+            record.get("title"), record.get("scheduled_time"), record.get("duration_minutes")
+        )
+        status = record.get("status", "Scheduled")
+        closed_at = record.get("closed_at")
+        if not self.historical and (status != "Scheduled" or closed_at):
+            raise ValueError("Only historical imports may set status or closed_at.")
+        if status not in ALL_STATES:
+            raise ValueError(f"Unknown status: {status}.")
+        row = {
+            "title": title,
+            "scheduled_time": scheduled,
+            "duration_minutes": record["duration_minutes"],
+            "status": status,
+            "closed_at": datetime.fromisoformat(closed_at) if closed_at else None,
+        }
+        state = _MeetingState(status, row["duration_minutes"], row)
+        chunk.meetings.append((None if ref is None else str(ref), state))
+        if ref is not None:
+            self.refs[str(ref)] = state
+
+    def _stage_agenda_item(self, chunk, record):
+        state = self._meeting_for(record)
+        if not self.historical:
+            agenda_service._check_scheduled(state)
+        topic, minutes = agenda_service._validate_item(
+            record.get("topic"), record.get("time_allocation")
+        )
+        agenda_service._check_budget(state, minutes, "add")
+        state.allocated_minutes += minutes
+        chunk.agenda.append((state, {"topic": topic, "time_allocation": minutes}))
+
+    def _stage_action_item(self, chunk, record):
+        state = self._meeting_for(record)
+        status = record.get("status", "Open")
+        if not self.historical:
+            action_item_service._check_accepts_actions(state)
+            if status != "Open":
+                raise ValueError("Only historical imports may set an action item status.")
+        if status not in action_item_service.ACTION_STATUSES:
+            raise ValueError(f"Unknown action item status: {status}.")
+        description, owner, deadline = action_item_service._validate_item(
+            record.get("description"),
+            record.get("owner"),
+            record.get("deadline"),
+            historical=self.historical,
+        )
+        chunk.actions.append(
+            (
+                state,
+                {"description": description, "owner": owner, "deadline": deadline, "status": status},
+            )
+        )
+
+    def _stage_review(self, chunk, record):
+        state = self._meeting_for(record)
+        if self.historical:
+            if state.status != "Reviewed":
+                raise ValueError("A historical review's meeting must have status Reviewed.")
+        else:
+            review_service._check_reviewable(state.status)
+        if state.reviewed:
+            raise ValueError("This meeting already has a review.")
+        followup = record.get("followup_required", False)
+        summary = review_service._validate_review(
+            record.get("summary"), record.get("outcome_rating"), followup
+        )
+        state.reviewed = True
+        chunk.reviews.append(
+            (
+                state,
+                {
+                    "summary": summary,
+                    "outcome_rating": record["outcome_rating"],
+                    "followup_required": bool(followup),
+                },
+            )
+        )
+
+    STAGES = {
+        "meeting": _stage_meeting,
+        "agenda_item": _stage_agenda_item,
+        "action_item": _stage_action_item,
+        "review": _stage_review,
+    }
+
+    def _stage(self, chunk, line, record, error) -> None:
+        self.rows += 1
+        if error is not None:
+            self.fail(line, error)
+            return
+        stage = self.STAGES.get(record.get("type"))
+        if stage is None:
+            self.fail(line, f"Unknown record type: {record.get('type')}.")
+            return
+        try:
+            stage(self, chunk, record)
+        except (ValueError, TypeError) as e:
+            self.fail(line, str(e))
+            return
+        chunk.lines.append(line)
+
+    def _write(self, chunk) -> None:
+        """Insert one chunk's rows in a single transaction."""
+        with unit_of_work() as session:
+            if chunk.meetings:
+                created = bulk_insert(Meeting, [s.row for _, s in chunk.meetings])
+                for (_, state), meeting in zip(chunk.meetings, created):
+                    state.id = meeting.id
+                    state.row = None
+
+            for model, staged in (
+                (AgendaItem, chunk.agenda),
+                (ActionItem, chunk.actions),
+                (Review, chunk.reviews),
+            ):
+                if staged:
+                    session.execute(insert(model), chunk.with_meeting_ids(staged))
+
+            minutes = {}
+            for state, row in chunk.agenda:
+                minutes[state.id] = minutes.get(state.id, 0) + row["time_allocation"]
+            touched = {s.id for s, _ in chunk.actions + chunk.reviews} | set(minutes)
+            if touched:
+                # One executemany UPDATE: maintain the agenda counter and bump
+                # the version of every meeting that gained items
+                meetings = Meeting.__table__
+                session.execute(
+                    update(meetings)
+                    .where(meetings.c.id == bindparam("meeting_id"))
+                    .values(
+                        allocated_minutes=meetings.c.allocated_minutes
+                        + bindparam("minutes"),
+                        version=meetings.c.version + 1,
+                    ),
+                    [{"meeting_id": mid, "minutes": minutes.get(mid, 0)} for mid in touched],
+                )
+            bump_global_version()
+            after_commit(cache.invalidate, "dashboard")
+
+    def _undo(self, chunk) -> None:
+        """Forget a chunk's in-memory bookkeeping after its transaction failed."""
+        for ref, _ in chunk.meetings:
+            self.refs.pop(ref, None)
+        for state, row in chunk.agenda:
+            state.allocated_minutes -= row["time_allocation"]
+        for state, _ in chunk.reviews:
+            state.reviewed = False
+
+    def load(self, records) -> None:
+        """Validate and insert one chunk of ``(line, record, error)`` tuples."""
+        chunk = _Chunk()
+        for line, record, error in records:
+            self._stage(chunk, line, record, error)
+        if not chunk.lines:
+            return
+        try:
+            self._write(chunk)
+        except Exception as e:
+            logger.exception("Import chunk failed (lines %s-%s)", chunk.lines[0], chunk.lines[-1])
+            self._undo(chunk)
+            for line in chunk.lines:
+                self.fail(line, f"Chunk rolled back: {type(e).__name__}.")
+            return
+        self.imported["meetings"] += len(chunk.meetings)
+        self.imported["agenda_items"] += len(chunk.agenda)
+        self.imported["action_items"] += len(chunk.actions)
+        self.imported["reviews"] += len(chunk.reviews)
+
+    def report(self, seconds: float) -> dict:
+        return {
+            "mode": self.mode,
+            "rows": self.rows,
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "seconds": round(seconds, 3),
+            "rows_per_second": round(self.rows / seconds, 1) if seconds else None,
+        }
+
+
+def _chunks(records, size: int):
+    chunk = []
+    for item in records:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_records(records, mode: str = "live", chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """Import parsed ``(line, record, error)`` tuples; return the report.
+
+    The report lists how many rows were read, imported (per table) and
+    rejected, the first ``MAX_REPORTED_ERRORS`` errors with their line
+    numbers, and the throughput.
+    """
+    importer = Importer(mode)
+    started = time.perf_counter()
+    for chunk in _chunks(records, chunk_size):
+        importer.load(chunk)
+        logger.info("Import: %s rows read, %s rejected", importer.rows, importer.failed)
+    return importer.report(time.perf_counter() - started)
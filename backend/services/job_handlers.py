@@ -0,0 +1,81 @@
+"""Built-in background jobs (see ``job_queue``)."""
+
+import logging
+from datetime import date, datetime, time, timedelta
+
+from models import ActionItem
+from services import ai_service
+from services.event_bus import events
+from services.job_queue import handler, jobs
+from services.meeting_service import get_dashboard_stats, get_global_version, get_meeting
+from services.unit_of_work import after_commit
+
+logger = logging.getLogger(__name__)
+
+
+@handler("review_draft")
+def review_draft(payload: dict):
+    """Draft the review summary of a just-closed meeting."""
+    meeting = get_meeting(payload["meeting_id"], profile="detail")
+    if meeting.status != "Closed":
+        return {"skipped": f"Meeting is {meeting.status}."}
+    return ai_service.summarize_review(
+        meeting.title, [a.to_dict() for a in meeting.action_items]
+    )
+
+
+@handler("dashboard_precompute")
+def dashboard_precompute(payload: dict):
+    """Warm the dashboard cache entry for the current global version."""
+    version = get_global_version()
+    stats = get_dashboard_stats(version=version)
+    return {"version": version, "counts": stats["counts"]}
+
+
+def _seconds_until_midnight() -> float:
+    tomorrow = datetime.combine(date.today() + timedelta(days=1), time.min)
+    return max(1.0, (tomorrow - datetime.now()).total_seconds())
+
+
+@handler("overdue_sweep")
+def overdue_sweep(payload: dict):
+    """Notify meeting watchers of action items that became overdue.
+
+    Runs once a day: each run schedules the next one for midnight and hands
+    it the last deadline it covered (``swept_through``), so a run that was
+    delayed (worker down, runner stopped) catches up on every missed day
+    and a repeated run does not notify twice.
+    """
+    yesterday = date.today() - timedelta(days=1)
+    raw = payload.get("swept_through")
+    since = date.fromisoformat(raw) if raw else yesterday - timedelta(days=1)
+    items = (
+        ActionItem.query.filter(
+            ActionItem.status == "Open",
+            ActionItem.deadline > since,
+            ActionItem.deadline <= yesterday,
+        )
+        .order_by(ActionItem.deadline, ActionItem.id)
+        .all()
+    )
+    for item in items:
+        after_commit(
+            events.publish, item.meeting_id, "action.overdue", {"item": item.to_dict()}
+        )
+    swept_through = max(since, yesterday)
+    schedule_overdue_sweep(swept_through=swept_through)
+    logger.info("Overdue sweep: %s items became overdue.", len(items))
+    return {"notified": len(items), "swept_through": swept_through.isoformat()}
+
+
+def schedule_overdue_sweep(
+    delay: float | None = None, swept_through: date | None = None
+) -> None:
+    """Make sure a sweep is queued (by default for the coming midnight).
+
+    An already queued sweep is kept as is, along with its ``swept_through``.
+    """
+    if delay is None:
+        delay = _seconds_until_midnight()
+    payload = {"swept_through": swept_through.isoformat()} if swept_through else None
+    jobs.enqueue("overdue_sweep", payload, key="overdue_sweep", delay=delay, dedupe=True)
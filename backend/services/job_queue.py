@@ -0,0 +1,272 @@
+"""Database-backed background job queue.
+
+Routes enqueue slow work (``enqueue``) and return immediately; the work runs
+later in one of three ways, chosen by ``JOB_RUNNER``:
+
+- ``worker`` — a separate ``python worker.py`` process polls the ``jobs``
+  table. Claims use ``SELECT ... FOR UPDATE SKIP LOCKED`` on PostgreSQL, so
+  any number of workers can share the queue. Default on PostgreSQL.
+- ``thread`` — an in-process thread pool drains the queue after each
+  enqueue. Default on SQLite, which has no ``SKIP LOCKED``: claims there
+  are compare-and-swap UPDATEs instead. With in-memory SQLite (one
+  connection per thread) jobs run inline in the enqueuing thread.
+- ``manual`` — nothing runs until ``run_pending`` is called (tests).
+
+A failing job is retried with exponential backoff until ``max_attempts``,
+then marked ``failed``. A job left ``running`` by a crashed worker is
+reclaimed once its lease (``JOB_LEASE_SECONDS``) has expired.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from models import Job, db
+from models.job import UNCLAIMED
+from services.unit_of_work import after_commit, unit_of_work
+
+logger = logging.getLogger(__name__)
+
+BACKOFF_BASE_SECONDS = 2
+BACKOFF_MAX_SECONDS = 300
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 5
+
+HANDLERS = {}
+
+
+def handler(kind: str):
+    """Register the function that runs jobs of ``kind``.
+
+    The function receives the job's payload dict and returns a JSON-ready
+    result (or None); raising marks the attempt as failed.
+    """
+
+    def register(fn):
+        HANDLERS[kind] = fn
+        return fn
+
+    return register
+
+
+def backoff_seconds(attempts: int) -> int:
+    """Delay before retry number ``attempts`` (1-based): 2, 4, 8 ... 300s."""
+    return min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobQueue:
+    def __init__(self):
+        self.runner = "manual"
+        self.lease = timedelta(seconds=DEFAULT_LEASE_SECONDS)
+        self.threads = 2
+        self._app = None
+        self._executor = None
+        self._inline = False
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        import services.job_handlers  # noqa: F401 — registers the built-in handlers
+
+        uri = app.config["SQLALCHEMY_DATABASE_URI"]
+        default = "thread" if uri.startswith("sqlite") else "worker"
+        self.runner = app.config.get("JOB_RUNNER") or default
+        self.lease = timedelta(
+            seconds=app.config.get("JOB_LEASE_SECONDS", DEFAULT_LEASE_SECONDS)
+        )
+        self.threads = app.config.get("JOB_THREADS", 2)
+        self._inline = uri.startswith("sqlite") and ":memory:" in uri
+        self._app = app
+        logger.info("Job runner: %s", self.runner)
+
+    # ─── Producing ──────────────────────────────────────
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: dict | None = None,
+        key: str | None = None,
+        delay: float = 0,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        dedupe: bool = False,
+    ) -> Job:
+        """Queue a job; returns the (possibly existing) job.
+
+        Called inside a unit of work, the job is written in the caller's
+        transaction (it exists iff the caller's change commits) and the
+        runner is woken after that commit. With ``dedupe``, a job with the
+        same ``key`` that has not started yet is reused instead of queueing
+        another one; the ``ux_jobs_unclaimed_key`` index makes that hold for
+        concurrent callers too (e.g. several processes starting at once).
+        """
+        if kind not in HANDLERS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        dedupe = dedupe and bool(key)
+        if dedupe:
+            existing = self._queued(key)
+            if existing is not None:
+                return existing
+        values = dict(
+            kind=kind,
+            key=key,
+            payload=payload or {},
+            max_attempts=max_attempts,
+            run_at=_now() + timedelta(seconds=delay),
+        )
+        with unit_of_work() as session:
+            if dedupe:
+                job = self._insert_unless_queued(session, values)
+                if job is None:
+                    # Lost the race: another caller's job is queued now
+                    return self._queued(key)
+            else:
+                job = Job(**values)
+                session.add(job)
+                session.flush()
+            logger.info("Job %s queued: %s key=%s", job.id, kind, key)
+            after_commit(self.wake, delay)
+        return job
+
+    def _queued(self, key: str) -> Job | None:
+        return db.session.scalar(
+            select(Job).where(Job.key == key, Job.status == "queued").limit(1)
+        )
+
+    def _insert_unless_queued(self, session, values: dict) -> Job | None:
+        """INSERT ... ON CONFLICT DO NOTHING against the unclaimed-key index.
+
+        Returns the new job, or None when an unclaimed job with the same
+        key already exists. Unlike catching IntegrityError, this leaves the
+        caller's transaction usable on PostgreSQL.
+        """
+        dialect = {"postgresql": postgresql, "sqlite": sqlite}.get(
+            session.get_bind().dialect.name
+        )
+        if dialect is None:
+            job = Job(**values)
+            session.add(job)
+            session.flush()
+            return job
+        stmt = (
+            dialect.insert(Job)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[Job.key], index_where=UNCLAIMED)
+            .returning(Job)
+        )
+        return session.scalar(stmt)
+
+    def wake(self, delay: float = 0) -> None:
+        """Let the in-process runner know that work is (or will be) due."""
+        if self.runner != "thread":
+            return
+        if self._inline:
+            if not delay:
+                self.run_pending()
+            return
+        if delay:
+            timer = threading.Timer(delay, self.wake)
+            timer.daemon = True
+            timer.start()
+            return
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.threads, thread_name_prefix="jobs"
+                )
+        self._executor.submit(self._drain)
+
+    def _drain(self) -> None:
+        with self._app.app_context():
+            try:
+                while self.run_pending():
+                    pass
+            except Exception:
+                logger.exception("Job runner thread failed")
+            finally:
+                db.session.remove()
+
+    # ─── Consuming ──────────────────────────────────────
+
+    def _claim(self, limit: int, now: datetime) -> list[int]:
+        due = or_(
+            and_(Job.status == "queued", Job.run_at <= now),
+            and_(Job.status == "running", Job.locked_at < now - self.lease),
+        )
+        stmt = select(Job.id, Job.status, Job.attempts).where(due)
+        stmt = stmt.order_by(Job.run_at, Job.id).limit(limit)
+        if db.session.get_bind().dialect.name == "postgresql":
+            stmt = stmt.with_for_update(skip_locked=True)
+
+        claimed = []
+        for job_id, status, attempts in db.session.execute(stmt).all():
+            # Compare-and-swap: on databases without SKIP LOCKED another
+            # runner may have claimed the same row since the SELECT.
+            won = db.session.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status == status, Job.attempts == attempts)
+                .values(status="running", locked_at=now, attempts=attempts + 1)
+            ).rowcount
+            if won:
+                claimed.append(job_id)
+        db.session.commit()
+        return claimed
+
+    def _run_one(self, job_id: int) -> None:
+        try:
+            # The handler's writes and the "done" mark commit together
+            with unit_of_work():
+                job = db.session.get(Job, job_id)
+                job.result = HANDLERS[job.kind](dict(job.payload))
+                job.status = "done"
+                job.locked_at = None
+                job.finished_at = _now()
+        except Exception as e:
+            job = db.session.get(Job, job_id)
+            job.last_error = f"{type(e).__name__}: {e}"
+            job.locked_at = None
+            if job.attempts >= job.max_attempts:
+                job.status = "failed"
+                job.finished_at = _now()
+                logger.error("Job %s (%s) failed permanently: %s", job_id, job.kind, e)
+            else:
+                delay = backoff_seconds(job.attempts)
+                job.status = "queued"
+                job.run_at = _now() + timedelta(seconds=delay)
+                logger.warning(
+                    "Job %s (%s) attempt %s failed, retrying in %ss: %s",
+                    job_id, job.kind, job.attempts, delay, e,
+                )
+            db.session.commit()
+            if job.status == "queued":
+                self.wake(delay)
+
+    def run_pending(self, limit: int = 10, now: datetime | None = None) -> int:
+        """Claim and run up to ``limit`` due jobs; returns how many ran."""
+        claimed = self._claim(limit, now or _now())
+        for job_id in claimed:
+            self._run_one(job_id)
+        return len(claimed)
+
+    def get_job(self, job_id: int) -> Job:
+        job = db.session.get(Job, job_id)
+        if job is None:
+            raise LookupError(f"Job {job_id} not found.")
+        return job
+
+    def latest(self, key: str) -> Job:
+        job = db.session.scalar(
+            select(Job).where(Job.key == key).order_by(Job.id.desc()).limit(1)
+        )
+        if job is None:
+            raise LookupError(f"No job for {key}.")
+        return job
+
+
+jobs = JobQueue()
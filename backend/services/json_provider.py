@@ -0,0 +1,88 @@
+"""Flask JSON provider backed by orjson, with a stdlib fallback.
+
+``JSON_ENCODER`` picks the encoder: ``orjson`` (the default when the package
+is installed) or ``stdlib``. Both encode ``datetime``/``date`` values as ISO
+8601 — the same strings ``Model.to_dict`` produces — so row serializers
+(``services.serializers``) can hand timestamps over unformatted and get
+the same output from either encoder.
+"""
+
+import dataclasses
+import json
+import logging
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _default(o):
+    """Flask's fallbacks, except that dates are ISO 8601 (like orjson)."""
+    if isinstance(o, date):
+        return o.isoformat()
+    if isinstance(o, (Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """Flask's provider with ISO 8601 dates instead of HTTP dates."""
+
+    name = "stdlib"
+    default = staticmethod(_default)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Encode with orjson; decoding stays on the stdlib parser's API."""
+
+    name = "orjson"
+
+    def _options(self, **kwargs) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self.dumps_bytes(obj, **kwargs).decode()
+
+    def dumps_bytes(self, obj, **kwargs) -> bytes:
+        return orjson.dumps(obj, default=_default, option=self._options(**kwargs))
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = self.dumps_bytes(obj, indent=indent) + b"\n"
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def select_provider(name: str | None):
+    """Return the provider class for ``JSON_ENCODER`` (empty: best available)."""
+    name = (name or ("orjson" if orjson else "stdlib")).lower()
+    if name == "orjson":
+        if orjson is None:
+            logger.warning("JSON_ENCODER=orjson but orjson is not installed; using stdlib.")
+            return StdlibJSONProvider
+        return OrjsonProvider
+    if name == "stdlib":
+        return StdlibJSONProvider
+    raise ValueError(f"Unknown JSON_ENCODER: {name}")
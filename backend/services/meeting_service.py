@@ -3,119 +3,506 @@
 import logging
 from datetime import datetime, timezone
 
-from models import db, Meeting
+from sqlalchemy import case, func, select, true, tuple_, update
+from sqlalchemy.orm import joinedload, selectinload
+
+from models import db, ChangeCounter, Meeting
+from services import serializers
+from services.cache_service import cache
+from services.event_bus import events
+from services.job_queue import jobs
 from services.meeting_state_service import validate_transition
+from services.pagination import DEFAULT_LIMIT, decode_cursor, encode_cursor
+from services.unit_of_work import after_commit, unit_of_work
 
 logger = logging.getLogger(__name__)
 
+# Eager-loading strategy per embedded relation. Collections use selectinload
+# (one extra SELECT ... WHERE meeting_id IN (...) per page); the one-to-one
+# review is joined into the main SELECT.
+_RELATION_LOADERS = {
+    "agenda_items": selectinload(Meeting.agenda_items),
+    "action_items": selectinload(Meeting.action_items),
+    "review": joinedload(Meeting.review),
+}
 
-def create_meeting(title: str, scheduled_time: str, duration_minutes: int) -> Meeting:
-    """Create a new meeting in Scheduled state."""
-    if not title or not title.strip():
+# Loader profiles chosen per endpoint, so that serializing a list of any
+# size costs a fixed number of round-trips instead of 1 + 3N.
+LOADER_PROFILES = {
+    "summary": (),
+    "detail": Meeting.RELATION_FIELDS,
+}
+
+UPCOMING_STATES = ("Scheduled", "InProgress")
+DASHBOARD_LIST_LIMIT = 20
+
+
+def loader_options(profile: str | None = None, relations=None) -> list:
+    """Return ORM loader options for a profile or an explicit relation list."""
+    if relations is None:
+        relations = LOADER_PROFILES[profile] if profile else ()
+    return [_RELATION_LOADERS[name] for name in relations]
+
+
+def _validate_meeting(title, scheduled_time, duration_minutes) -> tuple[str, datetime]:
+    """Validate a new meeting's fields; return the cleaned title and time."""
+    if not isinstance(title, str) or not title.strip():
         raise ValueError("Title is required.")
     if duration_minutes is None or duration_minutes <= 0:
         raise ValueError("Duration must be a positive integer.")
+    return title.strip(), datetime.fromisoformat(scheduled_time)
 
-    scheduled_dt = datetime.fromisoformat(scheduled_time)
 
-    meeting = Meeting(
-        title=title.strip(),
-        scheduled_time=scheduled_dt,
-        duration_minutes=duration_minutes,
-        status="Scheduled",
-    )
-    db.session.add(meeting)
-    db.session.commit()
+def create_meeting(title: str, scheduled_time: str, duration_minutes: int) -> Meeting:
+    """Create a new meeting in Scheduled state."""
+    title, scheduled_dt = _validate_meeting(title, scheduled_time, duration_minutes)
+
+    with unit_of_work():
+        meeting = Meeting(
+            title=title,
+            scheduled_time=scheduled_dt,
+            duration_minutes=duration_minutes,
+            status="Scheduled",
+        )
+        db.session.add(meeting)
+        bump_global_version()
+        after_commit(cache.invalidate, "dashboard")
 
     logger.info("Meeting created: id=%s title=%s", meeting.id, meeting.title)
     return meeting
 
 
-def get_meeting(meeting_id: int) -> Meeting:
-    """Fetch a meeting by ID or raise 404."""
-    meeting = db.session.get(Meeting, meeting_id)
+def get_meeting(meeting_id: int, profile: str | None = None) -> Meeting:
+    """Fetch a meeting by ID or raise 404.
+
+    ``profile`` names a ``LOADER_PROFILES`` entry to eager-load relations
+    that the caller is about to serialize.
+    """
+    meeting = db.session.get(Meeting, meeting_id, options=loader_options(profile))
     if not meeting:
         raise LookupError(f"Meeting {meeting_id} not found.")
     return meeting
 
 
-def get_all_meetings(status: str | None = None):
-    """Return all meetings, optionally filtered by status."""
-    query = Meeting.query.order_by(Meeting.scheduled_time.desc())
+class ConflictError(Exception):
+    """The meeting changed between being read and being written (HTTP 409)."""
+
+    status_code = 409
+
+
+class PreconditionFailed(ConflictError):
+    """The client's ``If-Match`` names a version that is no longer current (412)."""
+
+    status_code = 412
+
+
+def check_expected_version(meeting: Meeting, expected_version: int | None) -> None:
+    """Enforce a client-supplied version (``If-Match``), if any."""
+    if expected_version is not None and meeting.version != expected_version:
+        raise PreconditionFailed(
+            f"Meeting {meeting.id} is at version {meeting.version}, "
+            f"not {expected_version}. Reload and retry."
+        )
+
+
+def touch_meeting(
+    meeting_id: int,
+    expected_version: int | None = None,
+    expected_status: str | None = None,
+    guard=None,
+    **values,
+) -> None:
+    """Bump the meeting's version as part of the caller's transaction.
+
+    Every service mutation of a meeting or of its agenda/action items/review
+    calls this before committing; the increment happens in SQL, so
+    concurrent writers never lose a bump.
+
+    ``expected_version`` / ``expected_status`` turn the UPDATE into a
+    compare-and-swap against what the caller read and validated: if another
+    transaction got there first no row matches and ConflictError is raised
+    (rolling back the caller's unit of work). State transitions pass the
+    version (and their new column ``values``); item mutations only pass the
+    status, so concurrent edits of different items do not conflict. ``guard``
+    is an extra SQL condition evaluated against the current row (e.g. the
+    agenda time budget).
+    """
+    stmt = update(Meeting).where(Meeting.id == meeting_id)
+    if expected_version is not None:
+        stmt = stmt.where(Meeting.version == expected_version)
+    if expected_status is not None:
+        stmt = stmt.where(Meeting.status == expected_status)
+    if guard is not None:
+        stmt = stmt.where(guard)
+    result = db.session.execute(stmt.values(version=Meeting.version + 1, **values))
+    if result.rowcount != 1:
+        raise ConflictError(
+            f"Meeting {meeting_id} was modified concurrently. Reload and retry."
+        )
+    bump_global_version()
+
+
+def bump_global_version() -> None:
+    """Advance the ``get_global_version`` stamp once the caller commits.
+
+    The increment runs in its own one-statement transaction after the
+    caller's commit, so the counter row is never locked for the length of
+    a writer's transaction and writers to different meetings do not queue
+    behind each other. The stamp can therefore only lag the data, never
+    lead it.
+    """
+    after_commit(_increment_change_counter)
+
+
+def _increment_change_counter() -> None:
+    with db.engine.begin() as conn:
+        conn.execute(
+            update(ChangeCounter)
+            .where(ChangeCounter.id == ChangeCounter.ID)
+            .values(version=ChangeCounter.version + 1)
+        )
+
+
+def _publish_change(meeting_id: int, event_type: str, data: dict | None) -> None:
+    cache.invalidate_meeting(meeting_id)
+    events.publish(meeting_id, event_type, data)
+
+
+def meeting_changed(meeting_id: int, event_type: str, data: dict | None = None) -> None:
+    """Record a mutation of a meeting or its items in the current unit of work.
+
+    Once the unit commits, the cached payloads embedding the meeting are
+    invalidated and a small delta event is published to its ``/events``
+    stream. ``data`` is captured now, so serialize after flushing.
+    """
+    after_commit(_publish_change, meeting_id, event_type, data)
+
+
+def get_meeting_version(meeting_id: int) -> int:
+    """Current version of a meeting (a primary-key lookup, no relations)."""
+    version = db.session.scalar(select(Meeting.version).where(Meeting.id == meeting_id))
+    if version is None:
+        raise LookupError(f"Meeting {meeting_id} not found.")
+    return version
+
+
+def get_global_version() -> str:
+    """A stamp that changes whenever any meeting (or its items) changes.
+
+    Every committed write bumps the single ``change_counter`` row (see
+    ``bump_global_version``), so this is one primary-key lookup however many
+    meetings exist.
+    """
+    version = db.session.scalar(
+        select(ChangeCounter.version).where(ChangeCounter.id == ChangeCounter.ID)
+    )
+    return str(version or 0)
+
+
+def get_meeting_detail(meeting_id: int, version: int | None = None) -> dict:
+    """Serialized meeting with all relations, served from the response cache.
+
+    Passing the ``version`` the caller already read (e.g. for its ETag)
+    keys the entry on it, so the body can never be older than the tag.
+    """
+    return cache.get_or_build(
+        f"meeting:{meeting_id}",
+        f"detail:{version}",
+        lambda: get_meeting(meeting_id, profile="detail").to_dict(),
+    )
+
+
+def _page_conditions(
+    status: str | None,
+    cursor: str | None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list:
+    conditions = []
     if status:
-        query = query.filter_by(status=status)
-    return query.all()
+        conditions.append(Meeting.status == status)
+    if start and end and end <= start:
+        raise ValueError("'to' must be after 'from'.")
+    if start:
+        conditions.append(Meeting.scheduled_time >= start)
+    if end:
+        conditions.append(Meeting.scheduled_time < end)
+    if cursor:
+        raw_time, last_id = decode_cursor(cursor, 2)
+        try:
+            last_time = datetime.fromisoformat(raw_time)
+            last_id = int(last_id)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid cursor.")
+        conditions.append(tuple_(Meeting.scheduled_time, Meeting.id) < (last_time, last_id))
+    return conditions
+
+
+_PAGE_ORDER = (Meeting.scheduled_time.desc(), Meeting.id.desc())
+
+
+def get_meetings_page(
+    status: str | None = None,
+    limit: int = DEFAULT_LIMIT,
+    cursor: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    expand=None,
+):
+    """Return one page of meetings, newest first, and the next-page cursor.
+
+    Pages are keyed on ``(scheduled_time, id)`` so every page is an index
+    range scan of ``limit + 1`` rows regardless of how deep the client is.
+    ``start`` / ``end`` bound that scan to meetings starting in
+    ``[start, end)`` (a calendar view).
+    Only the relations in ``expand`` (default: all) are eager-loaded.
+
+    This is the ORM path: ``GET /api/meetings`` serves the same page through
+    ``get_meeting_dicts_page``. It is kept for callers that need model
+    instances and as the baseline in ``bench/serialization.py``.
+    """
+    query = Meeting.query.options(
+        *loader_options("detail" if expand is None else None, relations=expand)
+    )
+    rows = (
+        query.filter(*_page_conditions(status, cursor, start, end))
+        .order_by(*_PAGE_ORDER)
+        .limit(limit + 1)
+        .all()
+    )
+    meetings, extra = rows[:limit], rows[limit:]
+    next_cursor = None
+    if extra:
+        last = meetings[-1]
+        next_cursor = encode_cursor(last.scheduled_time.isoformat(), last.id)
+    return meetings, next_cursor
+
+
+def get_meeting_dicts_page(
+    status: str | None = None,
+    limit: int = DEFAULT_LIMIT,
+    cursor: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    fields=None,
+    expand=None,
+):
+    """``get_meetings_page`` serialized row-wise, without ORM objects.
+
+    Returns the ``Meeting.to_dict(fields, expand)`` payloads (timestamps
+    left for the JSON provider to encode) and the next-page cursor.
+    """
+    fields = Meeting.SCALAR_FIELDS if fields is None else fields
+    # The cursor needs the sort key even when it is not projected
+    keyed = fields if "scheduled_time" in fields else fields + ("scheduled_time",)
+    conditions = _page_conditions(status, cursor, start, end)
+    rows = serializers.meeting_dicts(
+        lambda stmt: stmt.where(*conditions).order_by(*_PAGE_ORDER).limit(limit + 1),
+        fields=keyed,
+        expand=expand,
+    )
+    meetings, extra = rows[:limit], rows[limit:]
+    next_cursor = None
+    if extra:
+        last = meetings[-1]
+        next_cursor = encode_cursor(last["scheduled_time"].isoformat(), last["id"])
+    if keyed is not fields:
+        for meeting in meetings:
+            del meeting["scheduled_time"]
+    return meetings, next_cursor
+
 
+def parse_projection(fields: str | None, expand: str | None):
+    """Turn ``?fields=`` / ``?expand=`` into ``Meeting.to_dict`` arguments.
 
-def start_meeting(meeting_id: int) -> Meeting:
+    With neither parameter the full nested payload is returned. As soon as
+    either is given, only the listed columns (default: all) and the listed
+    relations (default: none) are serialized.
+    """
+    if fields is None and expand is None:
+        return None, None
+
+    def _split(raw, allowed, kind):
+        names = [n.strip() for n in (raw or "").split(",") if n.strip()]
+        unknown = [n for n in names if n not in allowed]
+        if unknown:
+            raise ValueError(
+                f"Unknown {kind}: {', '.join(unknown)}. "
+                f"Allowed: {', '.join(allowed)}"
+            )
+        return tuple(names)
+
+    scalar = _split(fields, Meeting.SCALAR_FIELDS, "fields") or Meeting.SCALAR_FIELDS
+    if "id" not in scalar:
+        scalar = ("id",) + scalar
+    relations = _split(expand, Meeting.RELATION_FIELDS, "expand")
+    return scalar, relations
+
+
+def start_meeting(meeting_id: int, expected_version: int | None = None) -> Meeting:
     """Transition meeting from Scheduled → InProgress."""
-    meeting = get_meeting(meeting_id)
-    validate_transition(meeting.status, "InProgress")
-    meeting.status = "InProgress"
-    db.session.commit()
+    with unit_of_work():
+        meeting = get_meeting(meeting_id)
+        check_expected_version(meeting, expected_version)
+        validate_transition(meeting.status, "InProgress")
+        touch_meeting(meeting_id, expected_version=meeting.version, status="InProgress")
+        meeting_changed(meeting_id, "meeting.started", {"status": "InProgress"})
     logger.info("Meeting %s started.", meeting_id)
     return meeting
 
 
-def close_meeting(meeting_id: int) -> Meeting:
+def close_meeting(meeting_id: int, expected_version: int | None = None) -> Meeting:
     """Transition meeting from InProgress → Closed.
 
     Pre-conditions:
         - At least 1 action item
         - All action items have owner and deadline
     """
-    meeting = get_meeting(meeting_id)
-    validate_transition(meeting.status, "Closed")
+    with unit_of_work():
+        meeting = get_meeting(meeting_id)
+        check_expected_version(meeting, expected_version)
+        validate_transition(meeting.status, "Closed")
 
-    if len(meeting.action_items) == 0:
-        raise ValueError("Cannot close meeting without at least one action item.")
+        if len(meeting.action_items) == 0:
+            raise ValueError("Cannot close meeting without at least one action item.")
 
-    for ai in meeting.action_items:
-        if not ai.owner or not ai.owner.strip():
-            raise ValueError(f"Action item '{ai.description}' is missing an owner.")
-        if not ai.deadline:
-            raise ValueError(f"Action item '{ai.description}' is missing a deadline.")
+        for ai in meeting.action_items:
+            if not ai.owner or not ai.owner.strip():
+                raise ValueError(f"Action item '{ai.description}' is missing an owner.")
+            if not ai.deadline:
+                raise ValueError(f"Action item '{ai.description}' is missing a deadline.")
 
-    meeting.status = "Closed"
-    meeting.closed_at = datetime.now(timezone.utc)
-    db.session.commit()
+        # The version check also catches action items added since they were
+        # checked above: adding one bumps the version.
+        closed_at = datetime.now(timezone.utc)
+        touch_meeting(
+            meeting_id,
+            expected_version=meeting.version,
+            status="Closed",
+            closed_at=closed_at,
+        )
+        meeting_changed(
+            meeting_id,
+            "meeting.closed",
+            {"status": "Closed", "closed_at": closed_at.isoformat()},
+        )
+        # Queued in the same transaction: the jobs exist iff the meeting closed
+        jobs.enqueue(
+            "review_draft", {"meeting_id": meeting_id}, key=f"review_draft:{meeting_id}"
+        )
+        if _precompute_reaches_readers():
+            jobs.enqueue("dashboard_precompute", key="dashboard_precompute", dedupe=True)
     logger.info("Meeting %s closed.", meeting_id)
     return meeting
 
 
-def mark_reviewed(meeting_id: int) -> Meeting:
-    """Transition meeting from Closed → Reviewed (called after review creation)."""
-    meeting = get_meeting(meeting_id)
-    validate_transition(meeting.status, "Reviewed")
-    meeting.status = "Reviewed"
-    db.session.commit()
+def _precompute_reaches_readers() -> bool:
+    """Whether a warmed dashboard entry can be served to web requests.
+
+    A separate worker process only fills its own memory cache, so the
+    precompute job is worth queueing with a shared cache or when jobs run
+    inside the web process.
+    """
+    if cache.shared:
+        return True
+    return cache.backend.name == "memory" and jobs.runner != "worker"
+
+
+def mark_reviewed(meeting_id: int, expected_version: int | None = None) -> Meeting:
+    """Transition meeting from Closed → Reviewed (part of review creation)."""
+    with unit_of_work():
+        meeting = get_meeting(meeting_id)
+        if expected_version is None:
+            expected_version = meeting.version
+        validate_transition(meeting.status, "Reviewed")
+        touch_meeting(meeting_id, expected_version=expected_version, status="Reviewed")
+        meeting_changed(meeting_id, "meeting.reviewed", {"status": "Reviewed"})
     logger.info("Meeting %s reviewed.", meeting_id)
     return meeting
 
 
-def get_dashboard_stats():
-    """Return dashboard aggregates."""
+def get_dashboard_counts() -> dict:
+    """Compute every dashboard counter in a single round-trip.
+
+    Both tables are aggregated in the database with conditional sums; the
+    overdue classification uses ``ActionItem.is_overdue`` in its SQL form
+    (``deadline < CURRENT_DATE``), so no rows are materialized in Python.
+    """
     from models import ActionItem
-    from datetime import date
 
-    upcoming = Meeting.query.filter(
-        Meeting.status.in_(["Scheduled", "InProgress"])
-    ).order_by(Meeting.scheduled_time.asc()).all()
+    def _count_if(condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+    meeting_counts = (
+        select(
+            _count_if(Meeting.status.in_(UPCOMING_STATES)).label("upcoming"),
+            _count_if(Meeting.status == "Closed").label("pending_review"),
+        )
+        .where(Meeting.status.in_(UPCOMING_STATES + ("Closed",)))
+        .subquery()
+    )
+    action_counts = (
+        select(
+            func.count().label("open_actions"),
+            _count_if(ActionItem.is_overdue).label("overdue_actions"),
+        )
+        .where(ActionItem.status == "Open")
+        .subquery()
+    )
+    # Both subqueries return exactly one row: cross join them.
+    row = db.session.execute(
+        select(meeting_counts, action_counts).select_from(
+            meeting_counts.join(action_counts, true())
+        )
+    ).one()
+    return {name: int(value) for name, value in row._mapping.items()}
 
-    pending_review = Meeting.query.filter_by(status="Closed").all()
 
-    open_actions = ActionItem.query.filter_by(status="Open").all()
-    overdue_actions = [a for a in open_actions if a.is_overdue]
+def get_dashboard_stats(limit: int = DASHBOARD_LIST_LIMIT, version: str | None = None):
+    """Return dashboard aggregates, served from the response cache.
+
+    Counts come from ``get_dashboard_counts``; each list holds at most
+    ``limit`` entries. Action item lists continue via
+    ``action_item_service.get_open_actions_page`` using ``next_cursors``.
+    ``version`` is the ``get_global_version`` stamp the caller read, if any.
+    Overdue lists and counts change at midnight without a write; the entry
+    still rolls over then because ``cache.get_or_build`` puts today's date
+    in every key.
+    """
+    return cache.get_or_build(
+        "dashboard", f"stats:{limit}:{version}", lambda: _build_dashboard_stats(limit)
+    )
+
+
+def _build_dashboard_stats(limit: int) -> dict:
+    from services.action_item_service import get_open_actions_page
+
+    detail = loader_options("detail")
+    upcoming = (
+        Meeting.query.options(*detail)
+        .filter(Meeting.status.in_(UPCOMING_STATES))
+        .order_by(Meeting.scheduled_time.asc(), Meeting.id.asc())
+        .limit(limit)
+        .all()
+    )
+    pending_review = (
+        Meeting.query.options(*detail)
+        .filter_by(status="Closed")
+        .order_by(Meeting.scheduled_time.asc(), Meeting.id.asc())
+        .limit(limit)
+        .all()
+    )
+    open_actions, open_cursor = get_open_actions_page(limit=limit)
+    overdue_actions, overdue_cursor = get_open_actions_page(overdue=True, limit=limit)
 
     return {
         "upcoming_meetings": [m.to_dict() for m in upcoming],
         "pending_review": [m.to_dict() for m in pending_review],
         "open_action_items": [a.to_dict() for a in open_actions],
         "overdue_action_items": [a.to_dict() for a in overdue_actions],
-        "counts": {
-            "upcoming": len(upcoming),
-            "pending_review": len(pending_review),
-            "open_actions": len(open_actions),
-            "overdue_actions": len(overdue_actions),
+        "next_cursors": {
+            "open_action_items": open_cursor,
+            "overdue_action_items": overdue_cursor,
         },
+        "counts": get_dashboard_counts(),
     }
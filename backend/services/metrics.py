@@ -0,0 +1,301 @@
+"""Request-level performance metrics, exposed as Prometheus text.
+
+``metrics.init_app(app)`` instruments every Flask request:
+
+- latency per endpoint (the URL rule, e.g. ``/api/meetings/<int:meeting_id>``)
+- SQL statements and time spent in the database per request, from
+  ``before/after_cursor_execute`` events on every engine (failed statements
+  via ``handle_error``)
+- JSON encoding time (``app.json.response``)
+
+and, outside of requests, cumulative time per SQL statement shape (literal
+values and ``IN`` lists collapsed) and AI provider latency (recorded by
+``ai_gateway``). ``GET /api/metrics`` renders everything in the Prometheus
+text format. Numbers are per process, like the memory cache.
+
+A request slower than ``SLOW_REQUEST_MS`` is logged with its statement
+count and its slowest statements; statements repeated within one request
+(the N+1 signature) are listed with their repeat count.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter as _Tally
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "claritymeet_"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+DEFAULT_SLOW_REQUEST_MS = 500
+SLOW_LOG_STATEMENTS = 5
+REPEATED_STATEMENT_THRESHOLD = 5
+
+_IN_LIST = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s|%s|:\w+)\s*,?)+\)")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_SPACE = re.compile(r"\s+")
+
+
+def statement_shape(sql: str) -> str:
+    """Collapse literals, placeholder lists and whitespace so that the same
+    query with different parameters maps to one label."""
+    sql = _SPACE.sub(" ", sql).strip()
+    sql = _IN_LIST.sub("(?)", sql)
+    return _LITERAL.sub("?", sql)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=()) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)] + list(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels=()):
+        self.name, self.help, self.labels = PREFIX + name, help, tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(labels[n] for n in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(tuple(labels[n] for n in self.labels), 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_labels(self.labels, key)} {value:g}"
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels=(), buckets=LATENCY_BUCKETS):
+        self.name, self.help, self.labels = PREFIX + name, help, tuple(labels)
+        self.buckets = tuple(buckets)
+        self._values = {}  # labels -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(labels[n] for n in self.labels)
+        with self._lock:
+            row = self._values.setdefault(key, [0] * (len(self.buckets) + 2))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+            row[-2] += value
+            row[-1] += 1
+
+    def count(self, **labels) -> int:
+        row = self._values.get(tuple(labels[n] for n in self.labels))
+        return row[-1] if row else 0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        for key, row in items:
+            for bound, n in zip(self.buckets, row):
+                le = _labels(self.labels, key, [f'le="{bound:g}"'])
+                yield f"{self.name}_bucket{le} {n}"
+            inf = _labels(self.labels, key, ['le="+Inf"'])
+            yield f"{self.name}_bucket{inf} {row[-1]}"
+            yield f"{self.name}_sum{_labels(self.labels, key)} {row[-2]:g}"
+            yield f"{self.name}_count{_labels(self.labels, key)} {row[-1]}"
+
+
+class _RequestStats:
+    __slots__ = ("started", "statements", "db_seconds", "encode_seconds")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.statements = []  # (seconds, sql)
+        self.db_seconds = 0.0
+        self.encode_seconds = 0.0
+
+
+class Metrics:
+    def __init__(self):
+        self.slow_request_seconds = DEFAULT_SLOW_REQUEST_MS / 1000
+        self.requests = Counter(
+            "http_requests_total", "HTTP requests.", ("method", "endpoint", "status")
+        )
+        self.latency = Histogram(
+            "http_request_duration_seconds", "HTTP request latency.", ("method", "endpoint")
+        )
+        self.db_queries = Histogram(
+            "db_queries_per_request",
+            "SQL statements issued per request.",
+            ("endpoint",),
+            QUERY_COUNT_BUCKETS,
+        )
+        self.db_time = Histogram(
+            "db_seconds_per_request", "Time spent in SQL per request.", ("endpoint",)
+        )
+        self.encode_time = Histogram(
+            "json_encode_seconds", "JSON response encoding time.", ("endpoint",)
+        )
+        self.repeated = Counter(
+            "db_repeated_statements_total",
+            f"Requests that ran one statement shape {REPEATED_STATEMENT_THRESHOLD}+ "
+            "times (likely N+1).",
+            ("endpoint", "statement"),
+        )
+        self.statement_time = Counter(
+            "db_statement_seconds_total", "Cumulative time per SQL statement shape.", ("statement",)
+        )
+        self.statement_calls = Counter(
+            "db_statement_calls_total", "Executions per SQL statement shape.", ("statement",)
+        )
+        self.statement_errors = Counter(
+            "db_statement_errors_total",
+            "Failed executions per SQL statement shape.",
+            ("statement",),
+        )
+        self.ai_latency = Histogram(
+            "ai_provider_seconds", "AI provider call latency.", ("task", "mode", "outcome")
+        )
+        self.ai_fallbacks = Counter(
+            "ai_fallbacks_total", "AI requests answered by the heuristic fallback.", ("task",)
+        )
+        self.families = [
+            self.requests,
+            self.latency,
+            self.db_queries,
+            self.db_time,
+            self.encode_time,
+            self.repeated,
+            self.statement_time,
+            self.statement_calls,
+            self.statement_errors,
+            self.ai_latency,
+            self.ai_fallbacks,
+        ]
+        self._listening = False
+
+    def init_app(self, app) -> None:
+        self.slow_request_seconds = (
+            app.config.get("SLOW_REQUEST_MS", DEFAULT_SLOW_REQUEST_MS) / 1000
+        )
+        if not self._listening:
+            # Class-level: covers every engine, including ones created later
+            event.listen(Engine, "before_cursor_execute", self._before_cursor)
+            event.listen(Engine, "after_cursor_execute", self._after_cursor)
+            event.listen(Engine, "handle_error", self._statement_failed)
+            self._listening = True
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        self._time_encoding(app)
+
+    # ─── Database ───────────────────────────────────────
+
+    # The start time lives on the execution context, not the connection: a
+    # statement that raises never reaches after_cursor_execute, and a value
+    # left on the pooled connection would skew every later timing on it.
+
+    def _before_cursor(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_started = time.perf_counter()
+
+    def _after_cursor(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_metrics_started", None)
+        if started is not None:
+            self._record_statement(time.perf_counter() - started, statement)
+
+    def _statement_failed(self, exception_context) -> None:
+        started = getattr(exception_context.execution_context, "_metrics_started", None)
+        if started is None or exception_context.statement is None:
+            return
+        seconds = time.perf_counter() - started
+        self._record_statement(seconds, exception_context.statement)
+        self.statement_errors.inc(statement=statement_shape(exception_context.statement))
+
+    def _record_statement(self, seconds: float, statement: str) -> None:
+        shape = statement_shape(statement)
+        self.statement_time.inc(seconds, statement=shape)
+        self.statement_calls.inc(statement=shape)
+        if has_request_context():
+            stats = g.get("metrics")
+            if stats is not None:
+                stats.statements.append((seconds, shape))
+                stats.db_seconds += seconds
+
+    # ─── Requests ───────────────────────────────────────
+
+    def _time_encoding(self, app) -> None:
+        respond = app.json.response
+
+        def timed_response(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return respond(*args, **kwargs)
+            finally:
+                stats = g.get("metrics") if has_request_context() else None
+                if stats is not None:
+                    stats.encode_seconds += time.perf_counter() - started
+
+        app.json.response = timed_response
+
+    def _start_request(self) -> None:
+        g.metrics = _RequestStats()
+
+    def _finish_request(self, response):
+        stats = g.pop("metrics", None)
+        if stats is None:
+            return response
+        elapsed = time.perf_counter() - stats.started
+        endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+        method = request.method
+
+        self.requests.inc(method=method, endpoint=endpoint, status=response.status_code)
+        self.latency.observe(elapsed, method=method, endpoint=endpoint)
+        self.db_queries.observe(len(stats.statements), endpoint=endpoint)
+        self.db_time.observe(stats.db_seconds, endpoint=endpoint)
+        if stats.encode_seconds:
+            self.encode_time.observe(stats.encode_seconds, endpoint=endpoint)
+
+        repeats = _Tally(shape for _, shape in stats.statements)
+        repeated = [(s, n) for s, n in repeats.items() if n >= REPEATED_STATEMENT_THRESHOLD]
+        for shape, _ in repeated:
+            self.repeated.inc(endpoint=endpoint, statement=shape)
+        if elapsed >= self.slow_request_seconds:
+            self._log_slow(method, endpoint, elapsed, stats, repeated)
+        return response
+
+    def _log_slow(self, method, endpoint, elapsed, stats, repeated) -> None:
+        slowest = sorted(stats.statements, reverse=True)[:SLOW_LOG_STATEMENTS]
+        lines = [
+            f"Slow request: {method} {endpoint} took {elapsed * 1000:.0f} ms "
+            f"({len(stats.statements)} statements, {stats.db_seconds * 1000:.0f} ms in SQL)"
+        ]
+        lines += [f"  {seconds * 1000:7.1f} ms  {sql}" for seconds, sql in slowest]
+        lines += [f"  repeated x{n}: {sql}" for sql, n in repeated]
+        logger.warning("\n".join(lines))
+
+    # ─── Exposition ─────────────────────────────────────
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (0.0.4)."""
+        lines = []
+        for family in self.families:
+            lines.append(f"# HELP {family.name} {family.help}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            lines.extend(family.samples())
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
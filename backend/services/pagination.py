@@ -0,0 +1,44 @@
+"""Keyset (cursor) pagination helpers.
+
+Cursors are opaque to clients: a URL-safe base64 encoding of the sort key
+of the last row on a page. The next page is fetched with a row-value
+comparison against that key, so every page costs the same index range scan
+no matter how deep the client has paged.
+"""
+
+import base64
+import json
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+def parse_limit(raw, default: int = DEFAULT_LIMIT, maximum: int = MAX_LIMIT) -> int:
+    """Parse a ``limit`` query parameter, clamped to ``maximum``."""
+    if raw is None or raw == "":
+        return default
+    try:
+        limit = int(raw)
+    except (TypeError, ValueError):
+        raise ValueError("Limit must be a positive integer.")
+    if limit <= 0:
+        raise ValueError("Limit must be a positive integer.")
+    return min(limit, maximum)
+
+
+def encode_cursor(*key) -> str:
+    """Encode a sort key (strings / numbers) into an opaque cursor."""
+    raw = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, arity: int) -> list:
+    """Decode a cursor produced by ``encode_cursor`` or raise ValueError."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor.")
+    if not isinstance(key, list) or len(key) != arity:
+        raise ValueError("Invalid cursor.")
+    return key
@@ -2,14 +2,50 @@
 
 import logging
 
-from models import db, Review
-from services.meeting_service import get_meeting, mark_reviewed
+from sqlalchemy.exc import IntegrityError
+
+from models import Review
+from services.meeting_service import (
+    ConflictError,
+    check_expected_version,
+    get_meeting,
+    mark_reviewed,
+    meeting_changed,
+)
+from services.unit_of_work import unit_of_work
 
 logger = logging.getLogger(__name__)
 
 
+def _check_reviewable(status: str) -> None:
+    if status != "Closed":
+        raise ValueError(
+            f"Cannot review a meeting with status '{status}'. "
+            "Meeting must be Closed."
+        )
+
+
+def _validate_review(summary, outcome_rating, followup_required) -> str:
+    """Validate a review's fields; return the cleaned summary."""
+    if not isinstance(summary, str) or not summary.strip():
+        raise ValueError("Summary is required.")
+
+    if outcome_rating not in (1, 2, 3, 4, 5):
+        raise ValueError("Outcome rating must be between 1 and 5.")
+
+    if outcome_rating < 3 and not followup_required:
+        raise ValueError(
+            "Follow-up is required when outcome rating is below 3."
+        )
+    return summary.strip()
+
+
 def create_review(
-    meeting_id: int, summary: str, outcome_rating: int, followup_required: bool
+    meeting_id: int,
+    summary: str,
+    outcome_rating: int,
+    followup_required: bool,
+    expected_version: int | None = None,
 ) -> Review:
     """Create a review for a closed meeting.
 
@@ -18,40 +54,34 @@ def create_review(
         - Only one review per meeting
         - Rating 1-5
         - If rating < 3 → followup_required must be True
+
+    The review and the Closed → Reviewed transition commit together.
     """
     meeting = get_meeting(meeting_id)
-
-    if meeting.status != "Closed":
-        raise ValueError(
-            f"Cannot review a meeting with status '{meeting.status}'. "
-            "Meeting must be Closed."
-        )
+    check_expected_version(meeting, expected_version)
+    _check_reviewable(meeting.status)
 
     if meeting.review is not None:
         raise ValueError("This meeting already has a review.")
 
-    if not summary or not summary.strip():
-        raise ValueError("Summary is required.")
-
-    if outcome_rating not in (1, 2, 3, 4, 5):
-        raise ValueError("Outcome rating must be between 1 and 5.")
+    summary = _validate_review(summary, outcome_rating, followup_required)
 
-    if outcome_rating < 3 and not followup_required:
-        raise ValueError(
-            "Follow-up is required when outcome rating is below 3."
+    with unit_of_work() as session:
+        # Transition first: of two concurrent reviews only one passes the
+        # version check, so the loser never reaches the unique constraint.
+        mark_reviewed(meeting_id, expected_version=meeting.version)
+        review = Review(
+            meeting_id=meeting_id,
+            summary=summary,
+            outcome_rating=outcome_rating,
+            followup_required=followup_required,
         )
-
-    review = Review(
-        meeting_id=meeting_id,
-        summary=summary.strip(),
-        outcome_rating=outcome_rating,
-        followup_required=followup_required,
-    )
-    db.session.add(review)
-    db.session.commit()
-
-    # Transition meeting to Reviewed
-    mark_reviewed(meeting_id)
+        session.add(review)
+        try:
+            session.flush()
+        except IntegrityError:
+            raise ConflictError("This meeting already has a review.")
+        meeting_changed(meeting_id, "review.created", {"review": review.to_dict()})
 
     logger.info(
         "Review created for meeting %s: rating=%s followup=%s",
@@ -0,0 +1,95 @@
+"""Ranked full-text search over meetings, agenda topics, action items and reviews.
+
+Backed by the indexes in ``models.search``: ``tsvector`` + GIN with
+``plainto_tsquery`` / ``ts_rank_cd`` on PostgreSQL, FTS5 with ``bm25``
+on SQLite. Every word of the query must match (stemmed, case-insensitive).
+Each searched table contributes its best ``limit`` matches straight from its
+index; those are merged by score, so the cost depends on the number of
+matches rather than the size of the tables.
+"""
+
+import re
+
+from sqlalchemy import text
+
+from models import db
+from models.search import SEARCHABLE, TS_CONFIG
+
+DEFAULT_LIMIT = 20
+_WORD = re.compile(r"\w+")
+
+
+def parse_types(raw: str | None) -> tuple[str, ...]:
+    """Parse ``?type=meeting,review`` (empty: every type)."""
+    if not raw:
+        return tuple(SEARCHABLE)
+    types = tuple(t.strip() for t in raw.split(",") if t.strip())
+    unknown = [t for t in types if t not in SEARCHABLE]
+    if unknown:
+        raise ValueError(
+            f"Unknown type: {', '.join(unknown)}. Allowed: {', '.join(SEARCHABLE)}"
+        )
+    return types
+
+
+def _meeting_id(kind: str) -> str:
+    return "t.id" if kind == "meeting" else "t.meeting_id"
+
+
+def _postgres_branch(kind: str) -> str:
+    model, column = SEARCHABLE[kind]
+    return (
+        f"SELECT * FROM (SELECT '{kind}' AS type, t.id AS id,"
+        f" {_meeting_id(kind)} AS meeting_id, t.{column} AS text,"
+        " ts_rank_cd(t.search_vector, q) AS score"
+        f" FROM {model.__tablename__} t,"
+        f" plainto_tsquery('{TS_CONFIG}', :q) q"
+        " WHERE t.search_vector @@ q ORDER BY score DESC LIMIT :limit) AS s"
+    )
+
+
+def _sqlite_branch(kind: str) -> str:
+    model, column = SEARCHABLE[kind]
+    table = model.__tablename__
+    return (
+        f"SELECT * FROM (SELECT '{kind}' AS type, t.id AS id,"
+        f" {_meeting_id(kind)} AS meeting_id, t.{column} AS text,"
+        f" -{table}_fts.rank AS score"
+        f" FROM {table}_fts JOIN {table} t ON t.id = {table}_fts.rowid"
+        f" WHERE {table}_fts MATCH :q ORDER BY {table}_fts.rank LIMIT :limit)"
+    )
+
+
+def search(q: str, types=None, limit: int = DEFAULT_LIMIT) -> list[dict]:
+    """Return up to ``limit`` matches, best first.
+
+    Each result is ``{type, id, meeting_id, meeting_title, text, score}``;
+    ``score`` is only comparable within one database backend.
+    """
+    if not q or not q.strip():
+        raise ValueError("Query (q) is required.")
+    words = _WORD.findall(q)
+    if not words:
+        return []
+    types = types or tuple(SEARCHABLE)
+
+    # Only words reach the index: no operators from either query syntax
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        branches, term = [_postgres_branch(t) for t in types], " ".join(words)
+    elif dialect == "sqlite":
+        branches = [_sqlite_branch(t) for t in types]
+        term = " ".join('"' + w + '"' for w in words)
+    else:
+        raise ValueError(f"Search is not supported on {dialect}.")
+
+    stmt = text(
+        "SELECT r.type, r.id, r.meeting_id, m.title AS meeting_title, r.text, r.score"
+        f" FROM ({' UNION ALL '.join(branches)}) r"
+        " JOIN meetings m ON m.id = r.meeting_id"
+        " ORDER BY r.score DESC, r.type, r.id LIMIT :limit"
+    )
+    rows = db.session.execute(stmt, {"q": term, "limit": limit})
+    return [
+        {**row._asdict(), "score": round(float(row.score), 6)} for row in rows
+    ]
@@ -0,0 +1,63 @@
+"""Unit of work: one transaction, one commit per service operation.
+
+Every service mutation runs inside ``unit_of_work()``. Units nest: an inner
+unit (e.g. ``enqueue`` called from ``close_meeting``) joins the outermost
+one, and only the outermost unit commits — or rolls everything back if any
+part raises. Side effects that must only happen once the data is durable
+(cache invalidation, meeting events, waking the job runner) are registered
+with ``after_commit`` and run after that single commit; on rollback they
+are dropped.
+"""
+
+import logging
+from contextlib import contextmanager
+
+from models import db
+
+logger = logging.getLogger(__name__)
+
+_DEPTH = "uow_depth"
+_HOOKS = "uow_after_commit"
+
+
+@contextmanager
+def unit_of_work():
+    """Run the block in the current unit, or start (and commit) a new one."""
+    session = db.session
+    info = session.info
+    depth = info.get(_DEPTH, 0)
+    if depth == 0:
+        info[_HOOKS] = []
+    info[_DEPTH] = depth + 1
+    try:
+        yield session
+        if depth == 0:
+            session.commit()
+    except BaseException:
+        if depth == 0:
+            session.rollback()
+            info.pop(_HOOKS, None)
+        raise
+    finally:
+        info[_DEPTH] = depth
+
+    if depth == 0:
+        for hook, args in info.pop(_HOOKS, []):
+            try:
+                hook(*args)
+            except Exception:
+                # The transaction is committed; a failed side effect must not
+                # turn a successful request into an error.
+                logger.exception("after-commit hook %r failed", hook)
+
+
+def after_commit(hook, *args) -> None:
+    """Call ``hook(*args)`` once the current unit has committed.
+
+    Outside of a unit there is nothing pending, so the hook runs right away.
+    """
+    info = db.session.info
+    if info.get(_DEPTH, 0):
+        info[_HOOKS].append((hook, args))
+    else:
+        hook(*args)
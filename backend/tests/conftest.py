@@ -3,15 +3,60 @@
 Uses a separate test PostgreSQL schema or SQLite in-memory for isolation.
 """
 
+import json
 import os
 import sys
+import threading
+import time
+from contextlib import contextmanager
+
 import pytest
+from sqlalchemy import event
 
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app import create_app
 from models import db as _db
+from services.cache_service import cache
+
+PERF_BUDGETS_PATH = os.path.join(os.path.dirname(__file__), "perf_budgets.json")
+_budgets_key = pytest.StashKey[dict]()
+_observed_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf budgets")
+    group.addoption(
+        "--update-perf-budgets",
+        action="store_true",
+        help="Record observed query counts in tests/perf_budgets.json instead of failing.",
+    )
+    group.addoption(
+        "--perf-time-scale",
+        type=float,
+        default=float(os.getenv("PERF_TIME_SCALE", "1")),
+        help="Multiply latency budgets (slow machines); 0 disables them.",
+    )
+
+
+def pytest_configure(config):
+    with open(PERF_BUDGETS_PATH) as f:
+        config.stash[_budgets_key] = json.load(f)
+    config.stash[_observed_key] = {}
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    observed = config.stash.get(_observed_key, {})
+    if not config.getoption("--update-perf-budgets") or not observed:
+        return
+    budgets = config.stash[_budgets_key]
+    for key, queries in observed.items():
+        budgets.setdefault(key, {})["queries"] = queries
+    with open(PERF_BUDGETS_PATH, "w") as f:
+        json.dump(dict(sorted(budgets.items())), f, indent=2)
+        f.write("\n")
 
 
 @pytest.fixture(scope="session")
@@ -28,6 +73,7 @@ def db(app):
     """Provide clean database for each test."""
     with app.app_context():
         _db.create_all()
+        cache.clear()
         yield _db
         _db.session.rollback()
         _db.drop_all()
@@ -37,3 +83,81 @@ def db(app):
 def client(app, db):
     """Test client."""
     return app.test_client()
+
+
+@pytest.fixture
+def count_queries(db):
+    """Context manager collecting every SQL statement issued inside it.
+
+    Usage::
+
+        with count_queries() as statements:
+            client.get("/api/meetings")
+        assert len(statements) <= 3
+    """
+
+    @contextmanager
+    def _count():
+        statements = []
+        thread = threading.get_ident()
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            # Only the test's own thread: background job threads share the engine
+            if threading.get_ident() == thread:
+                statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+
+    return _count
+
+
+@pytest.fixture
+def perf_budget(request, count_queries):
+    """Context manager failing the test when the block exceeds its budget.
+
+    Budgets are per endpoint, stored in ``tests/perf_budgets.json`` as
+    ``{"GET /api/dashboard": {"queries": 10, "ms": 300}}``; ``queries`` and
+    ``ms`` arguments override them. Usage::
+
+        with perf_budget("GET /api/dashboard"):
+            client.get("/api/dashboard")
+
+    After an intended change, ``pytest --update-perf-budgets`` rewrites the
+    stored query counts with the observed ones (review the diff).
+    ``--perf-time-scale`` (or ``PERF_TIME_SCALE``) scales the ``ms``
+    budgets; 0 turns them off.
+    """
+    config = request.config
+    update = config.getoption("--update-perf-budgets")
+    scale = config.getoption("--perf-time-scale")
+
+    @contextmanager
+    def _budget(key, queries=None, ms=None):
+        stored = config.stash[_budgets_key].get(key, {})
+        with count_queries() as statements:
+            started = time.perf_counter()
+            yield statements
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+        observed = config.stash[_observed_key]
+        observed[key] = max(observed.get(key, 0), len(statements))
+        if update:
+            return
+        limit = queries if queries is not None else stored.get("queries")
+        if limit is None:
+            pytest.fail(f"No query budget for {key!r}; run pytest --update-perf-budgets")
+        assert len(statements) <= limit, (
+            f"{key}: {len(statements)} SQL statements, budget {limit}:\n"
+            + "\n".join(statements)
+        )
+        limit_ms = ms if ms is not None else stored.get("ms")
+        if limit_ms and scale:
+            assert elapsed_ms <= limit_ms * scale, (
+                f"{key}: took {elapsed_ms:.0f} ms, budget {limit_ms * scale:.0f} ms"
+            )
+
+    return _budget
@@ -0,0 +1,282 @@
+"""AI provider gateway (batching, limits, timeouts, fallback), suggestion
+cache and streaming routes."""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine
+
+from services import ai_service
+from services.ai_cache import DatabaseBackend, suggestion_cache, suggestion_key
+from services.ai_gateway import gateway
+from services.ai_providers import AIProvider, FakeProvider, load_provider
+
+
+class SlowProvider(AIProvider):
+    """Tracks how many batches are in flight at once."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    async def complete_batch(self, task, payloads):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        return [[{"topic": p["title"], "time_allocation": 5}] for p in payloads]
+
+
+class StaticProvider(AIProvider):
+    def __init__(self, result):
+        self.result = result
+
+    async def complete_batch(self, task, payloads):
+        return [self.result for _ in payloads]
+
+
+class StallingProvider(AIProvider):
+    """Streams one suggestion, then hangs."""
+
+    async def stream(self, task, payload):
+        yield {"topic": "First", "time_allocation": 5}
+        await asyncio.sleep(10)
+
+
+@pytest.fixture
+def use_provider():
+    def _use(provider, **options):
+        gateway.configure(provider=provider, **options)
+        return provider
+
+    suggestion_cache.clear()
+    yield _use
+    gateway.configure(provider=None)
+    suggestion_cache.clear()
+
+
+HEURISTIC_TOPIC = "Review progress on Sprint Planning"
+
+
+class TestAIGateway:
+    def test_heuristic_without_provider(self):
+        suggestions = ai_service.suggest_agenda_topics("Sprint Planning")
+        assert suggestions[0]["topic"] == HEURISTIC_TOPIC
+
+    def test_fake_provider_is_deterministic(self, use_provider):
+        use_provider(FakeProvider())
+        first = ai_service.suggest_agenda_topics("Sprint Planning")
+        assert first == ai_service.suggest_agenda_topics("Sprint Planning")
+        assert first[0]["topic"] == "Goals for Sprint Planning"
+
+    def test_concurrent_requests_are_batched(self, use_provider):
+        provider = use_provider(FakeProvider(latency=0.05), batch_window_ms=50)
+        with ThreadPoolExecutor(20) as pool:
+            results = list(
+                pool.map(lambda i: ai_service.suggest_agenda_topics(f"Topic {i}"), range(20))
+            )
+        assert [r[0]["topic"] for r in results] == [f"Goals for Topic {i}" for i in range(20)]
+        assert sum(provider.batches) == 20
+        assert len(provider.batches) < 20
+
+    def test_concurrency_is_limited(self, use_provider):
+        provider = use_provider(SlowProvider(0.05), max_concurrency=2, max_batch=1)
+        with ThreadPoolExecutor(10) as pool:
+            list(pool.map(lambda i: ai_service.suggest_agenda_topics(f"T{i}"), range(10)))
+        assert provider.peak <= 2
+
+    def test_timeout_falls_back_to_heuristic(self, use_provider):
+        use_provider(SlowProvider(1.0), timeout=0.05)
+        suggestions = ai_service.suggest_agenda_topics("Sprint Planning")
+        assert suggestions[0]["topic"] == HEURISTIC_TOPIC
+        assert gateway.fallbacks == 1
+
+    def test_queue_full_sheds_to_heuristic(self, use_provider):
+        use_provider(FakeProvider(), max_pending=0)
+        assert ai_service.suggest_agenda_topics("Sprint Planning")[0]["topic"] == HEURISTIC_TOPIC
+
+    def test_invalid_output_is_dropped(self, use_provider):
+        use_provider(
+            StaticProvider(
+                [
+                    {"topic": "Kept", "time_allocation": 15},
+                    {"topic": "", "time_allocation": 15},
+                    {"topic": "Too long", "time_allocation": 10_000},
+                    "not an object",
+                ]
+            )
+        )
+        assert ai_service.suggest_agenda_topics("x") == [{"topic": "Kept", "time_allocation": 15}]
+
+    def test_ai_cannot_assign_owner_or_deadline(self, use_provider):
+        use_provider(
+            StaticProvider([{"description": "Ship it", "owner": "Mallory", "deadline": "2030-01-01"}])
+        )
+        assert ai_service.suggest_action_items("x", ["a"]) == [
+            {"description": "Ship it", "owner": "", "deadline": ""}
+        ]
+
+    def test_invalid_summary_falls_back(self, use_provider):
+        use_provider(StaticProvider({"summary": "ok", "suggested_rating": 9}))
+        summary = ai_service.summarize_review("Retro", [{"status": "Completed"}])
+        assert summary["suggested_rating"] == 3
+
+    def test_async_variant_uses_provider(self, use_provider):
+        use_provider(FakeProvider())
+        suggestions = asyncio.run(ai_service.suggest_agenda_topics_async("Retro"))
+        assert suggestions[0]["topic"] == "Goals for Retro"
+
+    def test_load_provider(self):
+        assert load_provider("heuristic") is None
+        assert isinstance(load_provider("fake"), FakeProvider)
+        assert isinstance(load_provider("services.ai_providers:FakeProvider"), FakeProvider)
+        with pytest.raises(ValueError):
+            load_provider("nonsense")
+
+
+class TestSuggestionCache:
+    def test_key_ignores_case_whitespace_and_punctuation(self):
+        a = suggestion_key("suggest_agenda", {"title": "Weekly Sync", "context": ""})
+        b = suggestion_key("suggest_agenda", {"title": "  weekly   SYNC. ", "context": ""})
+        c = suggestion_key("suggest_agenda", {"title": "Weekly Sync", "context": "Q3"})
+        assert a == b != c
+
+    def test_summary_key_depends_on_statuses_only(self):
+        items = [{"description": "a", "status": "Open"}, {"description": "b", "status": "Completed"}]
+        reordered = [{"description": "c", "status": "Completed"}, {"description": "d", "status": "Open"}]
+        key = lambda actions: suggestion_key("summarize_review", {"title": "Retro", "action_items": actions})
+        assert key(items) == key(reordered) != key(items[:1])
+
+    def test_repeated_request_skips_provider(self, use_provider):
+        provider = use_provider(FakeProvider())
+        first = ai_service.suggest_agenda_topics("Sprint Planning")
+        assert ai_service.suggest_agenda_topics("sprint planning") == first
+        assert provider.batches == [1]
+        assert suggestion_cache.stats()["hits"] == 1
+
+    def test_fallback_is_not_cached(self, use_provider):
+        provider = use_provider(StaticProvider("garbage"))
+        ai_service.suggest_agenda_topics("Retro")
+        provider.result = [{"topic": "Real", "time_allocation": 5}]
+        assert ai_service.suggest_agenda_topics("Retro")[0]["topic"] == "Real"
+
+    def test_async_variant_is_memoized(self, use_provider):
+        provider = use_provider(FakeProvider())
+        asyncio.run(ai_service.suggest_agenda_topics_async("Retro"))
+        asyncio.run(ai_service.suggest_agenda_topics_async("Retro"))
+        assert provider.batches == [1]
+
+    def test_stats_endpoint(self, client):
+        data = client.get("/api/ai/cache/stats").get_json()
+        assert {"backend", "hits", "misses", "hit_rate"} <= data.keys()
+
+
+class TestDatabaseSuggestionBackend:
+    def test_round_trip_and_expiry(self, db):
+        store = DatabaseBackend(db.engine)
+        store.set("k", "suggest_agenda", [{"topic": "A", "time_allocation": 5}], ttl=60)
+        assert store.get("k") == [{"topic": "A", "time_allocation": 5}]
+        store.set("k", "suggest_agenda", [], ttl=-1)
+        assert store.get("k") is None
+
+    def test_set_overwrites_existing_key(self, db):
+        store = DatabaseBackend(db.engine)
+        store.set("k", "suggest_agenda", [1], ttl=60)
+        store.set("k", "suggest_agenda", [2], ttl=60)
+        assert store.get("k") == [2]
+
+    def test_write_failure_is_logged_not_raised(self, db, monkeypatch):
+        store = DatabaseBackend(db.engine)
+        monkeypatch.setattr(suggestion_cache, "store", store)
+        monkeypatch.setattr(
+            store, "_upsert", lambda conn, values: conn.exec_driver_sql("SELECT * FROM missing")
+        )
+        suggestion_cache.set("k", "suggest_agenda", [1])
+        assert suggestion_cache.memory.get("k") == [1]
+
+    def test_read_failure_is_a_miss(self, db, monkeypatch):
+        store = DatabaseBackend(db.engine)
+        monkeypatch.setattr(suggestion_cache, "store", store)
+        monkeypatch.setattr(
+            store, "engine", create_engine("sqlite:////nonexistent/dir/cache.db")
+        )
+        assert suggestion_cache.get("unreadable") is None
+
+    def test_trims_least_recently_used(self, db):
+        store = DatabaseBackend(db.engine, max_entries=2, evict_every=1)
+        store.set("a", "suggest_agenda", [1], ttl=60)
+        store.set("b", "suggest_agenda", [2], ttl=60)
+        store.get("a")
+        store.set("c", "suggest_agenda", [3], ttl=60)
+        assert store.get("b") is None
+        assert store.get("a") == [1] and store.get("c") == [3]
+
+
+def _events(response):
+    assert response.mimetype == "application/x-ndjson"
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+class TestStreaming:
+    def test_agenda_streams_each_suggestion(self, client, use_provider):
+        use_provider(FakeProvider())
+        events = _events(client.post("/api/ai/suggest-agenda:stream", json={"title": "Retro"}))
+        assert [e["type"] for e in events] == ["suggestion"] * 3 + ["done"]
+        assert events[0]["suggestion"]["topic"] == "Goals for Retro"
+        assert events[-1] == {"type": "done", "fallback": False}
+
+    def test_invalid_items_are_dropped_mid_stream(self, client, use_provider):
+        use_provider(StaticProvider([{"topic": "Ok", "time_allocation": 5}, {"topic": 3}]))
+        events = _events(client.post("/api/ai/suggest-agenda:stream", json={"title": "x"}))
+        assert [e["type"] for e in events] == ["suggestion", "done"]
+
+    def test_actions_never_carry_owner(self, client, use_provider):
+        use_provider(StaticProvider([{"description": "Do", "owner": "Eve", "deadline": "2030-01-01"}]))
+        events = _events(
+            client.post("/api/ai/suggest-actions:stream", json={"title": "x", "agenda_topics": ["a"]})
+        )
+        assert events[0]["suggestion"] == {"description": "Do", "owner": "", "deadline": ""}
+
+    def test_summary_streams_fragments_then_summary(self, client, use_provider):
+        use_provider(FakeProvider())
+        events = _events(
+            client.post(
+                "/api/ai/summarize-review:stream",
+                json={"title": "Retro", "action_items": [{"status": "Completed"}]},
+            )
+        )
+        fragments = [e["text"] for e in events if e["type"] == "fragment"]
+        summary = next(e for e in events if e["type"] == "summary")
+        assert len(fragments) > 1
+        assert "".join(fragments) == summary["summary"]
+        assert summary["suggested_rating"] == 4
+
+    def test_heuristic_stream_without_provider(self, client):
+        events = _events(client.post("/api/ai/suggest-agenda:stream", json={"title": "Retro"}))
+        assert len(events) == 4
+        assert events[-1] == {"type": "done", "fallback": True}
+
+    def test_stall_keeps_streamed_items_and_is_not_cached(self, use_provider):
+        use_provider(StallingProvider(), timeout=0.05)
+        events = list(ai_service.stream_agenda_topics("Retro"))
+        assert events == [
+            {"type": "suggestion", "suggestion": {"topic": "First", "time_allocation": 5}},
+            {"type": "done", "fallback": False},
+        ]
+        assert suggestion_cache.stats()["entries"] == 0
+
+    def test_completed_stream_is_cached(self, use_provider):
+        provider = use_provider(FakeProvider())
+        first = list(ai_service.stream_agenda_topics("Retro"))
+        assert list(ai_service.stream_agenda_topics("retro")) == first
+        assert ai_service.suggest_agenda_topics("Retro") == [
+            e["suggestion"] for e in first if e["type"] == "suggestion"
+        ]
+        assert provider.batches == []
@@ -263,3 +263,478 @@ class TestAgendaRules:
         )
         assert res.status_code == 400
         assert "agenda" in json.loads(res.data)["error"].lower()
+
+    def test_update_rejects_non_integer_allocation(self, client):
+        res = client.post(
+            "/api/meetings",
+            json={"title": "Test", "scheduled_time": _future_time(), "duration_minutes": 30},
+        )
+        mid = json.loads(res.data)["id"]
+        res = client.post(f"/api/meetings/{mid}/agenda", json={"topic": "T", "time_allocation": 10})
+        item_id = json.loads(res.data)["id"]
+
+        for bad in ("x", None, True, 2.5, 0):
+            res = client.patch(f"/api/agenda/{item_id}", json={"time_allocation": bad})
+            assert res.status_code == 400, bad
+
+
+class TestMeetingListPagination:
+    def _create(self, client, title, hours):
+        res = client.post(
+            "/api/meetings",
+            json={
+                "title": title,
+                "scheduled_time": _future_time(hours),
+                "duration_minutes": 30,
+            },
+        )
+        return json.loads(res.data)["id"]
+
+    def test_cursor_walks_all_pages_newest_first(self, client):
+        ids = [self._create(client, f"M{i}", hours=i + 1) for i in range(5)]
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            res = client.get("/api/meetings", query_string=params)
+            assert res.status_code == 200
+            data = json.loads(res.data)
+            assert len(data["meetings"]) <= 2
+            seen.extend(m["id"] for m in data["meetings"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == list(reversed(ids))
+
+    def test_ties_on_scheduled_time_are_not_skipped(self, client):
+        when = _future_time(3)
+        ids = []
+        for i in range(3):
+            res = client.post(
+                "/api/meetings",
+                json={"title": f"Tie {i}", "scheduled_time": when, "duration_minutes": 30},
+            )
+            ids.append(json.loads(res.data)["id"])
+
+        first = json.loads(client.get("/api/meetings?limit=2").data)
+        second = json.loads(
+            client.get(f"/api/meetings?limit=2&cursor={first['next_cursor']}").data
+        )
+        got = [m["id"] for m in first["meetings"] + second["meetings"]]
+        assert sorted(got) == sorted(ids)
+        assert second["next_cursor"] is None
+
+    def test_projection_returns_slim_summary(self, client):
+        self._create(client, "Slim", hours=1)
+
+        res = client.get("/api/meetings?fields=title,status")
+        meeting = json.loads(res.data)["meetings"][0]
+        assert set(meeting) == {"id", "title", "status"}
+
+        res = client.get("/api/meetings?expand=review")
+        meeting = json.loads(res.data)["meetings"][0]
+        assert "review" in meeting
+        assert "agenda_items" not in meeting
+
+    def test_invalid_parameters_rejected(self, client):
+        assert client.get("/api/meetings?cursor=not-a-cursor").status_code == 400
+        assert client.get("/api/meetings?limit=0").status_code == 400
+        assert client.get("/api/meetings?fields=secret").status_code == 400
+
+
+class TestCalendar:
+    BASE = datetime(2030, 1, 7, 9, 0)
+
+    def _create(self, client, title, minutes_from_base, duration):
+        when = self.BASE + timedelta(minutes=minutes_from_base)
+        res = client.post(
+            "/api/meetings",
+            json={"title": title, "scheduled_time": when.isoformat(), "duration_minutes": duration},
+        )
+        return json.loads(res.data)["id"]
+
+    def _at(self, minutes):
+        return (self.BASE + timedelta(minutes=minutes)).isoformat()
+
+    def _conflicts(self, client, **params):
+        res = client.get("/api/meetings/conflicts", query_string=params)
+        assert res.status_code == 200, res.data
+        return json.loads(res.data)
+
+    def test_range_filters_on_start_time(self, client):
+        before = self._create(client, "Before", -60, 30)
+        first = self._create(client, "First", 0, 30)
+        second = self._create(client, "Second", 120, 30)
+        self._create(client, "After", 24 * 60, 30)
+
+        res = client.get(
+            "/api/meetings", query_string={"from": self._at(0), "to": self._at(24 * 60)}
+        )
+        assert res.status_code == 200
+        assert [m["id"] for m in json.loads(res.data)["meetings"]] == [second, first]
+
+        res = client.get("/api/meetings", query_string={"to": self._at(0)})
+        assert [m["id"] for m in json.loads(res.data)["meetings"]] == [before]
+
+    def test_range_pages_with_cursor(self, client):
+        ids = [self._create(client, f"M{i}", i * 60, 30) for i in range(5)]
+        window = {"from": self._at(60), "to": self._at(4 * 60), "limit": 2}
+        first = json.loads(client.get("/api/meetings", query_string=window).data)
+        second = json.loads(
+            client.get(
+                "/api/meetings", query_string={**window, "cursor": first["next_cursor"]}
+            ).data
+        )
+        got = [m["id"] for m in first["meetings"] + second["meetings"]]
+        assert got == [ids[3], ids[2], ids[1]]
+        assert second["next_cursor"] is None
+
+    def test_overlapping_meetings_are_paired(self, client):
+        long = self._create(client, "Offsite", 0, 180)
+        inner = self._create(client, "Standup", 30, 15)
+        late = self._create(client, "Review", 150, 60)
+        self._create(client, "Back to back", 210, 30)
+        self._create(client, "Lunch", 24 * 60, 60)
+
+        data = self._conflicts(client, **{"from": self._at(0), "to": self._at(48 * 60)})
+        pairs = [[m["id"] for m in c["meetings"]] for c in data["conflicts"]]
+        assert pairs == [[long, inner], [long, late]]
+        assert data["truncated"] is False
+        overlap = data["conflicts"][1]
+        assert datetime.fromisoformat(overlap["overlap_start"]).replace(tzinfo=None) == (
+            self.BASE + timedelta(minutes=150)
+        )
+        assert datetime.fromisoformat(overlap["overlap_end"]).replace(tzinfo=None) == (
+            self.BASE + timedelta(minutes=180)
+        )
+
+    def test_meetings_running_into_the_window_count(self, client):
+        early = self._create(client, "Early", -60, 120)
+        inside = self._create(client, "Inside", 30, 30)
+        data = self._conflicts(client, **{"from": self._at(0), "to": self._at(60)})
+        assert [[m["id"] for m in c["meetings"]] for c in data["conflicts"]] == [[early, inside]]
+        assert self._conflicts(client, **{"from": self._at(60), "to": self._at(120)}) == {
+            "conflicts": [],
+            "truncated": False,
+        }
+
+    def test_limit_truncates(self, client):
+        for i in range(4):
+            self._create(client, f"Same slot {i}", 0, 60)
+        data = self._conflicts(client, **{"from": self._at(0), "to": self._at(60), "limit": 3})
+        assert len(data["conflicts"]) == 3
+        assert data["truncated"] is True
+        assert len(self._conflicts(client, **{"from": self._at(0)})["conflicts"]) == 6
+
+    def test_invalid_windows_rejected(self, client):
+        assert client.get("/api/meetings?from=yesterday").status_code == 400
+        assert client.get(
+            "/api/meetings", query_string={"from": self._at(60), "to": self._at(0)}
+        ).status_code == 400
+        assert client.get(
+            "/api/meetings/conflicts", query_string={"from": self._at(0), "to": self._at(0)}
+        ).status_code == 400
+        assert client.get(
+            "/api/meetings/conflicts", query_string={"to": "2040-01-01T00:00:00"}
+        ).status_code == 400
+        assert client.get("/api/meetings/conflicts?limit=0").status_code == 400
+
+
+class TestDashboardAggregates:
+    def _seed_actions(self, db, open_future, open_past, completed_past):
+        from datetime import date
+        from models import ActionItem, Meeting
+
+        meeting = Meeting(
+            title="Seed",
+            scheduled_time=datetime.utcnow(),
+            duration_minutes=30,
+            status="InProgress",
+        )
+        today = date.today()
+        for i in range(open_future):
+            meeting.action_items.append(ActionItem(
+                description=f"future {i}", owner="A",
+                deadline=today + timedelta(days=i + 1), status="Open",
+            ))
+        for i in range(open_past):
+            meeting.action_items.append(ActionItem(
+                description=f"past {i}", owner="A",
+                deadline=today - timedelta(days=i + 1), status="Open",
+            ))
+        for i in range(completed_past):
+            meeting.action_items.append(ActionItem(
+                description=f"done {i}", owner="A",
+                deadline=today - timedelta(days=i + 1), status="Completed",
+            ))
+        db.session.add(meeting)
+        db.session.commit()
+
+    def test_counts_classify_overdue_in_sql(self, client, db):
+        self._seed_actions(db, open_future=3, open_past=2, completed_past=4)
+
+        data = json.loads(client.get("/api/dashboard").data)
+        assert data["counts"] == {
+            "upcoming": 1,
+            "pending_review": 0,
+            "open_actions": 5,
+            "overdue_actions": 2,
+        }
+        assert all(a["is_overdue"] for a in data["overdue_action_items"])
+        assert len(data["overdue_action_items"]) == 2
+
+    def test_action_item_lists_are_paged(self, client, db):
+        self._seed_actions(db, open_future=5, open_past=0, completed_past=0)
+
+        res = client.get("/api/dashboard/action-items?limit=3")
+        first = json.loads(res.data)
+        assert len(first["action_items"]) == 3
+        res = client.get(
+            f"/api/dashboard/action-items?limit=3&cursor={first['next_cursor']}"
+        )
+        second = json.loads(res.data)
+        assert len(second["action_items"]) == 2
+        assert second["next_cursor"] is None
+        deadlines = [a["deadline"] for a in first["action_items"] + second["action_items"]]
+        assert deadlines == sorted(deadlines)
+
+
+class TestOwnerActions:
+    def _seed(self, db):
+        from datetime import date
+        from models import ActionItem, Meeting
+
+        meeting = Meeting(
+            title="Seed",
+            scheduled_time=datetime.utcnow(),
+            duration_minutes=30,
+            status="InProgress",
+        )
+        today = date.today()
+        rows = [
+            ("Alice Smith", 3, "Open"),
+            ("  alice   SMITH ", -2, "Open"),
+            ("ALICE SMITH", -5, "Completed"),
+            ("Alice Smith", 10, "Open"),
+            ("Bob", 1, "Open"),
+        ]
+        for i, (owner, days, status) in enumerate(rows):
+            meeting.action_items.append(ActionItem(
+                description=f"task {i}", owner=owner,
+                deadline=today + timedelta(days=days), status=status,
+            ))
+        db.session.add(meeting)
+        db.session.commit()
+
+    def _get(self, client, query=""):
+        res = client.get(f"/api/owners/alice%20smith/actions{query}")
+        assert res.status_code == 200, res.data
+        return json.loads(res.data)
+
+    def test_owner_matches_case_and_whitespace_insensitively(self, client, db):
+        self._seed(db)
+        data = self._get(client)
+        assert [a["description"] for a in data["action_items"]] == [
+            "task 2", "task 1", "task 0", "task 3",
+        ]
+        assert data["next_cursor"] is None
+
+    def test_filters(self, client, db):
+        self._seed(db)
+        today = datetime.utcnow().date()
+        assert len(self._get(client, "?status=Open")["action_items"]) == 3
+        overdue = self._get(client, "?overdue=true")["action_items"]
+        assert [a["description"] for a in overdue] == ["task 1"]
+        assert self._get(client, "?overdue=true&status=Completed")["action_items"] == []
+        ranged = self._get(
+            client,
+            f"?deadline_from={today.isoformat()}"
+            f"&deadline_to={(today + timedelta(days=5)).isoformat()}",
+        )["action_items"]
+        assert [a["description"] for a in ranged] == ["task 0"]
+
+    def test_cursor_pagination(self, client, db):
+        self._seed(db)
+        first = self._get(client, "?limit=3")
+        assert len(first["action_items"]) == 3
+        second = self._get(client, f"?limit=3&cursor={first['next_cursor']}")
+        assert [a["description"] for a in second["action_items"]] == ["task 3"]
+        assert second["next_cursor"] is None
+
+    def test_new_items_get_an_owner_key(self, client):
+        res = client.post(
+            "/api/meetings",
+            json={"title": "Keys", "scheduled_time": _future_time(), "duration_minutes": 30},
+        )
+        mid = json.loads(res.data)["id"]
+        client.post(
+            f"/api/meetings/{mid}/actions",
+            json={"description": "One", "owner": " Dana  Lee", "deadline": _future_date()},
+        )
+        client.post(
+            f"/api/meetings/{mid}/actions:batch",
+            json={"items": [
+                {"description": "Two", "owner": "DANA LEE", "deadline": _future_date()},
+            ]},
+        )
+        data = json.loads(client.get("/api/owners/Dana Lee/actions").data)
+        assert [a["description"] for a in data["action_items"]] == ["One", "Two"]
+
+    def test_invalid_parameters_rejected(self, client):
+        assert client.get("/api/owners/alice/actions?status=Done").status_code == 400
+        assert client.get("/api/owners/alice/actions?deadline_from=soon").status_code == 400
+        assert client.get(
+            "/api/owners/alice/actions?deadline_from=2030-02-01&deadline_to=2030-01-01"
+        ).status_code == 400
+        assert client.get("/api/owners/%20/actions").status_code == 400
+
+
+class TestBatchCreation:
+    def _meeting(self, client, duration=60):
+        res = client.post(
+            "/api/meetings",
+            json={
+                "title": "Import",
+                "scheduled_time": _future_time(),
+                "duration_minutes": duration,
+            },
+        )
+        return json.loads(res.data)["id"]
+
+    def test_agenda_batch_inserts_all_items(self, client, count_queries):
+        mid = self._meeting(client)
+        items = [{"topic": f"Topic {i}", "time_allocation": 4} for i in range(15)]
+
+        with count_queries() as statements:
+            res = client.post(f"/api/meetings/{mid}/agenda:batch", json={"items": items})
+        assert res.status_code == 201
+        created = json.loads(res.data)["items"]
+        assert [c["topic"] for c in created] == [i["topic"] for i in items]
+        assert sum(1 for s in statements if s.lstrip().upper().startswith("INSERT")) == 1
+
+        meeting = json.loads(client.get(f"/api/meetings/{mid}").data)
+        assert len(meeting["agenda_items"]) == 15
+
+    def test_agenda_batch_reports_per_item_errors(self, client):
+        mid = self._meeting(client, duration=30)
+        client.post(f"/api/meetings/{mid}/agenda", json={"topic": "Existing", "time_allocation": 10})
+
+        res = client.post(
+            f"/api/meetings/{mid}/agenda:batch",
+            json={
+                "items": [
+                    {"topic": "Ok", "time_allocation": 10},
+                    {"topic": "", "time_allocation": 5},
+                    {"topic": "Too long", "time_allocation": 15},
+                ]
+            },
+        )
+        assert res.status_code == 400
+        errors = json.loads(res.data)["errors"]
+        assert [e["index"] for e in errors] == [1, 2]
+        assert "remaining" in errors[1]["error"]
+
+        meeting = json.loads(client.get(f"/api/meetings/{mid}").data)
+        assert len(meeting["agenda_items"]) == 1
+
+    def test_action_batch(self, client):
+        mid = self._meeting(client)
+        client.patch(f"/api/meetings/{mid}/start")
+
+        res = client.post(
+            f"/api/meetings/{mid}/actions:batch",
+            json={
+                "items": [
+                    {"description": "A", "owner": "Alice", "deadline": _future_date()},
+                    {"description": "B", "owner": "", "deadline": _future_date()},
+                ]
+            },
+        )
+        assert res.status_code == 400
+        assert json.loads(res.data)["errors"][0]["index"] == 1
+
+        res = client.post(
+            f"/api/meetings/{mid}/actions:batch",
+            json={
+                "items": [
+                    {"description": "A", "owner": "Alice", "deadline": _future_date()},
+                    {"description": "B", "owner": "Bob", "deadline": _future_date(3)},
+                ]
+            },
+        )
+        assert res.status_code == 201
+        assert [a["owner"] for a in json.loads(res.data)["items"]] == ["Alice", "Bob"]
+
+    def test_batch_requires_items(self, client):
+        mid = self._meeting(client)
+        res = client.post(f"/api/meetings/{mid}/agenda:batch", json={"items": []})
+        assert res.status_code == 400
+        res = client.post("/api/meetings/999/actions:batch", json={"items": [{}]})
+        assert res.status_code == 404
+
+
+class TestConditionalGet:
+    def _meeting(self, client):
+        res = client.post(
+            "/api/meetings",
+            json={"title": "Polled", "scheduled_time": _future_time(), "duration_minutes": 30},
+        )
+        return json.loads(res.data)["id"]
+
+    def test_unchanged_meeting_returns_304(self, client):
+        mid = self._meeting(client)
+        res = client.get(f"/api/meetings/{mid}")
+        assert res.status_code == 200
+        etag = res.headers["ETag"]
+        assert "no-cache" in res.headers["Cache-Control"]
+
+        res = client.get(f"/api/meetings/{mid}", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert res.data == b""
+        assert res.headers["ETag"] == etag
+
+    def test_mutation_changes_etags(self, client):
+        mid = self._meeting(client)
+        urls = [f"/api/meetings/{mid}", f"/api/meetings/{mid}/actions", "/api/dashboard"]
+        etags = {url: client.get(url).headers["ETag"] for url in urls}
+
+        client.patch(f"/api/meetings/{mid}/start")
+        client.post(
+            f"/api/meetings/{mid}/actions",
+            json={"description": "Task", "owner": "Ann", "deadline": _future_date()},
+        )
+
+        for url in urls:
+            res = client.get(url, headers={"If-None-Match": etags[url]})
+            assert res.status_code == 200, url
+            assert res.headers["ETag"] != etags[url]
+
+    def test_revalidation_reads_only_the_change_counter(self, client, count_queries):
+        self._meeting(client)
+        etag = client.get("/api/meetings").headers["ETag"]
+        with count_queries() as statements:
+            res = client.get("/api/meetings", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert len(statements) == 1 and "FROM change_counter" in statements[0]
+
+        res = client.post("/api/import", data=json.dumps(
+            {"type": "meeting", "ref": "m1", "title": "Imported",
+             "scheduled_time": _future_time(), "duration_minutes": 30}
+        ))
+        assert json.loads(res.data)["imported"]["meetings"] == 1
+        assert client.get("/api/meetings", headers={"If-None-Match": etag}).status_code == 200
+
+    def test_version_is_bumped_by_item_changes(self, client):
+        mid = self._meeting(client)
+        v1 = json.loads(client.get(f"/api/meetings/{mid}").data)["version"]
+        client.post(f"/api/meetings/{mid}/agenda", json={"topic": "T", "time_allocation": 5})
+        v2 = json.loads(client.get(f"/api/meetings/{mid}").data)["version"]
+        assert v2 == v1 + 1
+
+    def test_missing_meeting_is_404(self, client):
+        assert client.get("/api/meetings/999").status_code == 404
+        assert client.get("/api/meetings/999/actions").status_code == 404
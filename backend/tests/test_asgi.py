@@ -0,0 +1,134 @@
+"""Tests for the ASGI serving mode (``asgi.py``)."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def asgi_app(db):
+    from asgi import app
+
+    return app
+
+
+class Conversation:
+    """Drive one ASGI request and collect what the app sends back."""
+
+    def __init__(self, app, method, path, body=None):
+        payload = b"" if body is None else json.dumps(body).encode()
+        self.scope = {
+            "type": "http",
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"content-type", b"application/json")],
+            "server": ("testserver", 80),
+            "client": ("127.0.0.1", 5000),
+        }
+        self.app = app
+        self.sent = []
+        self._inbox = asyncio.Queue()
+        self._inbox.put_nowait({"type": "http.request", "body": payload, "more_body": False})
+
+    async def receive(self):
+        return await self._inbox.get()
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    def disconnect(self):
+        self._inbox.put_nowait({"type": "http.disconnect"})
+
+    def run(self):
+        return asyncio.ensure_future(self.app(self.scope, self.receive, self.send))
+
+    @property
+    def status(self):
+        return self.sent[0]["status"]
+
+    @property
+    def body(self):
+        return b"".join(m.get("body", b"") for m in self.sent[1:])
+
+
+async def _request(app, method, path, body=None):
+    conversation = Conversation(app, method, path, body)
+    await conversation.run()
+    return conversation
+
+
+def test_ai_routes_are_served_natively(asgi_app):
+    conv = asyncio.run(
+        _request(asgi_app, "POST", "/api/ai/suggest-agenda", {"title": "Retro"})
+    )
+    assert conv.status == 200
+    assert len(json.loads(conv.body)["suggestions"]) == 3
+
+
+def test_ai_stream_is_served_natively(asgi_app):
+    conv = asyncio.run(
+        _request(asgi_app, "POST", "/api/ai/summarize-review:stream", {"title": "Retro"})
+    )
+    assert conv.status == 200
+    events = [json.loads(line) for line in conv.body.decode().splitlines()]
+    assert [e["type"] for e in events] == ["summary", "done"]
+
+
+def test_other_routes_go_through_flask(asgi_app):
+    conv = asyncio.run(
+        _request(
+            asgi_app,
+            "POST",
+            "/api/meetings",
+            {
+                "title": "Via ASGI",
+                "scheduled_time": (datetime.utcnow() + timedelta(hours=1)).isoformat(),
+                "duration_minutes": 30,
+            },
+        )
+    )
+    assert conv.status == 201
+    assert json.loads(conv.body)["title"] == "Via ASGI"
+
+
+def test_event_stream_runs_on_the_loop(asgi_app):
+    async def scenario():
+        created = await _request(
+            asgi_app,
+            "POST",
+            "/api/meetings",
+            {
+                "title": "Watched",
+                "scheduled_time": (datetime.utcnow() + timedelta(hours=1)).isoformat(),
+                "duration_minutes": 30,
+            },
+        )
+        mid = json.loads(created.body)["id"]
+
+        stream = Conversation(asgi_app, "GET", f"/api/meetings/{mid}/events")
+        task = stream.run()
+        while len(stream.sent) < 2:
+            await asyncio.sleep(0.01)
+        assert stream.status == 200
+        assert b"event: ready" in stream.body
+
+        await _request(asgi_app, "PATCH", f"/api/meetings/{mid}/start")
+        for _ in range(200):
+            if b"meeting.started" in stream.body:
+                break
+            await asyncio.sleep(0.01)
+        assert b"event: meeting.started" in stream.body
+
+        stream.disconnect()
+        await asyncio.wait_for(task, timeout=2)
+
+        missing = await _request(asgi_app, "GET", "/api/meetings/999/events")
+        assert missing.status == 404
+
+    asyncio.run(scenario())
@@ -0,0 +1,89 @@
+"""Tests for the response cache and its write-through invalidation."""
+
+import json
+from datetime import datetime, timedelta
+
+from services import cache_service
+from services.cache_service import MemoryBackend, cache
+
+
+def _future(hours=1):
+    return (datetime.utcnow() + timedelta(hours=hours)).isoformat()
+
+
+def _create_meeting(client):
+    res = client.post(
+        "/api/meetings",
+        json={"title": "Cached", "scheduled_time": _future(), "duration_minutes": 60},
+    )
+    return json.loads(res.data)["id"]
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryBackend(max_entries=2)
+    backend.set("a", 1, ttl=60)
+    backend.set("b", 2, ttl=60)
+    backend.get("a")
+    backend.set("c", 3, ttl=60)
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    assert backend.get("c") == 3
+
+
+def test_memory_backend_expires_entries():
+    backend = MemoryBackend()
+    backend.set("a", 1, ttl=-1)
+    assert backend.get("a") is None
+
+
+def test_repeated_reads_are_served_from_cache(client, count_queries):
+    mid = _create_meeting(client)
+    client.get(f"/api/meetings/{mid}")
+    client.get("/api/dashboard")
+
+    with count_queries() as statements:
+        assert client.get(f"/api/meetings/{mid}").status_code == 200
+        assert client.get("/api/dashboard").status_code == 200
+    # Only the two ETag version stamps; nothing is rebuilt
+    assert len(statements) == 2, statements
+
+    stats = json.loads(client.get("/api/cache/stats").data)
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+
+
+def test_mutations_invalidate_detail_and_dashboard(client):
+    mid = _create_meeting(client)
+    assert json.loads(client.get(f"/api/meetings/{mid}").data)["agenda_items"] == []
+    before = json.loads(client.get("/api/dashboard").data)
+
+    client.post(f"/api/meetings/{mid}/agenda", json={"topic": "New", "time_allocation": 5})
+    detail = json.loads(client.get(f"/api/meetings/{mid}").data)
+    assert [a["topic"] for a in detail["agenda_items"]] == ["New"]
+
+    client.patch(f"/api/meetings/{mid}/start")
+    assert json.loads(client.get(f"/api/meetings/{mid}").data)["status"] == "InProgress"
+    after = json.loads(client.get("/api/dashboard").data)
+    assert before["upcoming_meetings"][0]["status"] == "Scheduled"
+    assert after["upcoming_meetings"][0]["status"] == "InProgress"
+
+
+def test_cached_payloads_roll_over_at_midnight(client, monkeypatch):
+    mid = _create_meeting(client)
+    client.get(f"/api/meetings/{mid}")
+    misses = cache.misses
+
+    monkeypatch.setattr(cache_service, "_today", lambda: "2999-01-01")
+    client.get(f"/api/meetings/{mid}")
+    assert cache.misses == misses + 1
+
+
+def test_dashboard_rolls_over_at_midnight_without_writes(client, monkeypatch):
+    client.get("/api/dashboard")
+    client.get("/api/dashboard")
+    misses = cache.misses
+
+    # Same global version, next day: overdue counts must be rebuilt
+    monkeypatch.setattr(cache_service, "_today", lambda: "2999-01-01")
+    client.get("/api/dashboard")
+    assert cache.misses == misses + 1
@@ -0,0 +1,255 @@
+"""Optimistic concurrency: compare-and-swap on ``meetings.version``, If-Match,
+and a multithreaded stress test against a file-backed SQLite database."""
+
+import json
+import threading
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from models import ActionItem, AgendaItem, Meeting, Review, db as _db
+from services import action_item_service, agenda_service, meeting_service, review_service
+from services.meeting_service import ConflictError
+
+
+def _meeting(client, **overrides):
+    res = client.post(
+        "/api/meetings",
+        json={
+            "title": "Race",
+            "scheduled_time": (datetime.utcnow() + timedelta(hours=1)).isoformat(),
+            "duration_minutes": 60,
+            **overrides,
+        },
+    )
+    return json.loads(res.data)["id"]
+
+
+def _add_action(client, mid):
+    return client.post(
+        f"/api/meetings/{mid}/actions",
+        json={
+            "description": "Ship",
+            "owner": "Alice",
+            "deadline": (date.today() + timedelta(days=3)).isoformat(),
+        },
+    )
+
+
+class TestCompareAndSwap:
+    def test_stale_version_conflicts(self, client, db):
+        mid = _meeting(client)
+        with pytest.raises(ConflictError):
+            meeting_service.touch_meeting(mid, expected_version=99, status="InProgress")
+        assert db.session.get(Meeting, mid).status == "Scheduled"
+
+    def test_item_write_conflicts_with_state_change(self, client, db):
+        mid = _meeting(client)
+        client.patch(f"/api/meetings/{mid}/start")
+        with pytest.raises(ConflictError):
+            # The caller validated "Scheduled", but the meeting has moved on
+            meeting_service.touch_meeting(mid, expected_status="Scheduled")
+
+    def test_transitions_bump_version(self, client):
+        mid = _meeting(client)
+        before = json.loads(client.get(f"/api/meetings/{mid}").data)["version"]
+        after = json.loads(client.patch(f"/api/meetings/{mid}/start").data)["version"]
+        assert after == before + 1
+
+
+class TestIfMatch:
+    def test_matching_etag_is_accepted(self, client):
+        mid = _meeting(client)
+        etag = client.get(f"/api/meetings/{mid}").headers["ETag"]
+        res = client.patch(f"/api/meetings/{mid}/start", headers={"If-Match": etag})
+        assert res.status_code == 200
+
+    def test_version_number_is_accepted(self, client):
+        mid = _meeting(client)
+        version = json.loads(client.get(f"/api/meetings/{mid}").data)["version"]
+        res = client.patch(f"/api/meetings/{mid}/start", headers={"If-Match": f'"{version}"'})
+        assert res.status_code == 200
+
+    def test_stale_etag_is_rejected(self, client):
+        mid = _meeting(client)
+        etag = client.get(f"/api/meetings/{mid}").headers["ETag"]
+        client.post(f"/api/meetings/{mid}/agenda", json={"topic": "A", "time_allocation": 5})
+
+        res = client.patch(f"/api/meetings/{mid}/start", headers={"If-Match": etag})
+        assert res.status_code == 412
+        assert json.loads(client.get(f"/api/meetings/{mid}").data)["status"] == "Scheduled"
+
+    def test_review_honours_if_match(self, client):
+        mid = _meeting(client)
+        client.patch(f"/api/meetings/{mid}/start")
+        _add_action(client, mid)
+        client.patch(f"/api/meetings/{mid}/close")
+        res = client.post(
+            f"/api/meetings/{mid}/review",
+            json={"summary": "Good", "outcome_rating": 4},
+            headers={"If-Match": '"1"'},
+        )
+        assert res.status_code == 412
+
+
+class TestAgendaBudget:
+    def _allocated(self, client, mid):
+        return json.loads(client.get(f"/api/meetings/{mid}").data)["allocated_minutes"]
+
+    def test_counter_follows_every_agenda_write(self, client):
+        mid = _meeting(client)
+        res = client.post(f"/api/meetings/{mid}/agenda", json={"topic": "A", "time_allocation": 10})
+        item = json.loads(res.data)
+        batch = [{"topic": "B", "time_allocation": 15}, {"topic": "C", "time_allocation": 5}]
+        client.post(f"/api/meetings/{mid}/agenda:batch", json={"items": batch})
+        assert self._allocated(client, mid) == 30
+        client.patch(f"/api/agenda/{item['id']}", json={"time_allocation": 25})
+        assert self._allocated(client, mid) == 45
+        client.delete(f"/api/agenda/{item['id']}")
+        assert self._allocated(client, mid) == 20
+
+    def test_budget_check_loads_no_items(self, client, count_queries):
+        mid = _meeting(client)
+        client.post(f"/api/meetings/{mid}/agenda", json={"topic": "A", "time_allocation": 50})
+        with count_queries() as statements:
+            res = client.post(
+                f"/api/meetings/{mid}/agenda", json={"topic": "B", "time_allocation": 20}
+            )
+        assert res.status_code == 400
+        assert "only 10 min remaining" in json.loads(res.data)["error"]
+        assert not any("FROM agenda_items" in s for s in statements)
+
+    def test_check_constraint_caps_the_counter(self, client, db):
+        mid = _meeting(client)
+        meeting = db.session.get(Meeting, mid)
+        meeting.allocated_minutes = meeting.duration_minutes + 1
+        with pytest.raises(IntegrityError):
+            db.session.flush()
+
+
+# ─── Stress test ────────────────────────────────────────
+
+
+@pytest.fixture
+def file_app(app, tmp_path, monkeypatch):
+    """A second app on a SQLite file, so threads share one database."""
+    from app import create_app
+    from services.ai_cache import suggestion_cache
+    from services.ai_gateway import gateway
+    from services.cache_service import cache
+    from services.event_bus import events
+    from services.job_queue import jobs
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'stress.db'}")
+    monkeypatch.setenv("JOB_RUNNER", "manual")
+    stress_app = create_app()
+    yield stress_app
+    with stress_app.app_context():
+        _db.engine.dispose()
+    # create_app re-initialised the shared extensions; point them back
+    for extension in (cache, events, gateway, suggestion_cache, jobs):
+        extension.init_app(app)
+
+
+def _race(app, n, fn):
+    """Run ``fn(i)`` in ``n`` threads released together; collect outcomes."""
+    barrier = threading.Barrier(n)
+    outcomes = [None] * n
+
+    def worker(i):
+        with app.app_context():
+            barrier.wait()
+            try:
+                fn(i)
+                outcomes[i] = "ok"
+            except ConflictError:
+                outcomes[i] = "conflict"
+            except ValueError:
+                outcomes[i] = "rejected"
+            finally:
+                _db.session.remove()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return outcomes
+
+
+def _setup_meeting(app, status):
+    with app.app_context():
+        meeting = meeting_service.create_meeting(
+            "Stress", (datetime.utcnow() + timedelta(hours=1)).isoformat(), 60
+        )
+        mid = meeting.id
+        if status != "Scheduled":
+            meeting_service.start_meeting(mid)
+            action_item_service.create_action_item(
+                mid, "Ship", "Alice", (date.today() + timedelta(days=3)).isoformat()
+            )
+        if status == "Closed":
+            meeting_service.close_meeting(mid)
+        return mid
+
+
+class TestStress:
+    def test_concurrent_starts_succeed_once(self, file_app):
+        mid = _setup_meeting(file_app, "Scheduled")
+        outcomes = _race(file_app, 8, lambda i: meeting_service.start_meeting(mid))
+        assert outcomes.count("ok") == 1
+        with file_app.app_context():
+            assert _db.session.get(Meeting, mid).version == 2
+
+    def test_concurrent_reviews_create_exactly_one(self, file_app):
+        mid = _setup_meeting(file_app, "Closed")
+        outcomes = _race(
+            file_app,
+            8,
+            lambda i: review_service.create_review(mid, f"Review {i}", 4, False),
+        )
+        assert outcomes.count("ok") == 1
+        with file_app.app_context():
+            assert Review.query.filter_by(meeting_id=mid).count() == 1
+            assert _db.session.get(Meeting, mid).status == "Reviewed"
+
+    def test_concurrent_agenda_adds_respect_the_budget(self, file_app):
+        mid = _setup_meeting(file_app, "Scheduled")
+        outcomes = _race(
+            file_app,
+            8,
+            lambda i: agenda_service.add_agenda_item(mid, f"Topic {i}", 20),
+        )
+        assert outcomes.count("ok") == 3
+        with file_app.app_context():
+            meeting = _db.session.get(Meeting, mid)
+            items = AgendaItem.query.filter_by(meeting_id=mid).all()
+            assert meeting.allocated_minutes == sum(i.time_allocation for i in items) == 60
+
+    def test_no_lost_updates_while_closing(self, file_app):
+        mid = _setup_meeting(file_app, "InProgress")
+        with file_app.app_context():
+            start_version = _db.session.get(Meeting, mid).version
+
+        def mutate(i):
+            if i == 0:
+                meeting_service.close_meeting(mid)
+            else:
+                action_item_service.create_action_item(
+                    mid, f"Task {i}", "Bob", (date.today() + timedelta(days=3)).isoformat()
+                )
+
+        outcomes = _race(file_app, 10, mutate)
+        with file_app.app_context():
+            meeting = _db.session.get(Meeting, mid)
+            items = ActionItem.query.filter_by(meeting_id=mid).count()
+            # Every successful write bumped the version exactly once...
+            assert meeting.version == start_version + outcomes.count("ok")
+            # ...and every successful add is present: none was lost or
+            # slipped in after the meeting closed.
+            added = outcomes[1:].count("ok")
+            assert items == 1 + added
+            if outcomes[0] == "ok":
+                assert meeting.status == "Closed"
+                assert meeting.closed_at is not None
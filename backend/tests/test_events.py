@@ -0,0 +1,84 @@
+"""Tests for the meeting event bus and the SSE stream."""
+
+import json
+from datetime import datetime, timedelta
+
+from services.event_bus import RESYNC, SUBSCRIBER_QUEUE_SIZE, InProcessEventBus, events
+
+
+def _create_meeting(client):
+    res = client.post(
+        "/api/meetings",
+        json={
+            "title": "Live",
+            "scheduled_time": (datetime.utcnow() + timedelta(hours=1)).isoformat(),
+            "duration_minutes": 30,
+        },
+    )
+    return json.loads(res.data)["id"]
+
+
+def _parse(chunk):
+    fields = {}
+    for line in chunk.decode().strip().splitlines():
+        key, _, value = line.partition(": ")
+        fields[key] = value
+    return fields
+
+
+def test_bus_delivers_only_to_channel_watchers():
+    bus = InProcessEventBus()
+    a = bus.subscribe("meeting:1")
+    b = bus.subscribe("meeting:2")
+    bus.publish("meeting:1", {"type": "x"})
+    assert a.get(timeout=0) == {"type": "x"}
+    assert b.get(timeout=0) is None
+
+    a.close()
+    b.close()
+    assert bus.subscriber_count() == 0
+
+
+def test_slow_subscriber_gets_resync():
+    bus = InProcessEventBus()
+    sub = bus.subscribe("meeting:1")
+    for i in range(SUBSCRIBER_QUEUE_SIZE + 1):
+        bus.publish("meeting:1", {"type": "x", "n": i})
+    assert sub.get(timeout=0) == RESYNC
+    assert sub.get(timeout=0) is None
+
+
+def test_stream_pushes_service_events(client):
+    mid = _create_meeting(client)
+
+    res = client.get(f"/api/meetings/{mid}/events", buffered=False)
+    assert res.status_code == 200
+    assert res.mimetype == "text/event-stream"
+    chunks = iter(res.response)
+    assert _parse(next(chunks))["event"] == "ready"
+
+    client.post(f"/api/meetings/{mid}/agenda", json={"topic": "Intro", "time_allocation": 5})
+    client.patch(f"/api/meetings/{mid}/start")
+
+    first = _parse(next(chunks))
+    assert first["event"] == "agenda.added"
+    assert "id" not in first
+    assert json.loads(first["data"])["data"]["item"]["topic"] == "Intro"
+    second = _parse(next(chunks))
+    assert second["event"] == "meeting.started"
+
+    res.close()
+    assert events.backend.subscriber_count(f"meeting:{mid}") == 0
+
+
+def test_stream_closed_before_first_read_releases_subscription(client):
+    mid = _create_meeting(client)
+    res = client.get(f"/api/meetings/{mid}/events", buffered=False)
+    assert events.backend.subscriber_count(f"meeting:{mid}") == 1
+
+    res.close()  # the client disconnected before the generator started
+    assert events.backend.subscriber_count(f"meeting:{mid}") == 0
+
+
+def test_stream_for_missing_meeting_is_404(client):
+    assert client.get("/api/meetings/999/events").status_code == 404
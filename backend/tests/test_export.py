@@ -0,0 +1,100 @@
+"""Streamed analytics exports: formats, incremental pulls, batching."""
+
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from models import Meeting
+from services import export_service
+
+
+def _meeting(client, title="Export"):
+    res = client.post(
+        "/api/meetings",
+        json={
+            "title": title,
+            "scheduled_time": (datetime.utcnow() + timedelta(hours=1)).isoformat(),
+            "duration_minutes": 30,
+        },
+    )
+    return json.loads(res.data)["id"]
+
+
+def _ndjson(res):
+    return [json.loads(line) for line in res.data.decode().splitlines()]
+
+
+class TestExport:
+    def test_ndjson_rows(self, client):
+        mid = _meeting(client)
+        res = client.get("/api/export/meetings?format=ndjson")
+        assert res.status_code == 200
+        assert res.mimetype == "application/x-ndjson"
+        assert 'filename="meetings.ndjson"' in res.headers["Content-Disposition"]
+        (row,) = _ndjson(res)
+        assert row["id"] == mid and row["title"] == "Export"
+        assert set(row) == set(export_service.TABLES["meetings"][1])
+
+    def test_csv_has_header_and_iso_timestamps(self, client):
+        mid = _meeting(client)
+        client.patch(f"/api/meetings/{mid}/start")
+        client.post(
+            f"/api/meetings/{mid}/actions",
+            json={
+                "description": "Ship",
+                "owner": "Alice",
+                "deadline": (date.today() + timedelta(days=2)).isoformat(),
+            },
+        )
+        res = client.get("/api/export/action_items?format=csv")
+        assert res.mimetype == "text/csv"
+        rows = list(csv.DictReader(io.StringIO(res.data.decode())))
+        assert [r["owner"] for r in rows] == ["Alice"]
+        datetime.fromisoformat(rows[0]["updated_at"])
+
+    def test_updated_since_returns_changed_rows(self, client, db):
+        old, new = _meeting(client, "Old"), _meeting(client, "New")
+        cutoff = datetime.now(timezone.utc)
+        db.session.get(Meeting, old).updated_at = cutoff - timedelta(days=1)
+        db.session.commit()
+
+        res = client.get(
+            "/api/export/meetings", query_string={"updated_since": cutoff.isoformat()}
+        )
+        assert [r["id"] for r in _ndjson(res)] == []
+        client.patch(f"/api/meetings/{new}/start")  # bumps updated_at
+
+        res = client.get(
+            "/api/export/meetings", query_string={"updated_since": cutoff.isoformat()}
+        )
+        assert [r["id"] for r in _ndjson(res)] == [new]
+
+    def test_rows_are_read_in_batches(self, db, client):
+        for i in range(5):
+            _meeting(client, f"M{i}")
+        batches = list(export_service.iter_batches("meetings", batch_size=2))
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_errors(self, client):
+        assert client.get("/api/export/secrets").status_code == 404
+        assert client.get("/api/export/meetings?format=xml").status_code == 400
+        assert client.get("/api/export/meetings?updated_since=yesterday").status_code == 400
+
+    @pytest.mark.skipif(export_service.pyarrow is not None, reason="pyarrow installed")
+    def test_arrow_formats_need_pyarrow(self, client):
+        res = client.get("/api/export/meetings?format=parquet")
+        assert res.status_code == 400
+        assert "pyarrow" in json.loads(res.data)["error"]
+
+    @pytest.mark.skipif(export_service.pyarrow is None, reason="pyarrow not installed")
+    def test_parquet(self, client):
+        import pyarrow.parquet
+
+        _meeting(client)
+        res = client.get("/api/export/meetings?format=parquet")
+        table = pyarrow.parquet.read_table(io.BytesIO(res.data))
+        assert table.num_rows == 1
+        assert table.column_names == list(export_service.TABLES["meetings"][1])
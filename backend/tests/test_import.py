@@ -0,0 +1,179 @@
+"""Streaming bulk import: validation, historical mode, chunking, CSV."""
+
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from models import ActionItem, AgendaItem, Meeting, Review
+from services import import_service
+
+PAST = (date.today() - timedelta(days=400)).isoformat()
+FUTURE = (date.today() + timedelta(days=7)).isoformat()
+
+
+def _ndjson(*records):
+    return "".join(json.dumps(r) + "\n" for r in records)
+
+
+def _meeting(ref, **fields):
+    return {
+        "type": "meeting",
+        "ref": ref,
+        "title": f"Meeting {ref}",
+        "scheduled_time": f"{PAST}T10:00:00",
+        "duration_minutes": 60,
+        **fields,
+    }
+
+
+def _history(ref):
+    return [
+        _meeting(ref, status="Reviewed", closed_at=f"{PAST}T11:00:00"),
+        {"type": "agenda_item", "meeting_ref": ref, "topic": "Plan", "time_allocation": 30},
+        {
+            "type": "action_item",
+            "meeting_ref": ref,
+            "description": "Ship",
+            "owner": "Alice",
+            "deadline": PAST,
+            "status": "Completed",
+        },
+        {"type": "review", "meeting_ref": ref, "summary": "Good", "outcome_rating": 4},
+    ]
+
+
+def _import(client, body, **params):
+    res = client.post("/api/import", data=body, query_string=params)
+    return res.status_code, json.loads(res.data)
+
+
+class TestHistoricalImport:
+    def test_imports_meetings_with_items(self, client, db):
+        status, report = _import(client, _ndjson(*_history("a"), *_history("b")), mode="historical")
+        assert status == 200
+        assert report["imported"] == {
+            "meetings": 2,
+            "agenda_items": 2,
+            "action_items": 2,
+            "reviews": 2,
+        }
+        assert report["failed"] == 0 and report["rows"] == 8
+        meeting = Meeting.query.filter_by(title="Meeting a").one()
+        assert (meeting.status, meeting.allocated_minutes) == ("Reviewed", 30)
+        assert meeting.review.outcome_rating == 4
+        assert meeting.action_items[0].status == "Completed"
+
+    def test_rows_span_chunks(self, app, db):
+        records = [(n, r, None) for n, r in enumerate(_history("a") + _history("b"), 1)]
+        report = import_service.import_records(records, mode="historical", chunk_size=3)
+        assert report["failed"] == 0
+        assert AgendaItem.query.count() == 2 and Review.query.count() == 2
+        # Items added in a later chunk still maintain the counter
+        assert {m.allocated_minutes for m in Meeting.query} == {30}
+
+    @pytest.mark.parametrize("dialect", ["sqlite", "postgresql"])
+    def test_items_attach_to_their_own_meeting(self, app, db, monkeypatch, dialect):
+        # "postgresql" exercises the sort_by_parameter_order path of bulk_insert
+        monkeypatch.setattr(db.engine.dialect, "name", dialect)
+        refs = [f"m{i}" for i in range(30)]
+        records = [r for ref in refs for r in _history(ref)]
+        for record in records:
+            if record["type"] == "agenda_item":
+                record["topic"] = f"Plan {record['meeting_ref']}"
+        report = import_service.import_records(
+            [(n, r, None) for n, r in enumerate(records, 1)], mode="historical", chunk_size=200
+        )
+        assert report["failed"] == 0
+        for meeting in Meeting.query:
+            assert [a.topic for a in meeting.agenda_items] == [f"Plan {meeting.title[8:]}"]
+
+    def test_per_row_errors_do_not_stop_the_import(self, client, db):
+        body = _ndjson(
+            _meeting("a", status="Reviewed"),
+            {"type": "agenda_item", "meeting_ref": "a", "topic": "Long", "time_allocation": 90},
+            {"type": "review", "meeting_ref": "a", "summary": "Bad", "outcome_rating": 2},
+            {"type": "review", "meeting_ref": "zzz", "summary": "Ok", "outcome_rating": 4},
+            {"type": "speech"},
+        ) + "not json\n"
+        status, report = _import(client, body, mode="historical")
+        assert report["imported"]["meetings"] == 1
+        assert report["failed"] == 5
+        errors = {e["line"]: e["error"] for e in report["errors"]}
+        assert "only 60 min remaining" in errors[2]
+        assert "Follow-up is required" in errors[3]
+        assert "Unknown meeting_ref" in errors[4]
+        assert "Unknown record type" in errors[5]
+        assert errors[6] == "Invalid JSON."
+        assert report["rows_per_second"] > 0
+
+
+    def test_failed_chunk_is_rolled_back_and_reported(self, app, db, monkeypatch):
+        def broken(model, rows):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(import_service, "bulk_insert", broken)
+        records = [(n, r, None) for n, r in enumerate(_history("a"), 1)]
+        report = import_service.import_records(records, mode="historical", chunk_size=10)
+        assert report["failed"] == 4
+        assert report["errors"][0] == {"line": 1, "error": "Chunk rolled back: RuntimeError."}
+        assert Meeting.query.count() == 0 and AgendaItem.query.count() == 0
+
+
+class TestLiveImport:
+    def test_live_rules_apply(self, client, db):
+        body = _ndjson(
+            _meeting("a", scheduled_time=f"{FUTURE}T10:00:00"),
+            {"type": "agenda_item", "meeting_ref": "a", "topic": "Plan", "time_allocation": 30},
+            {"type": "action_item", "meeting_ref": "a", "description": "Old", "owner": "Al", "deadline": PAST},
+            {"type": "review", "meeting_ref": "a", "summary": "Good", "outcome_rating": 4},
+            _meeting("b", status="Reviewed"),
+        )
+        status, report = _import(client, body)
+        assert report["imported"]["meetings"] == 1
+        assert report["imported"]["agenda_items"] == 1
+        errors = [e["error"] for e in report["errors"]]
+        assert "Deadline must be a future date." in errors
+        assert any("Meeting must be Closed" in e for e in errors)
+        assert "Only historical imports may set status or closed_at." in errors
+        assert ActionItem.query.count() == 0
+
+
+class TestCsvImport:
+    def test_csv_rows(self, client, db):
+        body = (
+            "type,ref,meeting_ref,title,scheduled_time,duration_minutes,topic,time_allocation\n"
+            f"meeting,m1,,Planning,{FUTURE}T09:00:00,45,,\n"
+            "agenda_item,,m1,,,,Scope,20\n"
+            "agenda_item,,m1,,,,Risks,lots\n"
+        )
+        res = client.post("/api/import", data=body, content_type="text/csv")
+        report = json.loads(res.data)
+        assert report["imported"]["agenda_items"] == 1
+        assert report["errors"] == [{"line": 4, "error": "time_allocation must be an integer."}]
+        assert Meeting.query.one().allocated_minutes == 20
+
+
+def test_cli_import(app, db, tmp_path):
+    source = tmp_path / "history.ndjson"
+    source.write_text(_ndjson(*_history("a")))
+    result = app.test_cli_runner().invoke(args=["import", str(source), "--historical"])
+    assert result.exit_code == 0, result.output
+    assert "4 rows" in result.output and "0 rejected" in result.output
+    assert Review.query.count() == 1
+
+
+def test_cli_import_reports_rejected_lines_on_stderr(app, db, tmp_path):
+    source = tmp_path / "history.ndjson"
+    bad = {"type": "agenda_item", "meeting_ref": "a", "topic": "X", "time_allocation": "lots"}
+    source.write_text(_ndjson(*_history("a"), bad))
+    result = app.test_cli_runner().invoke(args=["import", str(source), "--historical"])
+    assert result.exit_code == 0, result.output
+    assert result.stderr.startswith("line 5: ")
+    assert "1 rejected" in result.stdout and "line 5" not in result.stdout
+
+
+@pytest.mark.parametrize("params", [{"mode": "yolo"}, {"format": "xml"}])
+def test_bad_parameters(client, params):
+    status, report = _import(client, "", **params)
+    assert status == 400
@@ -0,0 +1,247 @@
+"""Index coverage for the service query shapes, proven with EXPLAIN.
+
+Each test runs a real service call, captures the SQL it issues and checks
+SQLite's ``EXPLAIN QUERY PLAN`` for the expected index.
+"""
+
+import importlib
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+
+from migrations import discover, run_migrations, schema_lock
+from models import ActionItem, AgendaItem, Meeting
+from services import action_item_service, calendar_service, meeting_service
+
+
+@pytest.fixture
+def capture(db):
+    """Record ``(statement, parameters)`` for every SQL call."""
+    captured = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    yield captured
+    event.remove(db.engine, "before_cursor_execute", _record)
+
+
+def _plan(db, statement, parameters):
+    rows = db.session.connection().exec_driver_sql(
+        "EXPLAIN QUERY PLAN " + statement, parameters
+    )
+    return " | ".join(row[-1] for row in rows)
+
+
+def _seed(db):
+    now = datetime.now(timezone.utc)
+    for i in range(20):
+        meeting = Meeting(
+            title=f"M{i}",
+            scheduled_time=now + timedelta(hours=i),
+            duration_minutes=60,
+            status="Scheduled" if i % 2 else "InProgress",
+        )
+        meeting.agenda_items = [AgendaItem(topic="T", time_allocation=5)]
+        meeting.action_items = [
+            ActionItem(
+                description="D",
+                owner="O",
+                deadline=date.today() + timedelta(days=i - 5),
+                status="Open" if i % 3 else "Completed",
+            )
+        ]
+        db.session.add(meeting)
+    db.session.commit()
+    db.session.expunge_all()
+
+
+def _plans_for(db, capture, call):
+    capture.clear()
+    call()
+    return [_plan(db, s, p) for s, p in list(capture)]
+
+
+def test_meeting_list_uses_scheduled_time_index(db, capture):
+    _seed(db)
+    plans = _plans_for(db, capture, lambda: meeting_service.get_meetings_page(expand=()))
+    assert "ix_meetings_scheduled_time_id" in plans[0]
+
+
+def test_status_filtered_list_uses_status_index(db, capture):
+    _seed(db)
+    plans = _plans_for(
+        db, capture, lambda: meeting_service.get_meetings_page(status="Scheduled", expand=())
+    )
+    assert "ix_meetings_status_scheduled_time" in plans[0]
+
+
+def test_calendar_range_uses_scheduled_time_index(db, capture):
+    _seed(db)
+    now = datetime.now(timezone.utc)
+    plans = _plans_for(
+        db,
+        capture,
+        lambda: meeting_service.get_meetings_page(
+            start=now, end=now + timedelta(hours=5), expand=()
+        ),
+    )
+    assert "SEARCH" in plans[0] and "ix_meetings_scheduled_time_id" in plans[0]
+
+
+def test_conflict_sweep_scans_a_bounded_range(db, capture):
+    _seed(db)
+    now = datetime.now(timezone.utc)
+    plans = _plans_for(
+        db, capture, lambda: calendar_service.find_conflicts(now, now + timedelta(hours=5))
+    )
+    assert "ix_meetings_duration_minutes" in plans[0]
+    assert "ix_meetings_scheduled_time_id (scheduled_time>? AND scheduled_time<?)" in plans[1]
+
+
+def test_relation_loads_use_meeting_id_indexes(db, capture):
+    _seed(db)
+    plans = _plans_for(
+        db,
+        capture,
+        lambda: meeting_service.get_meetings_page(expand=("agenda_items", "action_items")),
+    )
+    joined = " ".join(plans)
+    assert "ix_agenda_items_meeting_id" in joined
+    assert "ix_action_items_meeting_id" in joined
+
+
+@pytest.mark.parametrize("overdue", [False, True])
+def test_open_action_pages_use_partial_index(db, capture, overdue):
+    _seed(db)
+    plans = _plans_for(
+        db, capture, lambda: action_item_service.get_open_actions_page(overdue=overdue)
+    )
+    assert "ix_action_items_open_deadline" in plans[0]
+
+
+@pytest.mark.parametrize("filters", [{"status": "Open"}, {"overdue": True}])
+def test_owner_action_pages_use_owner_index(db, capture, filters):
+    _seed(db)
+    plans = _plans_for(
+        db, capture, lambda: action_item_service.get_owner_actions_page("o", **filters)
+    )
+    assert "ix_action_items_owner_status_deadline" in plans[0]
+    assert "TEMP B-TREE" not in plans[0]
+
+
+def test_dashboard_counts_use_indexes(db, capture):
+    _seed(db)
+    plans = _plans_for(db, capture, meeting_service.get_dashboard_counts)
+    assert "ix_meetings_status_scheduled_time" in plans[0]
+    assert "ix_action_items_open_deadline" in plans[0]
+
+
+def test_migrations_add_indexes_to_existing_tables():
+    engine = create_engine("sqlite://")
+    Meeting.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for table in ("meetings", "agenda_items", "action_items"):
+            for index in inspect(conn).get_indexes(table):
+                conn.exec_driver_sql(f"DROP INDEX {index['name']}")
+
+    applied = run_migrations(engine)
+    assert applied == [version for version, _ in discover()]
+
+    names = {
+        index["name"]
+        for table in ("meetings", "agenda_items", "action_items")
+        for index in inspect(engine).get_indexes(table)
+    }
+    assert {
+        "ix_meetings_scheduled_time_id",
+        "ix_meetings_status_scheduled_time",
+        "ix_agenda_items_meeting_id",
+        "ix_action_items_meeting_id",
+        "ix_action_items_open_deadline",
+        "ix_action_items_owner_status_deadline",
+        "ix_meetings_duration_minutes",
+    } <= names
+
+    # Already applied: a second run is a no-op
+    assert run_migrations(engine) == []
+
+
+def test_allocated_minutes_migration_backfills_the_counter():
+    migration = importlib.import_module("migrations.versions.0003_meeting_allocated_minutes")
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE meetings (id INTEGER PRIMARY KEY)")
+        conn.exec_driver_sql(
+            "CREATE TABLE agenda_items (id INTEGER PRIMARY KEY, meeting_id INTEGER,"
+            " time_allocation INTEGER)"
+        )
+        conn.exec_driver_sql("INSERT INTO meetings (id) VALUES (1), (2)")
+        conn.exec_driver_sql(
+            "INSERT INTO agenda_items (meeting_id, time_allocation) VALUES (1, 10), (1, 15)"
+        )
+        migration.upgrade(conn)
+        rows = conn.exec_driver_sql(
+            "SELECT id, allocated_minutes FROM meetings ORDER BY id"
+        ).all()
+    assert [tuple(r) for r in rows] == [(1, 25), (2, 0)]
+
+
+def test_owner_key_migration_backfills_normalized_owners():
+    migration = importlib.import_module("migrations.versions.0005_action_owner_key")
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE action_items (id INTEGER PRIMARY KEY, owner VARCHAR(255),"
+            " status VARCHAR(20), deadline DATE)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO action_items (owner) VALUES ('Ann Lee'), (' ann  LEE'), ('Bo')"
+        )
+        migration.upgrade(conn)
+        rows = conn.exec_driver_sql("SELECT owner_key FROM action_items ORDER BY id").all()
+    assert [r[0] for r in rows] == ["ann lee", "ann lee", "bo"]
+
+
+def test_ends_at_migration_backfills_meeting_end_times():
+    migration = importlib.import_module("migrations.versions.0007_meeting_ends_at")
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE meetings (id INTEGER PRIMARY KEY, scheduled_time DATETIME,"
+            " duration_minutes INTEGER)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO meetings VALUES (1, '2026-03-01 09:00:00.000000', 90),"
+            " (2, '2026-03-01 23:30:00.000000', 45)"
+        )
+        migration.upgrade(conn)
+        rows = conn.exec_driver_sql("SELECT ends_at FROM meetings ORDER BY id").all()
+    assert [r[0] for r in rows] == ["2026-03-01 10:30:00.000000", "2026-03-02 00:15:00.000000"]
+
+
+def test_unclaimed_job_key_migration_drops_duplicates():
+    migration = importlib.import_module("migrations.versions.0009_unique_unclaimed_job_key")
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE jobs (id INTEGER PRIMARY KEY, key VARCHAR(255),"
+            " status VARCHAR(20), attempts INTEGER)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO jobs (key, status, attempts) VALUES ('sweep', 'queued', 0),"
+            " ('sweep', 'queued', 0), ('sweep', 'queued', 1), (NULL, 'queued', 0),"
+            " (NULL, 'queued', 0)"
+        )
+        migration.upgrade(conn)
+        rows = conn.exec_driver_sql("SELECT id FROM jobs ORDER BY id").all()
+    assert [r[0] for r in rows] == [1, 3, 4, 5]
+
+
+def test_schema_lock_is_a_no_op_outside_postgres():
+    engine = create_engine("sqlite://")
+    with schema_lock(engine):
+        Meeting.metadata.create_all(engine)
+        assert run_migrations(engine) == [version for version, _ in discover()]
@@ -0,0 +1,209 @@
+"""Tests for the background job queue and the built-in jobs."""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from models import ActionItem, Job
+from services.event_bus import events
+from services.job_queue import HANDLERS, backoff_seconds, handler, jobs
+
+
+@pytest.fixture
+def manual_jobs(db):
+    runner = jobs.runner
+    jobs.runner = "manual"
+    yield jobs
+    jobs.runner = runner
+
+
+@pytest.fixture
+def flaky_job():
+    calls = []
+
+    @handler("test_flaky")
+    def flaky(payload):
+        calls.append(payload)
+        if len(calls) < payload["succeed_on"]:
+            raise RuntimeError("boom")
+        return {"calls": len(calls)}
+
+    yield calls
+    HANDLERS.pop("test_flaky")
+
+
+def _closed_meeting(client):
+    res = client.post(
+        "/api/meetings",
+        json={
+            "title": "Retro",
+            "scheduled_time": (datetime.utcnow() + timedelta(hours=1)).isoformat(),
+            "duration_minutes": 30,
+        },
+    )
+    mid = json.loads(res.data)["id"]
+    client.patch(f"/api/meetings/{mid}/start")
+    client.post(
+        f"/api/meetings/{mid}/actions",
+        json={
+            "description": "Ship",
+            "owner": "Alice",
+            "deadline": (date.today() + timedelta(days=3)).isoformat(),
+        },
+    )
+    assert client.patch(f"/api/meetings/{mid}/close").status_code == 200
+    return mid
+
+
+def _later(seconds):
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+class TestJobQueue:
+    def test_close_enqueues_review_draft_and_returns_immediately(self, client, manual_jobs):
+        mid = _closed_meeting(client)
+        draft = json.loads(client.get(f"/api/meetings/{mid}/review-draft").data)
+        assert draft == {"status": "queued", "draft": None}
+
+        assert jobs.run_pending() == 2
+        draft = json.loads(client.get(f"/api/meetings/{mid}/review-draft").data)
+        assert draft["status"] == "done"
+        assert "Retro" in draft["draft"]["summary"]
+
+    def test_dashboard_precompute_is_deduplicated(self, db, manual_jobs):
+        first = jobs.enqueue("dashboard_precompute", key="dashboard_precompute", dedupe=True)
+        second = jobs.enqueue("dashboard_precompute", key="dashboard_precompute", dedupe=True)
+        assert first.id == second.id
+        jobs.run_pending()
+        assert jobs.get_job(first.id).result["counts"]["upcoming"] == 0
+
+    def test_dedupe_holds_when_the_lookup_races(self, db, manual_jobs, monkeypatch):
+        # Two processes starting together both miss each other's queued sweep
+        first = jobs.enqueue("overdue_sweep", key="overdue_sweep", delay=60, dedupe=True)
+        lookups = iter([None])
+        real = jobs._queued
+        monkeypatch.setattr(jobs, "_queued", lambda key: next(lookups, None) or real(key))
+        second = jobs.enqueue("overdue_sweep", key="overdue_sweep", delay=60, dedupe=True)
+        assert second.id == first.id
+        assert Job.query.filter_by(key="overdue_sweep").count() == 1
+
+    def test_requeued_retry_is_outside_the_unique_index(
+        self, db, manual_jobs, flaky_job, monkeypatch
+    ):
+        job = jobs.enqueue("test_flaky", {"succeed_on": 3}, key="flaky", dedupe=True)
+        monkeypatch.setattr(jobs, "_queued", lambda key: None)
+        jobs.enqueue("test_flaky", {"succeed_on": 3}, key="flaky", dedupe=True)
+        assert Job.query.filter_by(key="flaky").count() == 1
+        jobs.run_pending()
+        assert jobs.get_job(job.id).status == "queued"  # retrying, attempts=1
+        fresh = jobs.enqueue("test_flaky", {"succeed_on": 3}, key="flaky", dedupe=True)
+        assert fresh.id != job.id
+
+    def test_separate_worker_skips_precompute_of_a_private_cache(
+        self, client, manual_jobs, monkeypatch
+    ):
+        # The worker process cannot fill the web processes' memory cache
+        monkeypatch.setattr(jobs, "runner", "worker")
+        _closed_meeting(client)
+        assert {j.kind for j in Job.query} == {"review_draft"}
+
+    def test_retry_with_backoff_then_success(self, db, manual_jobs, flaky_job):
+        job_id = jobs.enqueue("test_flaky", {"succeed_on": 2}).id
+        assert jobs.run_pending() == 1
+        job = jobs.get_job(job_id)
+        assert (job.status, job.attempts) == ("queued", 1)
+        assert job.last_error == "RuntimeError: boom"
+
+        # Not due until the backoff has passed
+        assert jobs.run_pending() == 0
+        assert jobs.run_pending(now=_later(backoff_seconds(1) + 1)) == 1
+        job = jobs.get_job(job_id)
+        assert (job.status, job.result) == ("done", {"calls": 2})
+
+    def test_gives_up_after_max_attempts(self, db, manual_jobs, flaky_job):
+        job_id = jobs.enqueue("test_flaky", {"succeed_on": 99}, max_attempts=2).id
+        jobs.run_pending()
+        jobs.run_pending(now=_later(backoff_seconds(1) + 1))
+        job = jobs.get_job(job_id)
+        assert (job.status, job.attempts) == ("failed", 2)
+        assert jobs.run_pending(now=_later(3600)) == 0
+
+    def test_expired_lease_is_reclaimed(self, db, manual_jobs, flaky_job):
+        job_id = jobs.enqueue("test_flaky", {"succeed_on": 1}).id
+        # Simulate a worker that claimed the job and died
+        job = db.session.get(Job, job_id)
+        job.status, job.attempts = "running", 1
+        job.locked_at = datetime.now(timezone.utc)
+        db.session.commit()
+
+        assert jobs.run_pending() == 0
+        assert jobs.run_pending(now=_later(jobs.lease.total_seconds() + 1)) == 1
+        assert jobs.get_job(job_id).status == "done"
+
+    def test_backoff_is_capped(self):
+        assert [backoff_seconds(n) for n in (1, 2, 3)] == [2, 4, 8]
+        assert backoff_seconds(20) == 300
+
+    def test_unknown_kind_is_rejected(self, db):
+        with pytest.raises(ValueError):
+            jobs.enqueue("nope")
+
+    def test_inline_runner_on_memory_sqlite(self, client):
+        mid = _closed_meeting(client)
+        assert json.loads(client.get(f"/api/meetings/{mid}/review-draft").data)["status"] == "done"
+
+    def test_job_status_endpoint(self, client, manual_jobs):
+        job_id = jobs.enqueue("dashboard_precompute").id
+        assert json.loads(client.get(f"/api/jobs/{job_id}").data)["status"] == "queued"
+        assert client.get("/api/jobs/9999").status_code == 404
+
+
+class TestOverdueSweep:
+    def test_notifies_newly_overdue_items_and_reschedules(self, client, db, manual_jobs):
+        mid = _closed_meeting(client)
+        item = ActionItem.query.filter_by(meeting_id=mid).one()
+        item.deadline = date.today() - timedelta(days=1)
+        db.session.commit()
+        jobs.run_pending()  # drain the close-meeting jobs
+
+        subscription = events.subscribe(mid)
+        try:
+            job_id = jobs.enqueue("overdue_sweep").id
+            jobs.run_pending()
+            event = subscription.get(timeout=1)
+        finally:
+            subscription.close()
+
+        assert jobs.get_job(job_id).result == {
+            "notified": 1,
+            "swept_through": (date.today() - timedelta(days=1)).isoformat(),
+        }
+        assert event["type"] == "action.overdue"
+        assert event["data"]["item"]["id"] == item.id
+        upcoming = jobs.latest("overdue_sweep")
+        assert upcoming.status == "queued" and upcoming.id != job_id
+
+    def test_catches_up_on_missed_days_once(self, client, db, manual_jobs):
+        mid = _closed_meeting(client)
+        jobs.run_pending()
+        today = date.today()
+        db.session.add_all([
+            ActionItem(meeting_id=mid, description=f"Late {days}", owner="Ann",
+                       deadline=today - timedelta(days=days), status="Open")
+            for days in (1, 3, 6)
+        ])
+        db.session.commit()
+
+        # The previous run covered deadlines up to five days ago
+        swept = (today - timedelta(days=5)).isoformat()
+        first = jobs.enqueue("overdue_sweep", {"swept_through": swept}).id
+        jobs.run_pending()
+        assert jobs.get_job(first).result["notified"] == 2
+
+        # The next run picks up where this one stopped
+        upcoming = jobs.latest("overdue_sweep")
+        assert upcoming.payload == {"swept_through": (today - timedelta(days=1)).isoformat()}
+        again = jobs.enqueue("overdue_sweep", dict(upcoming.payload)).id
+        jobs.run_pending()
+        assert jobs.get_job(again).result["notified"] == 0
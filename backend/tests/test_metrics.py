@@ -0,0 +1,121 @@
+"""Request metrics middleware and the Prometheus endpoint."""
+
+import logging
+
+from flask import Response, g
+from sqlalchemy import select
+
+from models import Meeting
+from services import ai_service
+from services.ai_cache import suggestion_cache
+from services.ai_gateway import gateway
+from services.ai_providers import FakeProvider
+from services.metrics import Histogram, metrics, statement_shape
+
+MEETING_RULE = "/api/meetings/<int:meeting_id>"
+
+
+def _create(client):
+    return client.post(
+        "/api/meetings",
+        json={
+            "title": "Sprint Planning",
+            "scheduled_time": "2099-01-01T10:00:00+00:00",
+            "duration_minutes": 60,
+        },
+    ).get_json()
+
+
+def test_statement_shape_collapses_parameters():
+    a = statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?) AND name = 'x'")
+    b = statement_shape("SELECT *\n  FROM t WHERE id IN (?) AND name = 'yz'")
+    assert a == b == "SELECT * FROM t WHERE id IN (?) AND name = ?"
+
+
+def test_histogram_renders_cumulative_buckets():
+    hist = Histogram("test_seconds", "Test.", ("route",), buckets=(0.1, 1))
+    hist.observe(0.05, route="/a")
+    hist.observe(0.5, route="/a")
+    lines = list(hist.samples())
+    assert 'claritymeet_test_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'claritymeet_test_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'claritymeet_test_seconds_bucket{route="/a",le="+Inf"} 2' in lines
+    assert 'claritymeet_test_seconds_count{route="/a"} 2' in lines
+
+
+def test_requests_are_recorded_per_route(client):
+    meeting = _create(client)
+    before = metrics.latency.count(method="GET", endpoint=MEETING_RULE)
+    client.get(f"/api/meetings/{meeting['id']}")
+    client.get("/api/meetings/999999")
+    assert metrics.latency.count(method="GET", endpoint=MEETING_RULE) == before + 2
+    assert metrics.requests.value(method="GET", endpoint=MEETING_RULE, status=404) >= 1
+    assert metrics.db_queries.count(endpoint=MEETING_RULE) == before + 2
+    assert metrics.encode_time.count(endpoint=MEETING_RULE) >= 2
+
+
+def test_metrics_endpoint_is_prometheus_text(client):
+    _create(client)
+    res = client.get("/api/metrics")
+    assert res.status_code == 200
+    assert res.content_type.startswith("text/plain; version=0.0.4")
+    body = res.get_data(as_text=True)
+    assert "# TYPE claritymeet_http_request_duration_seconds histogram" in body
+    assert 'claritymeet_http_requests_total{method="POST",endpoint="/api/meetings"' in body
+    assert "claritymeet_db_statement_calls_total{statement=" in body
+
+
+def test_repeated_statements_are_flagged(app, db, caplog, monkeypatch):
+    monkeypatch.setattr(metrics, "slow_request_seconds", 0)
+    with app.test_request_context("/api/meetings"):
+        metrics._start_request()
+        for i in range(6):
+            db.session.execute(select(Meeting).where(Meeting.id == i)).all()
+        with caplog.at_level(logging.WARNING, logger="services.metrics"):
+            metrics._finish_request(Response())
+
+    shape = next(
+        key[1]
+        for key in metrics.repeated._values
+        if key[0] == "/api/meetings" and "FROM meetings" in key[1]
+    )
+    assert "meetings.id = ?" in shape
+    assert "Slow request: GET /api/meetings" in caplog.text
+    assert "repeated x6: SELECT" in caplog.text
+
+
+def test_fast_requests_are_not_logged(client, caplog):
+    with caplog.at_level(logging.WARNING, logger="services.metrics"):
+        client.get("/api/meetings")
+    assert "Slow request" not in caplog.text
+
+
+def test_ai_provider_latency():
+    gateway.configure(provider=FakeProvider())
+    suggestion_cache.clear()
+    before = metrics.ai_latency.count(task="suggest_agenda", mode="batch", outcome="ok")
+    try:
+        ai_service.suggest_agenda_topics("Metrics Review")
+    finally:
+        gateway.configure(provider=None)
+        suggestion_cache.clear()
+    after = metrics.ai_latency.count(task="suggest_agenda", mode="batch", outcome="ok")
+    assert after == before + 1
+
+
+def test_failed_statement_does_not_skew_later_timings(app, db):
+    shape = "SELECT * FROM no_such_table"
+    with app.test_request_context("/api/meetings"):
+        metrics._start_request()
+        with db.engine.connect() as conn:
+            try:
+                conn.exec_driver_sql(shape)
+            except Exception:
+                conn.rollback()
+            conn.exec_driver_sql("SELECT 1").all()
+            assert "metrics_started" not in conn.info
+        stats = g.metrics
+        metrics._finish_request(Response())
+
+    assert metrics.statement_errors.value(statement=shape) >= 1
+    assert [s for _, s in stats.statements] == [shape, "SELECT ?"]
@@ -0,0 +1,191 @@
+"""Query-count and latency budgets per endpoint.
+
+Every endpoint must be served in a fixed number of statements no matter how
+many meetings (and embedded items) it touches — i.e. no N+1 and no loads
+that grow with the data. Budgets live in ``tests/perf_budgets.json`` (see
+the ``perf_budget`` fixture), so a change that moves them shows up in review.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from sqlalchemy import insert
+
+from models import ActionItem, AgendaItem, Meeting, Review
+from services.job_queue import jobs
+
+
+def _seed(db, n):
+    now = datetime.now(timezone.utc)
+    for i in range(n):
+        status = ["Scheduled", "InProgress", "Closed", "Reviewed"][i % 4]
+        meeting = Meeting(
+            title=f"Meeting {i}",
+            scheduled_time=now + timedelta(hours=i),
+            duration_minutes=60,
+            status=status,
+        )
+        meeting.agenda_items = [AgendaItem(topic="Topic", time_allocation=10)]
+        meeting.action_items = [
+            ActionItem(
+                description="Task",
+                owner="Alice",
+                deadline=date.today() + timedelta(days=3),
+                status="Open",
+            )
+        ]
+        if status == "Reviewed":
+            meeting.review = Review(
+                summary="Done", outcome_rating=4, followup_required=False
+            )
+        db.session.add(meeting)
+    db.session.commit()
+    db.session.expunge_all()
+
+
+@pytest.mark.parametrize("n", [4, 40])
+def test_list_meetings_query_budget(client, db, perf_budget, n):
+    _seed(db, n)
+    # ETag stamp, meetings (+ joined review), agenda_items IN, action_items IN
+    with perf_budget("GET /api/meetings"):
+        res = client.get("/api/meetings?limit=200")
+    assert res.status_code == 200
+
+
+def test_list_meetings_summary_loads_no_relations(client, db, count_queries):
+    _seed(db, 12)
+    with count_queries() as statements:
+        client.get("/api/meetings?fields=title,status")
+    # ETag stamp + meetings
+    assert len(statements) == 2, statements
+
+
+@pytest.mark.parametrize("n", [4, 40])
+def test_dashboard_query_budget(client, db, perf_budget, n):
+    _seed(db, n)
+    # ETag stamp, two meeting lists x 3, open/overdue action pages, counts
+    with perf_budget("GET /api/dashboard"):
+        res = client.get("/api/dashboard")
+    assert res.status_code == 200
+
+
+def test_dashboard_with_many_open_actions(client, db, perf_budget):
+    _seed(db, 4)
+    today = date.today()
+    db.session.execute(
+        insert(ActionItem),
+        [
+            {
+                "meeting_id": 1,
+                "description": f"Task {i}",
+                "owner": f"Owner {i % 7}",
+                "deadline": today + timedelta(days=i % 20 - 10),
+                "status": "Open",
+            }
+            for i in range(500)
+        ],
+    )
+    db.session.commit()
+    with perf_budget("GET /api/dashboard"):
+        res = client.get("/api/dashboard")
+    assert res.status_code == 200
+    assert res.get_json()["counts"]["open_actions"] >= 500
+
+    with perf_budget("GET /api/dashboard/action-items"):
+        res = client.get("/api/dashboard/action-items?overdue=true&limit=200")
+    assert len(res.get_json()["action_items"]) == 200
+
+    with perf_budget("GET /api/owners/<owner>/actions"):
+        res = client.get("/api/owners/owner%203/actions?status=Open&limit=200")
+    assert len(res.get_json()["action_items"]) > 50
+
+    with perf_budget("GET /api/meetings/<id>/actions"):
+        res = client.get("/api/meetings/1/actions")
+    assert len(res.get_json()) >= 500
+
+
+def test_meeting_detail_query_budget(client, db, perf_budget):
+    _seed(db, 4)
+    with perf_budget("GET /api/meetings/<id>"):
+        res = client.get("/api/meetings/4")
+    assert res.status_code == 200
+
+
+@pytest.mark.parametrize("n", [0, 40])
+def test_lifecycle_write_budgets(client, db, perf_budget, monkeypatch, n):
+    """Writes stay constant-cost however many meetings already exist."""
+    # Jobs queued on close would otherwise run inline and count against it
+    monkeypatch.setattr(jobs, "runner", "manual")
+    _seed(db, n)
+    with perf_budget("POST /api/meetings"):
+        res = client.post(
+            "/api/meetings",
+            json={
+                "title": "Budgeted",
+                "scheduled_time": (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat(),
+                "duration_minutes": 60,
+            },
+        )
+    base = f"/api/meetings/{res.get_json()['id']}"
+    with perf_budget("POST /api/meetings/<id>/agenda"):
+        res = client.post(f"{base}/agenda", json={"topic": "Plan", "time_allocation": 15})
+    assert res.status_code == 201
+    with perf_budget("PATCH /api/meetings/<id>/start"):
+        assert client.patch(f"{base}/start").status_code == 200
+    for i in range(3):
+        with perf_budget("POST /api/meetings/<id>/actions"):
+            res = client.post(
+                f"{base}/actions",
+                json={
+                    "description": f"Task {i}",
+                    "owner": "Alice",
+                    "deadline": (date.today() + timedelta(days=3)).isoformat(),
+                },
+            )
+        assert res.status_code == 201
+    with perf_budget("PATCH /api/meetings/<id>/close"):
+        assert client.patch(f"{base}/close").status_code == 200
+    with perf_budget("POST /api/meetings/<id>/review"):
+        res = client.post(
+            f"{base}/review",
+            json={"summary": "Done", "outcome_rating": 4, "followup_required": False},
+        )
+    assert res.status_code == 201
+
+
+@pytest.mark.parametrize("n", [4, 40])
+def test_search_query_budget(client, db, perf_budget, n):
+    _seed(db, n)
+    # ETag stamp + one UNION ALL over the four full-text indexes
+    with perf_budget("GET /api/search"):
+        res = client.get("/api/search?q=task&limit=200")
+    assert len(res.get_json()["results"]) == n
+
+
+@pytest.mark.parametrize("n", [4, 40])
+def test_calendar_query_budget(client, db, perf_budget, n):
+    # Half-hour slots of one-hour meetings: every neighbour overlaps
+    start = datetime(2030, 1, 7, 9, tzinfo=timezone.utc)
+    db.session.execute(
+        insert(Meeting),
+        [
+            {
+                "title": f"Slot {i}",
+                "scheduled_time": start + timedelta(minutes=30 * i),
+                "duration_minutes": 60,
+                "status": "Scheduled",
+            }
+            for i in range(n)
+        ],
+    )
+    db.session.commit()
+    window = {"from": start.isoformat(), "to": (start + timedelta(days=7)).isoformat()}
+    # ETag stamp, one index range scan (+ embedded relations)
+    with perf_budget("GET /api/meetings?from=&to="):
+        res = client.get("/api/meetings", query_string={**window, "limit": 200})
+    assert len(res.get_json()["meetings"]) == n
+    # Longest duration, then one ordered scan of the window; pairs come from the sweep
+    with perf_budget("GET /api/meetings/conflicts"):
+        res = client.get("/api/meetings/conflicts", query_string={**window, "limit": 1000})
+    assert len(res.get_json()["conflicts"]) == n - 1
@@ -0,0 +1,130 @@
+"""Full-text search: ranking, incremental index maintenance, query safety."""
+
+import importlib
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+
+from models import Meeting
+
+
+def _future_time(hours=1):
+    return (datetime.utcnow() + timedelta(hours=hours)).isoformat()
+
+
+def _future_date(days=7):
+    return (datetime.utcnow() + timedelta(days=days)).date().isoformat()
+
+
+def _meeting(client, title):
+    res = client.post(
+        "/api/meetings",
+        json={"title": title, "scheduled_time": _future_time(), "duration_minutes": 60},
+    )
+    return json.loads(res.data)["id"]
+
+
+def _search(client, query):
+    res = client.get("/api/search", query_string=query)
+    assert res.status_code == 200, res.data
+    return json.loads(res.data)["results"]
+
+
+def _seed(client):
+    q3 = _meeting(client, "Q3 migration planning")
+    client.post(
+        f"/api/meetings/{q3}/agenda",
+        json={"topic": "Migrate the billing database", "time_allocation": 20},
+    )
+    client.patch(f"/api/meetings/{q3}/start")
+    client.post(
+        f"/api/meetings/{q3}/actions",
+        json={"description": "Draft migration runbook", "owner": "Ann", "deadline": _future_date()},
+    )
+    other = _meeting(client, "Weekly sync")
+    client.post(
+        f"/api/meetings/{other}/agenda",
+        json={"topic": "Hiring update", "time_allocation": 10},
+    )
+    return q3, other
+
+
+def test_matches_every_searchable_type_with_stemming(client):
+    q3, _ = _seed(client)
+    results = _search(client, {"q": "migrations"})
+    assert {r["type"] for r in results} == {"meeting", "agenda_item", "action_item"}
+    assert all(r["meeting_id"] == q3 for r in results)
+    assert all(r["meeting_title"] == "Q3 migration planning" for r in results)
+    scores = [r["score"] for r in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_all_words_must_match(client):
+    _seed(client)
+    results = _search(client, {"q": "billing migration"})
+    assert [r["text"] for r in results] == ["Migrate the billing database"]
+    assert _search(client, {"q": "billing hiring"}) == []
+
+
+def test_type_filter_and_limit(client):
+    _seed(client)
+    results = _search(client, {"q": "migration", "type": "meeting,action_item"})
+    assert {r["type"] for r in results} == {"meeting", "action_item"}
+    assert len(_search(client, {"q": "migration", "limit": 1})) == 1
+
+
+def test_index_follows_writes(client, db):
+    q3, other = _seed(client)
+    meeting = db.session.get(Meeting, other)
+    meeting.title = "Budget review"
+    db.session.commit()
+    assert [r["id"] for r in _search(client, {"q": "budget"})] == [other]
+    assert _search(client, {"q": "weekly"}) == []
+
+    agenda = _search(client, {"q": "hiring"})
+    client.delete(f"/api/agenda/{agenda[0]['id']}")
+    assert _search(client, {"q": "hiring"}) == []
+
+    client.post(
+        f"/api/meetings/{q3}/actions:batch",
+        json={"items": [{"description": "Budget spreadsheet", "owner": "Bo", "deadline": _future_date()}]},
+    )
+    assert {r["type"] for r in _search(client, {"q": "budget"})} == {"meeting", "action_item"}
+
+
+def test_query_syntax_is_not_interpreted(client):
+    _seed(client)
+    for query in ('"migration', "migration:", "(migration", "-migration*", "^migration"):
+        assert {r["text"] for r in _search(client, {"q": query})} >= {"Draft migration runbook"}
+    assert _search(client, {"q": "!!!"}) == []
+
+
+def test_invalid_parameters_rejected(client):
+    assert client.get("/api/search").status_code == 400
+    assert client.get("/api/search?q=%20").status_code == 400
+    assert client.get("/api/search?q=x&type=minutes").status_code == 400
+
+
+def test_migration_indexes_existing_rows():
+    migration = importlib.import_module("migrations.versions.0006_full_text_search")
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE meetings (id INTEGER PRIMARY KEY, title TEXT)")
+        conn.exec_driver_sql(
+            "CREATE TABLE agenda_items (id INTEGER PRIMARY KEY, meeting_id INTEGER, topic TEXT)"
+        )
+        conn.exec_driver_sql(
+            "CREATE TABLE action_items (id INTEGER PRIMARY KEY, meeting_id INTEGER,"
+            " description TEXT)"
+        )
+        conn.exec_driver_sql(
+            "CREATE TABLE reviews (id INTEGER PRIMARY KEY, meeting_id INTEGER, summary TEXT)"
+        )
+        conn.exec_driver_sql("INSERT INTO meetings VALUES (1, 'Quarterly planning')")
+        migration.upgrade(conn)
+        conn.exec_driver_sql("INSERT INTO meetings VALUES (2, 'Planning poker')")
+        rows = conn.exec_driver_sql(
+            "SELECT rowid FROM meetings_fts WHERE meetings_fts MATCH 'planning' ORDER BY rowid"
+        ).all()
+    assert [r[0] for r in rows] == [1, 2]
@@ -0,0 +1,98 @@
+"""JSON providers and the row serializers behind large listings."""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from models import ActionItem, AgendaItem, Meeting, Review
+from services import meeting_service
+from services.json_provider import OrjsonProvider, StdlibJSONProvider, select_provider
+
+
+def _seed(db):
+    now = datetime.now(timezone.utc)
+    for i, status in enumerate(["Scheduled", "Closed", "Reviewed"]):
+        meeting = Meeting(
+            title=f"Meeting {i}",
+            scheduled_time=now + timedelta(hours=i),
+            duration_minutes=60,
+            status=status,
+        )
+        meeting.agenda_items = [
+            AgendaItem(topic="A", time_allocation=10),
+            AgendaItem(topic="B", time_allocation=20),
+        ]
+        meeting.action_items = [
+            ActionItem(
+                description="Late",
+                owner="Alice",
+                deadline=date.today() - timedelta(days=1),
+                status="Open",
+            ),
+            ActionItem(
+                description="Done",
+                owner="Bob",
+                deadline=date.today() - timedelta(days=1),
+                status="Completed",
+            ),
+        ]
+        if status == "Reviewed":
+            meeting.review = Review(summary="Good", outcome_rating=4, followup_required=False)
+        db.session.add(meeting)
+    db.session.commit()
+
+
+class TestRowSerializers:
+    @pytest.mark.parametrize(
+        "fields, expand",
+        [
+            (None, None),
+            (("id", "title", "scheduled_time"), ()),
+            (("id", "status"), ("review", "action_items")),
+        ],
+    )
+    def test_rows_match_to_dict(self, app, db, fields, expand):
+        _seed(db)
+        meetings, _ = meeting_service.get_meetings_page(expand=expand)
+        expected = [m.to_dict(fields=fields, expand=expand) for m in meetings]
+        rows, _ = meeting_service.get_meeting_dicts_page(fields=fields, expand=expand)
+        assert json.loads(app.json.dumps(rows)) == expected
+
+    def test_rows_page_with_cursor(self, client, db):
+        _seed(db)
+        first = json.loads(client.get("/api/meetings?limit=2&fields=title").data)
+        assert [m["title"] for m in first["meetings"]] == ["Meeting 2", "Meeting 1"]
+        rest = client.get(f"/api/meetings?limit=2&fields=title&cursor={first['next_cursor']}")
+        data = json.loads(rest.data)
+        assert [m["title"] for m in data["meetings"]] == ["Meeting 0"]
+        assert data["next_cursor"] is None
+
+
+class TestJSONProviders:
+    PAYLOAD = {
+        "at": datetime(2026, 1, 2, 3, 4, 5, 600, tzinfo=timezone.utc),
+        "naive": datetime(2026, 1, 2, 3, 4, 5),
+        "day": date(2026, 1, 2),
+        "text": "Café",
+        "nested": [{"b": 1, "a": None}],
+    }
+
+    def test_providers_agree(self, app):
+        fast = OrjsonProvider(app).dumps(self.PAYLOAD)
+        slow = StdlibJSONProvider(app).dumps(self.PAYLOAD)
+        assert json.loads(fast) == json.loads(slow)
+        assert json.loads(fast)["at"] == self.PAYLOAD["at"].isoformat()
+        assert json.loads(fast)["day"] == "2026-01-02"
+
+    def test_response_is_json(self, app):
+        with app.test_request_context():
+            res = OrjsonProvider(app).response(self.PAYLOAD)
+        assert res.mimetype == "application/json"
+        assert json.loads(res.data)["text"] == "Café"
+
+    def test_select_provider(self):
+        assert select_provider("orjson") is OrjsonProvider
+        assert select_provider("STDLIB") is StdlibJSONProvider
+        with pytest.raises(ValueError):
+            select_provider("ujson")
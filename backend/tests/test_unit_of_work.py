@@ -0,0 +1,148 @@
+"""Unit of work: composite operations commit once, side effects follow the commit."""
+
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from models import Job, Meeting, Review
+from services import action_item_service, meeting_service, review_service
+from services.unit_of_work import after_commit, unit_of_work
+
+
+@pytest.fixture
+def count_commits(db):
+    """Commits of data transactions.
+
+    The global change counter is bumped in its own transaction after the
+    data commits (``bump_global_version``); those are not counted.
+    """
+
+    @contextmanager
+    def _count():
+        commits = []
+
+        def _statement(conn, cursor, statement, *args):
+            conn.info.setdefault("statements", []).append(statement)
+
+        def _record(conn):
+            statements = conn.info.pop("statements", [])
+            if not statements or not all(
+                s.startswith("UPDATE change_counter") for s in statements
+            ):
+                commits.append(conn)
+
+        event.listen(db.engine, "before_cursor_execute", _statement)
+        event.listen(db.engine, "commit", _record)
+        try:
+            yield commits
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _statement)
+            event.remove(db.engine, "commit", _record)
+
+    return _count
+
+
+def _meeting_row():
+    return Meeting(
+        title="Ghost", scheduled_time=datetime.utcnow(), duration_minutes=30, status="Scheduled"
+    )
+
+
+def _closed_meeting():
+    meeting = meeting_service.create_meeting(
+        "Retro", (datetime.utcnow() + timedelta(hours=1)).isoformat(), 30
+    )
+    meeting_service.start_meeting(meeting.id)
+    action_item_service.create_action_item(
+        meeting.id, "Ship", "Alice", (date.today() + timedelta(days=3)).isoformat()
+    )
+    meeting_service.close_meeting(meeting.id)
+    return meeting.id
+
+
+class TestUnitOfWork:
+    def test_nested_units_commit_once(self, db, count_commits):
+        hooks = []
+        with count_commits() as commits:
+            with unit_of_work():
+                with unit_of_work() as session:
+                    session.add(_meeting_row())
+                    after_commit(hooks.append, "inner")
+                assert commits == [] and hooks == []
+                after_commit(hooks.append, "outer")
+        assert len(commits) == 1
+        assert hooks == ["inner", "outer"]
+
+    def test_rollback_discards_writes_and_hooks(self, db):
+        hooks = []
+        with pytest.raises(RuntimeError):
+            with unit_of_work() as session:
+                session.add(_meeting_row())
+                after_commit(hooks.append, "published")
+                raise RuntimeError("boom")
+        assert hooks == []
+        assert Meeting.query.count() == 0
+
+    def test_hook_outside_a_unit_runs_immediately(self, db):
+        hooks = []
+        after_commit(hooks.append, "now")
+        assert hooks == ["now"]
+
+
+    def test_global_version_moves_only_after_commit(self, db):
+        before = meeting_service.get_global_version()
+        with pytest.raises(RuntimeError):
+            with unit_of_work() as session:
+                session.add(_meeting_row())
+                meeting_service.bump_global_version()
+                raise RuntimeError("boom")
+        assert meeting_service.get_global_version() == before
+
+        with unit_of_work() as session:
+            session.add(_meeting_row())
+            meeting_service.bump_global_version()
+            assert meeting_service.get_global_version() == before
+        assert meeting_service.get_global_version() != before
+
+
+class TestSingleCommit:
+    def test_review_and_transition_commit_together(self, db, count_commits):
+        mid = _closed_meeting()
+        with count_commits() as commits:
+            review_service.create_review(mid, "Went well", 4, False)
+        assert len(commits) == 1
+        assert db.session.get(Meeting, mid).status == "Reviewed"
+
+    def test_failure_after_transition_rolls_it_back(self, db, monkeypatch):
+        mid = _closed_meeting()
+        version = db.session.get(Meeting, mid).version
+
+        def fail(*args):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(review_service, "meeting_changed", fail)
+        with pytest.raises(RuntimeError):
+            review_service.create_review(mid, "Went well", 4, False)
+        meeting = db.session.get(Meeting, mid)
+        assert (meeting.status, meeting.version) == ("Closed", version)
+        assert Review.query.count() == 0
+
+    def test_close_writes_its_jobs_in_the_same_transaction(self, db, count_commits):
+        meeting = meeting_service.create_meeting(
+            "Retro", (datetime.utcnow() + timedelta(hours=1)).isoformat(), 30
+        )
+        meeting_service.start_meeting(meeting.id)
+        action_item_service.create_action_item(
+            meeting.id, "Ship", "Alice", (date.today() + timedelta(days=3)).isoformat()
+        )
+        runner = meeting_service.jobs.runner
+        meeting_service.jobs.runner = "manual"
+        try:
+            with count_commits() as commits:
+                meeting_service.close_meeting(meeting.id)
+        finally:
+            meeting_service.jobs.runner = runner
+        assert len(commits) == 1
+        assert {job.kind for job in Job.query} == {"review_draft", "dashboard_precompute"}
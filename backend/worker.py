@@ -0,0 +1,52 @@
+"""Background job worker — run next to the web process.
+
+    python worker.py            # poll forever
+    python worker.py --once     # drain due jobs and exit (cron)
+
+Any number of workers can share one PostgreSQL queue (claims use
+``FOR UPDATE SKIP LOCKED``). See ``services/job_queue.py``.
+"""
+
+import argparse
+import logging
+import signal
+import threading
+
+from app import app
+from models import db
+from services.job_handlers import schedule_overdue_sweep
+from services.job_queue import jobs
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--once", action="store_true", help="exit when no job is due")
+    parser.add_argument("--poll", type=float, default=1.0, help="idle poll interval (s)")
+    parser.add_argument("--batch", type=int, default=10, help="jobs claimed per poll")
+    args = parser.parse_args()
+
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+
+    with app.app_context():
+        schedule_overdue_sweep()
+        logger.info("Worker started (poll=%ss, batch=%s).", args.poll, args.batch)
+        while not stop.is_set():
+            try:
+                ran = jobs.run_pending(args.batch)
+            except Exception:
+                logger.exception("Polling the job queue failed")
+                db.session.rollback()
+                ran = 0
+            if not ran:
+                if args.once:
+                    break
+                stop.wait(args.poll)
+        logger.info("Worker stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,9 +10,11 @@ import {
     createActionItem,
     completeActionItem,
     createReview,
-    suggestAgenda,
+    streamAgendaSuggestions,
     suggestActions,
-    summarizeReview,
+    streamReviewSummary,
+    subscribeToMeeting,
+    getReviewDraft,
 } from '../services/api';
 import {
     Play,
@@ -68,6 +70,23 @@ export default function MeetingDetail() {
 
     useEffect(() => { refresh(); }, [refresh]);
 
+    // Live updates: re-fetch (a cheap conditional GET) when the meeting changes
+    useEffect(() => subscribeToMeeting(id, () => refresh()), [id, refresh]);
+
+    // Prefill the review form with the draft generated when the meeting closed
+    useEffect(() => {
+        if (!showReviewForm) return;
+        getReviewDraft(id)
+            .then((res) => {
+                const draft = res.data.draft;
+                if (res.data.status !== 'done' || !draft?.summary) return;
+                setReviewForm((f) => (f.summary ? f : {
+                    ...f, summary: draft.summary, outcome_rating: draft.suggested_rating,
+                }));
+            })
+            .catch(() => {});
+    }, [id, showReviewForm]);
+
     // ─── State Transitions ──────────────────────────────
     const handleStart = async () => {
         try {
@@ -163,9 +182,13 @@ export default function MeetingDetail() {
 
     // ─── AI Suggestions ────────────────────────────────
     const handleSuggestAgenda = async () => {
+        setAiSuggestions((s) => ({ ...s, agenda: [] }));
         try {
-            const res = await suggestAgenda({ title: meeting.title });
-            setAiSuggestions((s) => ({ ...s, agenda: res.data.suggestions }));
+            await streamAgendaSuggestions({ title: meeting.title }, (event) => {
+                if (event.type === 'suggestion') {
+                    setAiSuggestions((s) => ({ ...s, agenda: [...s.agenda, event.suggestion] }));
+                }
+            });
         } catch { showToast('AI suggestion failed', 'error'); }
     };
 
@@ -178,10 +201,18 @@ export default function MeetingDetail() {
     };
 
     const handleSuggestReview = async () => {
+        let draft = '';
         try {
-            const res = await summarizeReview({ title: meeting.title, action_items: meeting.action_items || [] });
-            setAiSuggestions((s) => ({ ...s, review: res.data }));
-            setReviewForm((f) => ({ ...f, summary: res.data.summary, outcome_rating: res.data.suggested_rating }));
+            await streamReviewSummary({ title: meeting.title, action_items: meeting.action_items || [] }, (event) => {
+                if (event.type === 'fragment') {
+                    draft += event.text;
+                    setReviewForm((f) => ({ ...f, summary: draft }));
+                } else if (event.type === 'summary') {
+                    // The final summary is authoritative and replaces the draft
+                    setAiSuggestions((s) => ({ ...s, review: event }));
+                    setReviewForm((f) => ({ ...f, summary: event.summary, outcome_rating: event.suggested_rating }));
+                }
+            });
         } catch { showToast('AI suggestion failed', 'error'); }
     };
 
@@ -200,7 +231,7 @@ export default function MeetingDetail() {
     if (!meeting) return null;
 
     const status = meeting.status;
-    const totalAgendaTime = meeting.agenda_items?.reduce((sum, a) => sum + a.time_allocation, 0) || 0;
+    const totalAgendaTime = meeting.allocated_minutes ?? 0;
 
     return (
         <div>
@@ -1,25 +1,61 @@
 import { useState, useEffect } from 'react';
-import { getMeetings } from '../services/api';
+import { getMeetings, search } from '../services/api';
 import { Link } from 'react-router-dom';
-import { CalendarDays, Clock, ClipboardList, Inbox, ChevronRight, Plus } from 'lucide-react';
+import { CalendarDays, Clock, ClipboardList, Inbox, ChevronRight, Plus, Search } from 'lucide-react';
+
+const RESULT_LABELS = {
+    meeting: 'Meeting',
+    agenda_item: 'Agenda',
+    action_item: 'Action item',
+    review: 'Review',
+};
 
 export default function MeetingsList() {
     const [meetings, setMeetings] = useState([]);
     const [filter, setFilter] = useState('');
+    const [nextCursor, setNextCursor] = useState(null);
     const [loading, setLoading] = useState(true);
+    const [query, setQuery] = useState('');
+    const [results, setResults] = useState(null);
 
     const fetchMeetings = () => {
         setLoading(true);
         getMeetings(filter || undefined)
-            .then((res) => setMeetings(res.data))
+            .then((res) => {
+                setMeetings(res.data.meetings);
+                setNextCursor(res.data.next_cursor);
+            })
             .catch(console.error)
             .finally(() => setLoading(false));
     };
 
+    const loadMore = () => {
+        getMeetings(filter || undefined, nextCursor)
+            .then((res) => {
+                setMeetings((prev) => [...prev, ...res.data.meetings]);
+                setNextCursor(res.data.next_cursor);
+            })
+            .catch(console.error);
+    };
+
     useEffect(() => {
         fetchMeetings();
     }, [filter]);
 
+    // Debounced search; an empty box goes back to the list
+    useEffect(() => {
+        if (!query.trim()) {
+            setResults(null);
+            return undefined;
+        }
+        const timer = setTimeout(() => {
+            search(query)
+                .then((res) => setResults(res.data.results))
+                .catch(console.error);
+        }, 250);
+        return () => clearTimeout(timer);
+    }, [query]);
+
     const filters = [
         { label: 'All', value: '' },
         { label: 'Scheduled', value: 'Scheduled' },
@@ -53,8 +89,43 @@ export default function MeetingsList() {
                 </Link>
             </div>
 
+            <div style={{ position: 'relative', marginBottom: '24px' }}>
+                <Search size={16} style={{ position: 'absolute', left: 12, top: '50%', transform: 'translateY(-50%)', color: 'var(--text-muted)' }} />
+                <input
+                    className="form-input"
+                    style={{ paddingLeft: 36 }}
+                    placeholder="Search meetings, agenda topics, action items and reviews"
+                    value={query}
+                    onChange={(e) => setQuery(e.target.value)}
+                />
+            </div>
+
             {/* List */}
-            {loading ? (
+            {results ? (
+                results.length > 0 ? (
+                    <div className="meeting-list">
+                        {results.map((r) => (
+                            <Link key={`${r.type}-${r.id}`} to={`/meetings/${r.meeting_id}`} className="meeting-row">
+                                <div className="meeting-row-info">
+                                    <h3>{r.text}</h3>
+                                    <div className="meta">
+                                        <span>{RESULT_LABELS[r.type]}</span>
+                                        {r.type !== 'meeting' && <span>{r.meeting_title}</span>}
+                                    </div>
+                                </div>
+                                <div className="meeting-row-actions">
+                                    <ChevronRight size={18} style={{ color: 'var(--text-muted)' }} />
+                                </div>
+                            </Link>
+                        ))}
+                    </div>
+                ) : (
+                    <div className="empty-state">
+                        <div className="icon"><Inbox size={48} strokeWidth={1} /></div>
+                        <p>No matches</p>
+                    </div>
+                )
+            ) : loading ? (
                 <div className="loading"><div className="spinner" /></div>
             ) : meetings.length > 0 ? (
                 <div className="meeting-list">
@@ -76,6 +147,11 @@ export default function MeetingsList() {
                             </div>
                         </Link>
                     ))}
+                    {nextCursor && (
+                        <button className="btn btn-secondary" onClick={loadMore}>
+                            Load more
+                        </button>
+                    )}
                 </div>
             ) : (
                 <div className="empty-state">
@@ -8,11 +8,29 @@ const API = axios.create({
 
 // ─── Meetings ────────────────────────────────────────
 export const createMeeting = (data) => API.post('/meetings', data);
-export const getMeetings = (status) =>
-    API.get('/meetings', { params: status ? { status } : {} });
+export const getMeetings = (status, cursor) =>
+    API.get('/meetings', {
+        params: { ...(status ? { status } : {}), ...(cursor ? { cursor } : {}) },
+    });
 export const getMeeting = (id) => API.get(`/meetings/${id}`);
+// Meetings starting in [from, to) and overlapping pairs within that window
+export const getCalendar = (from, to, cursor) =>
+    API.get('/meetings', { params: { from, to, ...(cursor ? { cursor } : {}) } });
+export const getConflicts = (from, to) => API.get('/meetings/conflicts', { params: { from, to } });
 export const startMeeting = (id) => API.patch(`/meetings/${id}/start`);
 export const closeMeeting = (id) => API.patch(`/meetings/${id}/close`);
+// Server-Sent Events stream of changes to one meeting
+export const subscribeToMeeting = (id, onEvent) => {
+    const source = new EventSource(`${API.defaults.baseURL}/meetings/${id}/events`);
+    source.onmessage = onEvent;
+    ['meeting.started', 'meeting.closed', 'meeting.reviewed', 'agenda.added',
+        'agenda.updated', 'agenda.deleted', 'action.created', 'action.completed', 'action.overdue',
+        'review.created', 'resync'].forEach((type) => source.addEventListener(type, onEvent));
+    return () => source.close();
+};
+
+// Ranked full-text search across meetings, agenda, action items and reviews
+export const search = (q) => API.get('/search', { params: { q } });
 
 // ─── Agenda ──────────────────────────────────────────
 export const addAgendaItem = (meetingId, data) =>
@@ -30,6 +48,8 @@ export const getActionItems = (meetingId) =>
 // ─── Reviews ─────────────────────────────────────────
 export const createReview = (meetingId, data) =>
     API.post(`/meetings/${meetingId}/review`, data);
+// Summary drafted in the background when the meeting was closed
+export const getReviewDraft = (meetingId) => API.get(`/meetings/${meetingId}/review-draft`);
 
 // ─── Dashboard ───────────────────────────────────────
 export const getDashboard = () => API.get('/dashboard');
@@ -38,5 +58,29 @@ export const getDashboard = () => API.get('/dashboard');
 export const suggestAgenda = (data) => API.post('/ai/suggest-agenda', data);
 export const suggestActions = (data) => API.post('/ai/suggest-actions', data);
 export const summarizeReview = (data) => API.post('/ai/summarize-review', data);
+// Streaming variants: call onEvent for each NDJSON event as it arrives
+const streamAI = async (path, data, onEvent) => {
+    const res = await fetch(`${API.defaults.baseURL}${path}:stream`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(data),
+    });
+    if (!res.ok) throw new Error(`AI stream failed (${res.status})`);
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffered = '';
+    for (;;) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffered += decoder.decode(value, { stream: true });
+        const lines = buffered.split('\n');
+        buffered = lines.pop();
+        lines.filter(Boolean).forEach((line) => onEvent(JSON.parse(line)));
+    }
+};
+export const streamAgendaSuggestions = (data, onEvent) =>
+    streamAI('/ai/suggest-agenda', data, onEvent);
+export const streamReviewSummary = (data, onEvent) =>
+    streamAI('/ai/summarize-review', data, onEvent);
 
 export default API;